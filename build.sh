@@ -1,4 +1,8 @@
 pip install -r requirements.txt
 
 python manage.py collectstatic --no-input
-python manage.py migrate
\ No newline at end of file
+python manage.py migrate
+python manage.py createcachetable
+
+# Sends the queued notification fan-outs and recommendation jobs
+python manage.py run_recommendation_worker &
\ No newline at end of file
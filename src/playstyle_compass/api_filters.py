@@ -1,20 +1,25 @@
 from django_filters import rest_framework as filters
 from .models import Game, Franchise, Character, Review, News, Deal
+from .helper_functions.game_attributes import attribute_filter
 
 
 class GameFilter(filters.FilterSet):
-    platforms = filters.CharFilter(field_name="platforms", lookup_expr="icontains")
-    themes = filters.CharFilter(field_name="themes", lookup_expr="icontains")
-    concepts = filters.CharFilter(field_name="concepts", lookup_expr="icontains")
-    genres = filters.CharFilter(field_name="genres", lookup_expr="icontains")
+    platforms = filters.CharFilter(method="filter_attribute")
+    themes = filters.CharFilter(method="filter_attribute")
+    concepts = filters.CharFilter(method="filter_attribute")
+    genres = filters.CharFilter(method="filter_attribute")
     release_date = filters.CharFilter(
         field_name="release_date", lookup_expr="icontains"
     )
-    developers = filters.CharFilter(field_name="developers", lookup_expr="icontains")
+    developers = filters.CharFilter(method="filter_attribute")
     is_casual = filters.BooleanFilter(field_name="is_casual")
     is_popular = filters.BooleanFilter(field_name="is_popular")
     average_score = filters.NumberFilter(field_name="average_score", lookup_expr="gte")
-    franchises = filters.CharFilter(field_name="franchises", lookup_expr="icontains")
+    franchises = filters.CharFilter(method="filter_attribute")
+
+    def filter_attribute(self, queryset, name, value):
+        """Match whole attribute values through the indexed join tables."""
+        return queryset.filter(attribute_filter(name, value, "iexact"))
 
     class Meta:
         model = Game
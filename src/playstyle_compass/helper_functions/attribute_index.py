@@ -0,0 +1,70 @@
+"""
+The 'attribute_index' module contains an in-process inverted index over the
+comma-separated attribute columns of the Game model."""
+
+from collections import defaultdict
+
+from playstyle_compass.models import Game
+from .catalog_cache import CatalogSnapshot
+
+INDEXED_FIELDS = ("genres", "themes", "platforms", "concepts")
+
+
+class GameAttributeIndex:
+    """Maps every attribute value in the catalog to the ids of the games having it."""
+
+    def __init__(self, rows):
+        """Build the postings from rows holding the game id and indexed fields."""
+        self.game_ids = set()
+        self.present = {field: set() for field in INDEXED_FIELDS}
+        self.postings = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        self._term_cache = {}
+
+        for row in rows:
+            game_id = row["id"]
+            self.game_ids.add(game_id)
+
+            for field in INDEXED_FIELDS:
+                value = row[field]
+                if value is None:
+                    continue
+
+                self.present[field].add(game_id)
+                for token in value.split(","):
+                    token = token.strip().lower()
+                    if token:
+                        self.postings[field][token].add(game_id)
+
+    @classmethod
+    def build(cls):
+        """Build the index from the current catalog."""
+        return cls(Game.objects.values("id", *INDEXED_FIELDS).iterator())
+
+    def games_matching(self, field, term):
+        """Return ids of games whose field contains the term, like 'icontains'."""
+        term = term.strip().lower()
+        if not term:
+            return self.present[field]
+
+        key = (field, term)
+        if key not in self._term_cache:
+            # The vocabulary is small, so resolving substrings against it keeps
+            # the previous matching behavior without scanning the games.
+            matched = set()
+            for token, game_ids in self.postings[field].items():
+                if term in token:
+                    matched |= game_ids
+            self._term_cache[key] = frozenset(matched)
+
+        return self._term_cache[key]
+
+    def games_matching_any(self, field, terms):
+        """Return ids of games whose field contains at least one of the terms."""
+        matched = set()
+        for term in terms:
+            matched |= self.games_matching(field, term)
+
+        return matched
+
+
+game_attribute_index = CatalogSnapshot(GameAttributeIndex.build, [Game])
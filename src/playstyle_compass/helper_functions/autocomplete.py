@@ -0,0 +1,145 @@
+"""
+The 'autocomplete' module contains the in-memory prefix indexes serving the
+autocomplete suggestions of games, franchises and characters."""
+
+import hashlib
+import heapq
+import re
+from bisect import bisect_left
+from functools import lru_cache
+
+from django.http import JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from playstyle_compass.models import Game, Franchise, Character
+from .catalog_cache import CatalogSnapshot
+
+SUGGESTIONS_LIMIT = 10
+
+# Popular games rank as if they had this many more reviews.
+POPULAR_WEIGHT = 50
+
+# Seconds between catalog version checks, and browser cache lifetime.
+REFRESH_INTERVAL = 30
+MAX_AGE = 300
+
+NON_ALPHANUMERIC = re.compile(r"[\W_]+")
+
+
+def normalize(name):
+    """Return the lowercase words of a name separated by single spaces."""
+    return NON_ALPHANUMERIC.sub(" ", name.casefold()).strip()
+
+
+class PrefixIndex:
+    """Sorted array of the name suffixes starting at every word, searched by
+    bisection to find the names having a word starting with a prefix."""
+
+    def __init__(self, rows, cache_size=4096):
+        """Index (name, weight) rows. Heavier names are suggested first, and
+        names listed more than once keep their highest weight."""
+        self.names = []
+        self.weights = []
+        positions = {}
+        suffixes = []
+
+        for name, weight in rows:
+            normalized = normalize(name or "")
+            if not normalized:
+                continue
+
+            if name in positions:
+                position = positions[name]
+                self.weights[position] = max(self.weights[position], weight)
+                continue
+
+            position = positions[name] = len(self.names)
+            self.names.append(name)
+            self.weights.append(weight)
+
+            start = 0
+            for word in normalized.split(" "):
+                suffixes.append((normalized[start:], position, start == 0))
+                start += len(word) + 1
+
+        suffixes.sort()
+        self.keys = [key for key, _, _ in suffixes]
+        self.postings = [(position, is_start) for _, position, is_start in suffixes]
+        self.suggest = lru_cache(maxsize=cache_size)(self._suggest)
+
+    def _suggest(self, prefix, limit=SUGGESTIONS_LIMIT):
+        """Return the best names having a word starting with the prefix. Names
+        starting with it come first, then heavier, then shorter names."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + "\U0010ffff", lo=start)
+
+        matches = {}
+        for position, is_start in self.postings[start:end]:
+            matches[position] = matches.get(position, False) or is_start
+
+        best = heapq.nsmallest(
+            limit,
+            matches.items(),
+            key=lambda match: (
+                not match[1],
+                -self.weights[match[0]],
+                len(self.names[match[0]]),
+                self.names[match[0]],
+            ),
+        )
+
+        return [self.names[position] for position, _ in best]
+
+
+def build_game_index():
+    """Index the game titles, weighted by their reviews and popularity."""
+    rows = Game.objects.values_list("title", "total_reviews", "is_popular")
+    return PrefixIndex(
+        (title, (total_reviews or 0) + (POPULAR_WEIGHT if is_popular else 0))
+        for title, total_reviews, is_popular in rows.iterator()
+    )
+
+
+def build_franchise_index():
+    """Index the franchise titles, weighted by their number of games."""
+    rows = Franchise.objects.values_list("title", "games_count")
+    return PrefixIndex(rows.iterator())
+
+
+def build_character_index():
+    """Index the character names."""
+    rows = Character.objects.values_list("name", flat=True)
+    return PrefixIndex((name, 0) for name in rows.iterator())
+
+
+# The prefix index and the name of the suggested field of every model.
+SUGGESTION_INDEXES = {
+    Game: (CatalogSnapshot(build_game_index, [Game], REFRESH_INTERVAL), "title"),
+    Franchise: (
+        CatalogSnapshot(build_franchise_index, [Franchise], REFRESH_INTERVAL),
+        "title",
+    ),
+    Character: (
+        CatalogSnapshot(build_character_index, [Character], REFRESH_INTERVAL),
+        "name",
+    ),
+}
+
+
+def autocomplete_response(request, model):
+    """Return the suggestions for the query of a request as JSON that browsers
+    may reuse, answering 'Not Modified' when their copy is still current."""
+    index, field = SUGGESTION_INDEXES[model]
+    names = index.get().suggest(request.GET.get("query", ""))
+
+    response = JsonResponse({"results": [{field: name} for name in names]})
+    # The ETag only identifies the content, it does not protect anything
+    digest = hashlib.md5(response.content, usedforsecurity=False).hexdigest()
+    response["ETag"] = f'"{digest}"'
+    patch_cache_control(response, public=True, max_age=MAX_AGE)
+
+    return get_conditional_response(request, etag=response["ETag"], response=response)
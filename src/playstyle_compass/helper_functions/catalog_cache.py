@@ -0,0 +1,136 @@
+"""
+The 'catalog_cache' module keeps process-wide snapshots of data derived from
+the catalog models and rebuilds them only when the catalog changes."""
+
+import threading
+import time
+import weakref
+
+from django.core.cache import cache
+from django.db.models import Max
+
+CATALOG_VERSION_KEY = "catalog_version:{label}"
+
+# Snapshots of this process, invalidated at once by local ORM writes.
+_snapshots = weakref.WeakSet()
+
+
+def _version_key(model):
+    """Return the cache key holding the version counter of a model."""
+    return CATALOG_VERSION_KEY.format(label=model._meta.label_lower)
+
+
+def bump_catalog_version(model):
+    """Mark every snapshot derived from the given model as stale."""
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+    for snapshot in list(_snapshots):
+        if model in snapshot.models:
+            snapshot.expire()
+
+
+def get_catalog_version(model):
+    """Return a token that changes whenever the rows of a model change.
+
+    ORM writes bump a counter through signals, while the highest primary key
+    also catches rows inserted by the raw SQL ingest scripts in utils/.
+    """
+    generation = cache.get(_version_key(model), 0)
+    latest_id = model.objects.aggregate(latest_id=Max("pk"))["latest_id"]
+
+    return generation, latest_id
+
+
+class CatalogSnapshot:
+    """Lazily built value shared by all requests served by the process."""
+
+    def __init__(self, builder, models, check_interval=0):
+        """Initialize the snapshot with its builder and the models it depends on.
+
+        With a check interval, the catalog version is only checked once per
+        interval in seconds, so writes made by other processes or by the raw
+        SQL ingest show up after at most that delay.
+        """
+        self.builder = builder
+        self.models = models
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        # The (version, value, checked at) of the current snapshot.
+        self._state = None
+        # The state dropped by the last local write, which apply() can update.
+        self._stale = None
+        _snapshots.add(self)
+
+    def version(self):
+        """Return the current version of the models the snapshot depends on."""
+        return tuple(get_catalog_version(model) for model in self.models)
+
+    def get(self):
+        """Return the snapshot, rebuilding it first if the catalog has changed."""
+        state = self._state
+        if (
+            state is not None
+            and self.check_interval
+            and time.monotonic() - state[2] < self.check_interval
+        ):
+            return state[1]
+
+        version = self.version()
+
+        with self._lock:
+            state = self._state
+            if state is None or version != state[0]:
+                state = (version, self.builder(), time.monotonic())
+                self._stale = None
+            else:
+                state = (version, state[1], time.monotonic())
+            self._state = state
+
+        return state[1]
+
+    def invalidate(self):
+        """Drop the snapshot so the next access rebuilds it."""
+        with self._lock:
+            self._state = None
+            self._stale = None
+
+    def expire(self):
+        """Mark the snapshot stale after a local write, keeping it for apply()."""
+        with self._lock:
+            if self._state is not None:
+                self._stale = self._state
+            self._state = None
+
+    def apply(self, change, instance):
+        """Update the snapshot for a local ORM write of an instance, instead of
+        rebuilding it on the next access.
+
+        The change receives the snapshot and returns the updated one. It is only
+        applied when the write is the single change the snapshot misses, so
+        writes of other processes or of the raw SQL ingest still rebuild it.
+        """
+        with self._lock:
+            state = self._state or self._stale
+            if state is None:
+                return
+
+            expected = []
+            for model, (generation, latest_id) in zip(self.models, state[0]):
+                if model is type(instance):
+                    generation += 1
+                    if latest_id is None or instance.pk > latest_id:
+                        # A created row must take the next id, so no row
+                        # inserted before it can go unnoticed
+                        if instance.pk != (latest_id or 0) + 1:
+                            return
+                        latest_id = instance.pk
+                expected.append((generation, latest_id))
+
+            version = self.version()
+            if version == tuple(expected):
+                self._state = (version, change(state[1]), time.monotonic())
+                self._stale = None
@@ -0,0 +1,69 @@
+"""
+The 'facets' module contains the cached facet counts used to build the filters
+of the game library without loading the catalog on every request."""
+
+from collections import defaultdict
+
+from playstyle_compass.models import Game
+from .catalog_cache import CatalogSnapshot
+
+FACET_FIELDS = ("genres", "concepts", "themes", "platforms", "franchises")
+
+
+class GameFacets:
+    """Maps the distinct values of the facet fields to the ids of the games
+    having them."""
+
+    def __init__(self, rows):
+        """Build the postings from rows holding the game id and facet fields."""
+        self.postings = {field: defaultdict(set) for field in FACET_FIELDS}
+
+        for row in rows:
+            for field in FACET_FIELDS:
+                if not row[field]:
+                    continue
+
+                for value in row[field].split(","):
+                    value = value.strip()
+                    if value:
+                        self.postings[field][value].add(row["id"])
+
+    @classmethod
+    def build(cls):
+        """Build the facets from the current catalog."""
+        return cls(Game.objects.values("id", *FACET_FIELDS).iterator())
+
+    def games_matching(self, field, value):
+        """Return ids of games having the value in a field."""
+        return self.postings[field].get(value, set())
+
+    def filtered_games(self, selected_filters):
+        """Return ids of the games having any selected value, as 'build_query'
+        does, or None when no filter is selected."""
+        matched = None
+        for field, terms in selected_filters.items():
+            for term in terms:
+                if term:
+                    matched = (matched or set()) | self.games_matching(field, term)
+
+        return matched
+
+    def counts(self, field, game_ids=None):
+        """Return the sorted (value, count) pairs of a field, counting only the
+        given games if any."""
+        postings = self.postings[field]
+        if game_ids is None:
+            return [(value, len(postings[value])) for value in sorted(postings)]
+
+        return [(value, len(postings[value] & game_ids)) for value in sorted(postings)]
+
+
+game_facets = CatalogSnapshot(GameFacets.build, [Game])
+
+
+def get_facet_counts(selected_filters):
+    """Return the facet counts of every field under the selected filters."""
+    facets = game_facets.get()
+    game_ids = facets.filtered_games(selected_filters)
+
+    return {field: facets.counts(field, game_ids) for field in FACET_FIELDS}
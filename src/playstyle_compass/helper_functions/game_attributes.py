@@ -0,0 +1,112 @@
+"""
+The 'game_attributes' module keeps the normalized attribute tables of games in
+sync with their comma separated columns and builds the filters using them."""
+
+from django.db import transaction
+from django.db.models import Q
+
+from playstyle_compass.models import (
+    Game,
+    Genre,
+    Theme,
+    Platform,
+    Concept,
+    Developer,
+    FranchiseName,
+)
+
+# The comma separated Game columns with their many-to-many field and model.
+ATTRIBUTE_FIELDS = {
+    "genres": ("genre_tags", Genre),
+    "themes": ("theme_tags", Theme),
+    "platforms": ("platform_tags", Platform),
+    "concepts": ("concept_tags", Concept),
+    "developers": ("developer_tags", Developer),
+    "franchises": ("franchise_tags", FranchiseName),
+}
+
+CHUNK_SIZE = 500
+
+
+def split_values(value):
+    """Return the distinct stripped values of a comma separated string, in order."""
+    if not value:
+        return []
+
+    return list(
+        dict.fromkeys(item.strip() for item in value.split(",") if item.strip())
+    )
+
+
+def attribute_ids(model, names):
+    """Return the ids of the attribute rows with the given names, creating the
+    missing ones."""
+    names = set(names)
+    if not names:
+        return {}
+
+    model.objects.bulk_create(
+        [model(name=name) for name in names], ignore_conflicts=True
+    )
+
+    return dict(model.objects.filter(name__in=names).values_list("name", "id"))
+
+
+def sync_game_attributes(games, fields=ATTRIBUTE_FIELDS):
+    """Replace the attribute links of the games with the values of their
+    comma separated columns."""
+    games = list(games)
+
+    for field in fields:
+        tag_field, model = ATTRIBUTE_FIELDS[field]
+        through = getattr(Game, tag_field).through
+        column = f"{model._meta.model_name}_id"
+
+        values = {game.id: split_values(getattr(game, field)) for game in games}
+        ids = attribute_ids(
+            model, (name for names in values.values() for name in names)
+        )
+
+        through.objects.filter(game_id__in=values).delete()
+        through.objects.bulk_create(
+            [
+                through(game_id=game_id, **{column: ids[name]})
+                for game_id, names in values.items()
+                for name in names
+            ]
+        )
+
+
+def rebuild_game_attributes(chunk_size=CHUNK_SIZE):
+    """Sync the attribute links of the whole catalog. Returns the number of games."""
+    games = Game.objects.order_by("pk").only("pk", *ATTRIBUTE_FIELDS)
+    total = 0
+
+    with transaction.atomic():
+        batch = []
+        for game in games.iterator(chunk_size=chunk_size):
+            batch.append(game)
+
+            if len(batch) == chunk_size:
+                sync_game_attributes(batch)
+                total += len(batch)
+                batch = []
+
+        sync_game_attributes(batch)
+        total += len(batch)
+
+    return total
+
+
+def attribute_filter(field, value, lookup="in"):
+    """Return a filter matching the games whose attribute names match the value.
+
+    The join table is queried in a subquery, so games having several matching
+    values are not duplicated.
+    """
+    tag_field, model = ATTRIBUTE_FIELDS[field]
+    links = getattr(Game, tag_field).through.objects.filter(
+        **{f"{model._meta.model_name}__name__{lookup}": value}
+    )
+
+    return Q(pk__in=links.values("game_id"))
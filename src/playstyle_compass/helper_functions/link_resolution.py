@@ -0,0 +1,113 @@
+"""
+The 'link_resolution' module resolves the comma separated names stored on
+games, franchises and characters to the objects they link to, so pages can
+render the links without querying the catalog."""
+
+from collections import defaultdict
+
+from django.db import transaction
+
+from playstyle_compass.models import Game, Franchise, Character
+
+# The linked fields of every model, with the model their names refer to.
+LINKED_FIELDS = {
+    Game: {"similar_games": Game, "dlcs": Game, "franchises": Franchise},
+    Franchise: {"games": Game},
+    Character: {
+        "friends": Character,
+        "enemies": Character,
+        "games": Game,
+        "first_game": Game,
+        "franchises": Franchise,
+    },
+}
+
+CHUNK_SIZE = 500
+
+
+def split_names(value):
+    """Return the stripped names of a comma separated string."""
+    if not value:
+        return []
+
+    return [name.strip() for name in value.split(",")]
+
+
+def build_link_targets(names=None):
+    """Return the link targets of every linked model by exact name, only for
+    the given names of each model when a mapping of names is passed.
+
+    Games link to the first game with a title, while franchises and characters
+    sharing a name all get a link, as 'get_object_id' does.
+    """
+    targets = {}
+
+    for model, name_field, target_field in (
+        (Game, "title", "guid"),
+        (Franchise, "title", "id"),
+        (Character, "name", "id"),
+    ):
+        model_targets = defaultdict(list)
+        rows = model.objects.order_by("pk").values_list(name_field, target_field)
+        if names is not None:
+            rows = rows.filter(**{f"{name_field}__in": names.get(model, ())})
+
+        for name, target in rows.iterator():
+            if model is Game and model_targets[name]:
+                continue
+            model_targets[name].append(target)
+
+        targets[model] = dict(model_targets)
+
+    return targets
+
+
+def resolve_links(obj, targets):
+    """Return the (name, targets) pairs of every linked field of an object."""
+    return {
+        field: [
+            [name, targets[target_model].get(name, [])]
+            for name in split_names(getattr(obj, field))
+        ]
+        for field, target_model in LINKED_FIELDS[type(obj)].items()
+    }
+
+
+def update_resolved_links(models=None, chunk_size=CHUNK_SIZE):
+    """Store the resolved links of every object of the given models, all the
+    linked models by default. Returns the number of updated objects."""
+    targets = build_link_targets()
+    total = 0
+
+    for model in models or LINKED_FIELDS:
+        fields = ["pk", *LINKED_FIELDS[model]]
+        objects = model.objects.order_by("pk").only(*fields)
+
+        with transaction.atomic():
+            batch = []
+            for obj in objects.iterator(chunk_size=chunk_size):
+                obj.resolved_links = resolve_links(obj, targets)
+                batch.append(obj)
+
+                if len(batch) == chunk_size:
+                    model.objects.bulk_update(batch, ["resolved_links"])
+                    total += len(batch)
+                    batch = []
+
+            model.objects.bulk_update(batch, ["resolved_links"])
+            total += len(batch)
+
+    return total
+
+
+def refresh_resolved_links(obj):
+    """Store the resolved links of a single object, looking up only the names
+    it links to."""
+    names = defaultdict(set)
+    for field, target_model in LINKED_FIELDS[type(obj)].items():
+        names[target_model].update(split_names(getattr(obj, field)))
+
+    obj.resolved_links = resolve_links(obj, build_link_targets(names))
+
+    # Updated without saving, so the catalog snapshots stay current
+    type(obj).objects.filter(pk=obj.pk).update(resolved_links=obj.resolved_links)
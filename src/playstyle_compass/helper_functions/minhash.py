@@ -0,0 +1,99 @@
+"""
+The 'minhash' module contains a MinHash locality-sensitive hashing index used
+to find candidate pairs of similar sets without comparing every pair."""
+
+from collections import defaultdict
+
+import numpy as np
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def optimal_bands(threshold, num_perm, false_negative_weight=0.8):
+    """Return the (bands, rows) split of the signatures that best separates
+    pairs below and above the Jaccard threshold.
+
+    Pairs sharing every value of one band become candidates, so the split
+    minimizes the weighted area of false positives under the threshold and
+    of false negatives above it. Candidates are verified exactly afterwards,
+    which is why missed pairs weigh more by default.
+    """
+    similarities = np.linspace(0.0, 1.0, 201)
+    below = similarities < threshold
+    best, best_error = (1, num_perm), None
+
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            probability = 1 - (1 - similarities**rows) ** bands
+            false_positives = (1 - false_negative_weight) * probability[below].sum()
+            false_negatives = false_negative_weight * (1 - probability[~below]).sum()
+            error = false_positives + false_negatives
+
+            if best_error is None or error < best_error:
+                best, best_error = (bands, rows), error
+
+    return best
+
+
+class MinHashLSH:
+    """Indexes sets of integer tokens and returns the keys of sets likely to
+    have at least the given Jaccard similarity with a query set."""
+
+    def __init__(self, threshold=0.6, num_perm=128, seed=1, false_negative_weight=0.8):
+        """Initialize the hash permutations and the empty band tables."""
+        self.threshold = threshold
+        self.bands, self.rows = optimal_bands(
+            threshold, num_perm, false_negative_weight
+        )
+
+        generator = np.random.default_rng(seed)
+        self.a = generator.integers(1, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self.b = generator.integers(0, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self.tables = [defaultdict(set) for _ in range(self.bands)]
+
+    @classmethod
+    def from_matrix(cls, matrix, **kwargs):
+        """Index every row of a sparse binary matrix under its row position."""
+        index = cls(**kwargs)
+        for position in range(matrix.shape[0]):
+            index.add(
+                position,
+                matrix.indices[matrix.indptr[position] : matrix.indptr[position + 1]],
+            )
+
+        return index
+
+    def signature(self, tokens):
+        """Return the MinHash signature of a non-empty set of integer tokens."""
+        tokens = np.asarray(tokens, dtype=np.uint64)
+        # Overflow wraps around, which keeps the hashes uniformly distributed.
+        hashes = (np.outer(self.a, tokens) + self.b[:, None]) % MERSENNE_PRIME
+        return (hashes & MAX_HASH).min(axis=1)
+
+    def _band_keys(self, tokens):
+        """Return the key of every band of the signature of the tokens."""
+        signature = self.signature(tokens)
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, key, tokens):
+        """Index a set of tokens under the given key. Empty sets are skipped."""
+        if len(tokens) == 0:
+            return
+
+        for table, band_key in zip(self.tables, self._band_keys(tokens)):
+            table[band_key].add(key)
+
+    def candidates(self, tokens):
+        """Return the keys of the indexed sets likely similar to the tokens."""
+        if len(tokens) == 0:
+            return set()
+
+        keys = set()
+        for table, band_key in zip(self.tables, self._band_keys(tokens)):
+            keys |= table.get(band_key, set())
+
+        return keys
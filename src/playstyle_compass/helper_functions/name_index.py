@@ -0,0 +1,89 @@
+"""
+The 'name_index' module contains in-process indexes resolving the names of
+games, franchises and characters to the objects they most likely refer to."""
+
+import difflib
+from collections import Counter, defaultdict
+
+from playstyle_compass.models import Game, Franchise, Character
+from .catalog_cache import CatalogSnapshot
+
+# Fuzzy matches are only scored against the names sharing the most n-grams.
+MAX_CANDIDATES = 50
+
+# Seconds between catalog version checks, so rendering links does not query.
+REFRESH_INTERVAL = 30
+
+
+def name_ngrams(name):
+    """Return the character bigrams of a name, padded to include its edges."""
+    padded = f" {name} "
+    return {padded[index : index + 2] for index in range(len(padded) - 1)}
+
+
+class NameIndex:
+    """Resolves names through an exact lowercase lookup, falling back to
+    'difflib' scoring of the candidates found in an n-gram index."""
+
+    def __init__(self, rows, cutoff=0.7):
+        """Index (name, target) rows. The first target of a name is kept."""
+        self.cutoff = cutoff
+        self.targets = {}
+        self.postings = defaultdict(list)
+        self._matches = {}
+
+        for name, target in rows:
+            if not name:
+                continue
+
+            key = name.lower()
+            if key in self.targets:
+                continue
+
+            self.targets[key] = target
+            for ngram in name_ngrams(key):
+                self.postings[ngram].append(key)
+
+    def closest(self, name):
+        """Return the target of the indexed name closest to the given name, or
+        None if no name is similar enough."""
+        key = name.lower()
+        if key in self.targets:
+            return self.targets[key]
+
+        if key not in self._matches:
+            self._matches[key] = self._closest_fuzzy(key)
+
+        return self._matches[key]
+
+    def _closest_fuzzy(self, key):
+        """Score the names sharing the most n-grams with the key."""
+        shared = Counter()
+        for ngram in name_ngrams(key):
+            shared.update(self.postings.get(ngram, ()))
+
+        candidates = [name for name, _ in shared.most_common(MAX_CANDIDATES)]
+        matches = difflib.get_close_matches(key, candidates, n=1, cutoff=self.cutoff)
+
+        return self.targets[matches[0]] if matches else None
+
+
+def build_name_index(model, name_field, target_field):
+    """Return a builder indexing the names of a model by their target field."""
+
+    def builder():
+        rows = model.objects.order_by("pk").values_list(name_field, target_field)
+        return NameIndex(rows.iterator())
+
+    return builder
+
+
+game_names = CatalogSnapshot(
+    build_name_index(Game, "title", "guid"), [Game], REFRESH_INTERVAL
+)
+franchise_names = CatalogSnapshot(
+    build_name_index(Franchise, "title", "id"), [Franchise], REFRESH_INTERVAL
+)
+character_names = CatalogSnapshot(
+    build_name_index(Character, "name", "id"), [Character], REFRESH_INTERVAL
+)
@@ -0,0 +1,98 @@
+"""
+The 'poll_results' module computes the results of a page of polls with one
+grouped query, and caches the results of ended polls since they can no longer
+change."""
+
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from playstyle_compass.models import PollOption, Vote
+
+POLL_RESULTS_KEY = "poll_results:{poll_id}"
+
+
+def _results_key(poll_id):
+    """Return the cache key holding the results of a poll."""
+    return POLL_RESULTS_KEY.format(poll_id=poll_id)
+
+
+def invalidate_poll_results(poll_id):
+    """Drop the cached results of a poll."""
+    cache.delete(_results_key(poll_id))
+
+
+def count_votes(polls):
+    """Return the total votes and the options with percentages of each poll,
+    counting the votes of every option of the polls in a single query."""
+    options = (
+        PollOption.objects.filter(poll__in=[poll.id for poll in polls])
+        .annotate(vote_count=Count("votes"))
+        .order_by("poll_id", "id")
+    )
+
+    options_by_poll = defaultdict(list)
+    for option in options:
+        options_by_poll[option.poll_id].append(option)
+
+    return {
+        poll.id: {
+            "total_votes": sum(
+                option.vote_count for option in options_by_poll[poll.id]
+            ),
+            "options_with_percentages": poll.options_with_percentages(
+                options_by_poll[poll.id]
+            ),
+        }
+        for poll in polls
+    }
+
+
+def get_poll_results(polls):
+    """Return the results of each poll by id, from the cache for ended polls."""
+    ended = {poll.id for poll in polls if poll.has_ended()}
+
+    cached = cache.get_many([_results_key(poll_id) for poll_id in ended])
+    results = {
+        poll.id: cached[_results_key(poll.id)]
+        for poll in polls
+        if _results_key(poll.id) in cached
+    }
+
+    missing = [poll for poll in polls if poll.id not in results]
+    if missing:
+        counted = count_votes(missing)
+        results.update(counted)
+
+        # Ended polls no longer take votes, so their results are kept
+        cache.set_many(
+            {
+                _results_key(poll_id): poll_results
+                for poll_id, poll_results in counted.items()
+                if poll_id in ended
+            },
+            timeout=None,
+        )
+
+    return results
+
+
+def get_user_votes(user, polls):
+    """Return the id of the option the user voted for in each poll, by poll
+    id, with a single query."""
+    if not user.is_authenticated:
+        return {}
+
+    votes = Vote.objects.filter(user=user, poll__in=[poll.id for poll in polls])
+    return dict(votes.values_list("poll_id", "option_id"))
+
+
+def polls_with_results(polls, user):
+    """Return the polls with their results, as listed by the poll pages, and
+    the option the user voted for in each poll."""
+    polls = list(polls)
+    results = get_poll_results(polls)
+
+    polls_with_data = [{"poll": poll, **results[poll.id]} for poll in polls]
+    return polls_with_data, get_user_votes(user, polls)
@@ -0,0 +1,193 @@
+"""
+The 'recommendation_jobs' module contains the database backed queue used to
+precompute recommendations outside of the request cycle."""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from playstyle_compass.models import (
+    RecommendationJob,
+    UserPreferences,
+    UserRecommendations,
+)
+from .link_resolution import update_resolved_links
+from .recommendation_store import compute_recommendations, get_fresh_recommendations
+from .review_scores import recompute_scores
+from .similar_games import rebuild_similar_games
+from .user_similarity import update_similar_users
+
+# Seconds a job may run before it is considered abandoned by a stopped worker
+# and claimed again.
+JOB_TIMEOUT = 30 * 60
+
+# Number of times a job is run before it is left failed.
+MAX_ATTEMPTS = 3
+
+# Seconds the recommendations page waits for a queued job before reporting a
+# timeout, such as when no worker is running.
+STATUS_TIMEOUT = 10 * 60
+
+
+def enqueue_recommendation_job(user_id=None):
+    """Queue a recomputation for a user, or a catalog refresh without a user.
+
+    A job that is still pending will see the latest changes when it runs, so
+    no duplicate is queued for the same target.
+    """
+    while True:
+        job = RecommendationJob.objects.filter(
+            user_id=user_id, status="pending"
+        ).first()
+        if job is not None:
+            return job
+
+        try:
+            with transaction.atomic():
+                return RecommendationJob.objects.create(user_id=user_id)
+        except IntegrityError:
+            # A concurrent request queued the job first, look it up again
+            continue
+
+
+def request_recommendation_refresh(user_id):
+    """Queue a recomputation after a preference change if the worker is enabled."""
+    if settings.RECOMMENDATION_WORKER:
+        enqueue_recommendation_job(user_id)
+
+
+def claim_next_job():
+    """Mark the oldest pending job, or a running job abandoned by a stopped
+    worker, as running and return it, or None if idle.
+
+    The status is switched with a conditional update, so a job is never
+    processed by two workers at the same time.
+    """
+    while True:
+        abandoned = Q(
+            status="running",
+            started_at__lt=timezone.now() - timedelta(seconds=JOB_TIMEOUT),
+        )
+        job = RecommendationJob.objects.filter(Q(status="pending") | abandoned).first()
+        if job is None:
+            return None
+
+        claim = RecommendationJob.objects.filter(
+            pk=job.pk, status=job.status, started_at=job.started_at
+        )
+
+        if job.attempts >= MAX_ATTEMPTS:
+            # The worker stopped during the last attempt
+            claim.update(
+                status="failed", error="Timed out.", finished_at=timezone.now()
+            )
+            continue
+
+        started_at = timezone.now()
+        claimed = claim.update(
+            status="running", started_at=started_at, attempts=F("attempts") + 1
+        )
+
+        if claimed:
+            job.status = "running"
+            job.started_at = started_at
+            job.attempts += 1
+            return job
+
+
+def _refresh_user(user_id):
+    """Recompute the similar users of a user, and their recommendations unless
+    they are still fresh."""
+    user_preferences = UserPreferences.objects.filter(user_id=user_id).first()
+    if user_preferences is None:
+        return
+
+    update_similar_users(user_preferences)
+
+    # Recommendations are only shown once both of these are filled in.
+    if (
+        not user_preferences.gaming_history
+        or not user_preferences.favorite_genres
+    ):
+        return
+
+    if get_fresh_recommendations(user_preferences) is None:
+        compute_recommendations(user_preferences)
+
+
+def _refresh_catalog():
+    """Rebuild the similar games, resolved links and review counters, which the
+    raw SQL ingest does not update, and queue a job for every user whose stored
+    recommendations may be stale."""
+    rebuild_similar_games()
+    update_resolved_links()
+    recompute_scores()
+
+    for user_id in UserRecommendations.objects.values_list("user_id", flat=True):
+        enqueue_recommendation_job(user_id)
+
+
+def run_job(job):
+    """Process a claimed job and record its outcome. A failed job is queued
+    again until it has run MAX_ATTEMPTS times."""
+    try:
+        if job.user_id is None:
+            _refresh_catalog()
+        else:
+            _refresh_user(job.user_id)
+    except Exception as error:
+        job.status = "pending" if job.attempts < MAX_ATTEMPTS else "failed"
+        job.error = str(error)
+    else:
+        job.status = "done"
+
+    if job.status != "pending":
+        job.finished_at = timezone.now()
+
+    # The outcome is only recorded while the worker still holds the claim,
+    # not once the job was given up as abandoned and claimed again
+    claim = RecommendationJob.objects.filter(
+        pk=job.pk, status="running", started_at=job.started_at
+    )
+    try:
+        with transaction.atomic():
+            claim.update(
+                status=job.status, error=job.error, finished_at=job.finished_at
+            )
+    except IntegrityError:
+        # Another job of the same target was queued meanwhile, and retries it
+        job.status, job.finished_at = "failed", timezone.now()
+        claim.update(status=job.status, error=job.error, finished_at=job.finished_at)
+
+    return job
+
+
+def get_recommendation_status(user_preferences):
+    """Return the state of the recommendations of a user.
+
+    Stale results without a queued job get one, and a job still queued after
+    STATUS_TIMEOUT is reported as 'timeout', so polling always converges to
+    'ready', 'failed' or 'timeout'.
+    """
+    if get_fresh_recommendations(user_preferences) is not None:
+        return "ready"
+
+    job = (
+        RecommendationJob.objects.filter(user_id=user_preferences.user_id)
+        .order_by("-created_at", "-id")
+        .first()
+    )
+
+    if job is not None and job.status in ("pending", "running"):
+        if timezone.now() - job.created_at > timedelta(seconds=STATUS_TIMEOUT):
+            return "timeout"
+        return job.status
+
+    if job is not None and job.status == "failed":
+        return job.status
+
+    enqueue_recommendation_job(user_preferences.user_id)
+    return "pending"
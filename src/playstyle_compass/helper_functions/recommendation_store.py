@@ -0,0 +1,151 @@
+"""
+The 'recommendation_store' module persists the results of the recommendation
+engine per user and serves sorted and paginated pages from the stored ids."""
+
+import hashlib
+from datetime import date
+
+from django.db.models import Max
+from django.db.models.functions import Lower
+from django.db.models.query import QuerySet
+
+from playstyle_compass.models import Game, UserRecommendations
+from .views_helpers import RecommendationEngine, paginate_matching_games
+
+RECOMMENDATION_CATEGORIES = (
+    "gaming_history",
+    "favorite_genres",
+    "themes",
+    "preferred_platforms",
+    "common_genres_platforms",
+    "game_styles",
+    "connection_types",
+    "playstyle_games",
+)
+
+PREFERENCE_FIELDS = (
+    "gaming_history",
+    "favorite_genres",
+    "themes",
+    "platforms",
+    "connection_types",
+    "game_styles",
+)
+
+SORT_ORDERINGS = {
+    "release_date_asc": "release_date",
+    "release_date_desc": "-release_date",
+    "title_asc": Lower("title").asc(),
+    "title_desc": Lower("title").desc(),
+    "score_asc": "average_score",
+    "score_desc": "-average_score",
+}
+
+
+def preferences_fingerprint(user_preferences):
+    """Return a hash of the preferences the recommendations are based on."""
+    values = "\x1f".join(
+        getattr(user_preferences, field) or "" for field in PREFERENCE_FIELDS
+    )
+    return hashlib.sha256(values.encode()).hexdigest()
+
+
+def catalog_fingerprint():
+    """Return a token that changes when new games are ingested or the day changes.
+
+    The day is part of the token because games stop being upcoming over time.
+    """
+    latest_id = Game.objects.aggregate(latest_id=Max("id"))["latest_id"]
+    return f"{latest_id}:{date.today().isoformat()}"
+
+
+def _game_ids(games):
+    """Return the ids of a list or queryset of games, keeping their order."""
+    if isinstance(games, QuerySet):
+        return list(games.values_list("id", flat=True))
+    return [game.id for game in games]
+
+
+def compute_recommendations(user_preferences):
+    """Run the recommendation engine and store the ranked game ids."""
+    current_catalog = catalog_fingerprint()
+
+    recommendation_engine = RecommendationEngine(None, user_preferences)
+    recommendation_engine.process()
+    matching_games = recommendation_engine.matching_games
+
+    recommendations, created = UserRecommendations.objects.update_or_create(
+        user_id=user_preferences.user_id,
+        defaults={
+            "preferences_fingerprint": preferences_fingerprint(user_preferences),
+            "catalog_fingerprint": current_catalog,
+            "games": {
+                category: _game_ids(matching_games.get(category, []))
+                for category in RECOMMENDATION_CATEGORIES
+            },
+        },
+    )
+
+    return recommendations
+
+
+def is_fresh(recommendations, user_preferences):
+    """Check if stored recommendations still match the preferences and catalog."""
+    return (
+        recommendations.preferences_fingerprint
+        == preferences_fingerprint(user_preferences)
+        and recommendations.catalog_fingerprint == catalog_fingerprint()
+    )
+
+
+def get_fresh_recommendations(user_preferences):
+    """Return the stored recommendations of a user, or None if missing or stale."""
+    recommendations = UserRecommendations.objects.filter(
+        user_id=user_preferences.user_id
+    ).first()
+
+    if recommendations is None or not is_fresh(recommendations, user_preferences):
+        return None
+
+    return recommendations
+
+
+def get_user_recommendations(user_preferences):
+    """Return the stored recommendations of a user, recomputing them if stale."""
+    recommendations = get_fresh_recommendations(user_preferences)
+
+    if recommendations is None:
+        recommendations = compute_recommendations(user_preferences)
+
+    return recommendations
+
+
+def paginate_recommendations(request, recommendations):
+    """Paginate the stored recommendations of every category.
+
+    Sorted pages are read with an ordered query over the stored ids, while the
+    recommended order only loads the games shown on the current page.
+    """
+    sort_ordering = SORT_ORDERINGS.get(request.GET.get("sort", "recommended"))
+
+    category_games = {}
+    for category in RECOMMENDATION_CATEGORIES:
+        game_ids = recommendations.games.get(category, [])
+
+        if sort_ordering is None:
+            category_games[category] = game_ids
+        else:
+            category_games[category] = Game.objects.filter(id__in=game_ids).order_by(
+                sort_ordering
+            )
+
+    paginated_games = paginate_matching_games(request, category_games)
+
+    if sort_ordering is None:
+        for page in paginated_games.values():
+            games = Game.objects.in_bulk(page.object_list)
+            page.object_list = [
+                games[game_id] for game_id in page.object_list if game_id in games
+            ]
+
+    return paginated_games
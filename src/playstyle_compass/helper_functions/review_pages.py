@@ -0,0 +1,128 @@
+"""
+The 'review_pages' module serves the reviews of a game as cursor paginated,
+cached JSON pages."""
+
+from datetime import datetime, timezone as datetime_timezone
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.timezone import localtime
+
+from playstyle_compass.models import Review
+
+REVIEWS_PER_PAGE = 10
+CACHE_TIMEOUT = 60 * 60
+
+REVIEW_PAGES_VERSION_KEY = "review_pages_version:{game_id}"
+REVIEW_PAGE_KEY = "review_page:{game_id}:{version}:{timezone}:{position}"
+
+# The columns read to serialize a review.
+REVIEW_FIELDS = (
+    "id",
+    "reviewers",
+    "review_deck",
+    "review_description",
+    "score",
+    "likes",
+    "dislikes",
+    "date_added",
+    "user_id",
+)
+
+INVALID_USER_ID = "invalid_user"
+INACTIVE_USER = "inactive-user"
+
+
+def serialize_review(review):
+    """Return the JSON representation of a review, masking deactivated users."""
+    return {
+        "id": review.id,
+        "reviewer": (
+            INACTIVE_USER
+            if "deactivated-" in str(review.reviewers)
+            else review.reviewers
+        ),
+        "title": review.review_deck,
+        "description": review.review_description,
+        "score": review.score,
+        "likes": review.likes,
+        "dislikes": review.dislikes,
+        "date_added": localtime(review.date_added).strftime("%d/%m/%Y"),
+        "user_id": INVALID_USER_ID if "-" in str(review.user_id) else review.user_id,
+    }
+
+
+def encode_cursor(review):
+    """Return the cursor of the page starting after a review."""
+    return f"{review.date_added.isoformat()}_{review.id}"
+
+
+def decode_cursor(cursor):
+    """Return the (date added, id) of a cursor, or None if it is invalid. Dates
+    without an offset are read as UTC, like the stored ones."""
+    try:
+        date_added, review_id = cursor.rsplit("_", 1)
+        date_added, review_id = datetime.fromisoformat(date_added), int(review_id)
+    except (AttributeError, ValueError):
+        return None
+
+    if timezone.is_naive(date_added):
+        date_added = timezone.make_aware(date_added, datetime_timezone.utc)
+    return date_added, review_id
+
+
+def _version_key(game_id):
+    """Return the cache key holding the version of the pages of a game."""
+    return REVIEW_PAGES_VERSION_KEY.format(game_id=game_id)
+
+
+def invalidate_review_pages(game_id):
+    """Mark the cached review pages of a game as stale."""
+    key = _version_key(game_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def build_review_page(game_id, position=None, per_page=REVIEWS_PER_PAGE):
+    """Return the serialized reviews of a game after the (date added, id)
+    position, newest first, and the cursor of the next page or None."""
+    reviews = (
+        Review.objects.filter(game_id=game_id)
+        .only(*REVIEW_FIELDS)
+        .order_by("-date_added", "-id")
+    )
+
+    if position:
+        date_added, review_id = position
+        reviews = reviews.filter(
+            Q(date_added__lt=date_added) | Q(date_added=date_added, id__lt=review_id)
+        )
+
+    page = list(reviews[: per_page + 1])
+    next_cursor = encode_cursor(page[per_page - 1]) if len(page) > per_page else None
+
+    return [serialize_review(review) for review in page[:per_page]], next_cursor
+
+
+def get_review_page(game_id, cursor=None):
+    """Return the page of reviews of a game after the cursor, from the cache
+    when the reviews of the game did not change since it was built. Invalid
+    cursors return the first page."""
+    position = decode_cursor(cursor) if cursor else None
+
+    key = REVIEW_PAGE_KEY.format(
+        game_id=game_id,
+        version=cache.get(_version_key(game_id), 0),
+        timezone=timezone.get_current_timezone_name(),
+        position=f"{position[0].isoformat()}_{position[1]}" if position else "",
+    )
+
+    page = cache.get(key)
+    if page is None:
+        page = build_review_page(game_id, position)
+        cache.set(key, page, CACHE_TIMEOUT)
+
+    return page
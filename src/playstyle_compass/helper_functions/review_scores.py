@@ -0,0 +1,109 @@
+"""
+The 'review_scores' module keeps the review counters stored on games up to date
+with atomic updates, and recomputes them when they need repairing."""
+
+import threading
+from contextlib import contextmanager
+
+from django.db.models import (
+    Avg,
+    Case,
+    Count,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.lookups import GreaterThan
+
+from playstyle_compass.models import Game, Review
+
+_deferred = threading.local()
+
+
+def _deferred_games():
+    """Return the games whose score updates are deferred, or None."""
+    return getattr(_deferred, "games", None)
+
+
+def apply_score_change(game_guid, count_delta, score_delta):
+    """Add a change of the reviews of a game to its counters in one statement.
+
+    The running sum and count are updated from their stored values, so
+    concurrent reviews of a game do not lose updates.
+    """
+    deferred = _deferred_games()
+    if deferred is not None:
+        deferred.add(game_guid)
+        return
+
+    total_reviews = Coalesce(F("total_reviews"), 0) + count_delta
+    score_total = F("score_total") + score_delta
+
+    Game.objects.filter(guid=game_guid).update(
+        total_reviews=total_reviews,
+        score_total=score_total,
+        average_score=Case(
+            When(
+                GreaterThan(total_reviews, 0),
+                then=Cast(score_total, FloatField()) / total_reviews,
+            ),
+            default=Value(0.0),
+            output_field=FloatField(),
+        ),
+    )
+
+
+def refresh_game_score(game_guid):
+    """Recompute the counters of a game whose previous review is unknown."""
+    deferred = _deferred_games()
+    if deferred is not None:
+        deferred.add(game_guid)
+        return
+
+    recompute_scores([game_guid])
+
+
+def recompute_scores(game_guids=None):
+    """Recompute the counters of the given games, or of every game, from their
+    reviews in a single statement. Returns the number of games updated."""
+    reviews = Review.objects.filter(game=OuterRef("guid")).order_by().values("game")
+
+    def aggregate(function, default, output_field):
+        return Coalesce(
+            Subquery(reviews.annotate(value=function).values("value")),
+            default,
+            output_field=output_field,
+        )
+
+    games = Game.objects.all()
+    if game_guids is not None:
+        games = games.filter(guid__in=list(game_guids))
+
+    return games.update(
+        total_reviews=aggregate(Count("id"), 0, IntegerField()),
+        score_total=aggregate(Sum("score"), 0, IntegerField()),
+        average_score=aggregate(Avg("score"), 0.0, FloatField()),
+    )
+
+
+@contextmanager
+def deferred_score_updates():
+    """Defer the counter updates of the reviews written inside the block, then
+    recompute every touched game once. Nested blocks join the outermost one."""
+    if _deferred_games() is not None:
+        yield
+        return
+
+    _deferred.games = set()
+    try:
+        yield
+    finally:
+        games, _deferred.games = _deferred.games, None
+        if games:
+            recompute_scores(games)
@@ -0,0 +1,96 @@
+"""
+The 'search' module contains the backends used to search games, franchises and
+characters by name, ranked by relevance and backed by the database's indexes."""
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, IntegerField, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Length
+from django.utils.module_loading import import_string
+
+from playstyle_compass.models import Game, Franchise, Character
+
+# The searched field and full-text table of every searchable model.
+SEARCH_FIELDS = {
+    Game: ("title", "GamesSearch"),
+    Franchise: ("title", "FranchisesSearch"),
+    Character: ("name", "CharactersSearch"),
+}
+
+
+class SearchBackend:
+    """Matches names with 'icontains' and ranks names starting with the query,
+    then names having a word starting with it, then shorter names first."""
+
+    def matching(self, model, query):
+        """Return the objects of a model whose name contains the query."""
+        field, _ = SEARCH_FIELDS[model]
+        return model.objects.filter(**{f"{field}__icontains": query})
+
+    def rank(self, queryset, model, query):
+        """Order matching objects by relevance."""
+        field, _ = SEARCH_FIELDS[model]
+        return queryset.annotate(
+            search_rank=Case(
+                When(**{f"{field}__istartswith": query}, then=Value(0)),
+                When(**{f"{field}__icontains": f" {query}"}, then=Value(1)),
+                default=Value(2),
+                output_field=IntegerField(),
+            )
+        ).order_by("search_rank", Length(field), field)
+
+    def search(self, model, query):
+        """Return the objects of a model matching the query, most relevant first.
+        Every object matches an empty query."""
+        if not query:
+            return model.objects.all()
+
+        return self.rank(self.matching(model, query), model, query)
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """Finds candidates through the FTS5 trigram tables of the models. Queries
+    shorter than a trigram fall back to scanning the names."""
+
+    def matching(self, model, query):
+        field, table = SEARCH_FIELDS[model]
+        if len(query) < 3:
+            return super().matching(model, query)
+
+        phrase = '"{}"'.format(query.replace('"', '""'))
+        return model.objects.filter(
+            pk__in=RawSQL(
+                f'SELECT rowid FROM "{table}" WHERE "{table}" MATCH %s', [phrase]
+            )
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Matches names through their pg_trgm indexes and ranks them by trigram
+    similarity after the prefix matches."""
+
+    def rank(self, queryset, model, query):
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        field, _ = SEARCH_FIELDS[model]
+        queryset = super().rank(queryset, model, query)
+
+        return queryset.annotate(similarity=TrigramSimilarity(field, query)).order_by(
+            "search_rank", "-similarity", Length(field), field
+        )
+
+
+def get_search_backend():
+    """Return the search backend set in the settings, or the one matching the
+    database in use."""
+    backend = getattr(settings, "SEARCH_BACKEND", None)
+    if backend:
+        return import_string(backend)()
+
+    if connection.vendor == "postgresql":
+        return PostgresSearchBackend()
+    if connection.vendor == "sqlite":
+        return SQLiteSearchBackend()
+
+    return SearchBackend()
@@ -0,0 +1,244 @@
+"""
+The 'similar_games' module computes the games sharing the most attribute
+types with every game and stores them in the SimilarGame table."""
+
+import copy
+
+import numpy as np
+from scipy import sparse
+from django.db import transaction
+from django.db.models import Count, Min
+
+from playstyle_compass.models import Game, SimilarGame
+from .catalog_cache import CatalogSnapshot
+
+SIMILARITY_FIELDS = ("genres", "themes", "concepts", "platforms", "developers")
+
+# Neighbors sharing fewer attribute types are never shown, so they are not stored.
+MIN_STORED_MATCHES = 2
+MAX_NEIGHBORS = 100
+CHUNK_SIZE = 500
+
+
+def split_attribute(value):
+    """Split a comma-separated attribute into a set of stripped values."""
+    if not value:
+        return set()
+    return {token.strip() for token in value.split(",") if token.strip()}
+
+
+class GameSimilarityMatrix:
+    """Counts how many attribute types the games of the catalog share."""
+
+    def __init__(self, rows):
+        """Build one sparse game/value incidence matrix per attribute type."""
+        game_ids = []
+        vocabularies = {field: {} for field in SIMILARITY_FIELDS}
+        entries = {field: ([], []) for field in SIMILARITY_FIELDS}
+
+        for position, row in enumerate(rows):
+            game_ids.append(row["id"])
+
+            for field in SIMILARITY_FIELDS:
+                vocabulary = vocabularies[field]
+                positions, columns = entries[field]
+                for token in split_attribute(row[field]):
+                    positions.append(position)
+                    columns.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        self.game_ids = np.array(game_ids, dtype=np.int64)
+        self.positions = {game_id: index for index, game_id in enumerate(game_ids)}
+        self.vocabularies = vocabularies
+        self.matrices = []
+
+        for field in SIMILARITY_FIELDS:
+            positions, columns = entries[field]
+            self.matrices.append(
+                sparse.csr_matrix(
+                    (np.ones(len(positions), dtype=np.int32), (positions, columns)),
+                    shape=(len(game_ids), len(vocabularies[field])),
+                )
+            )
+
+    @classmethod
+    def build(cls):
+        """Build the matrix from the current catalog, in the catalog's ordering."""
+        return cls(Game.objects.values("id", *SIMILARITY_FIELDS).iterator())
+
+    def with_row(self, row):
+        """Return a copy of the matrix with the attributes of one game replaced,
+        or appended if the game is new, leaving the other rows as they are."""
+        matrix = copy.copy(self)
+        position = self.positions.get(row["id"])
+
+        if position is None:
+            position = len(self.game_ids)
+            matrix.game_ids = np.append(self.game_ids, row["id"])
+            matrix.positions = {**self.positions, row["id"]: position}
+
+        matrix.vocabularies = {}
+        matrix.matrices = []
+
+        for field, current in zip(SIMILARITY_FIELDS, self.matrices):
+            vocabulary = dict(self.vocabularies[field])
+            columns = sorted(
+                {
+                    vocabulary.setdefault(token, len(vocabulary))
+                    for token in split_attribute(row[field])
+                }
+            )
+            game_row = sparse.csr_matrix(
+                (np.ones(len(columns), dtype=np.int32), ([0] * len(columns), columns)),
+                shape=(1, len(vocabulary)),
+            )
+
+            current = current.copy()
+            current.resize(current.shape[0], len(vocabulary))
+
+            matrix.vocabularies[field] = vocabulary
+            matrix.matrices.append(
+                sparse.vstack(
+                    [current[:position], game_row, current[position + 1 :]],
+                    format="csr",
+                )
+            )
+
+        return matrix
+
+    def match_counts(self, positions):
+        """Return the number of attribute types shared between the games at the
+        given positions (rows) and every game of the catalog (columns)."""
+        counts = np.zeros((len(positions), len(self.game_ids)), dtype=np.int8)
+
+        for matrix in self.matrices:
+            shared = matrix[positions] @ matrix.T
+            counts[shared.nonzero()] += 1
+
+        return counts
+
+    def neighbors(self, positions, limit=MAX_NEIGHBORS, min_matches=MIN_STORED_MATCHES):
+        """Yield (game_id, [(neighbor_id, match_count), ...]) for the games at the
+        given positions, strongest first and in catalog order among equals."""
+        counts = self.match_counts(positions)
+
+        for row, position in zip(counts, positions):
+            row[position] = 0
+            candidates = np.flatnonzero(row >= min_matches)
+            candidates = candidates[np.argsort(-row[candidates], kind="stable")][:limit]
+
+            yield int(self.game_ids[position]), [
+                (int(self.game_ids[candidate]), int(row[candidate]))
+                for candidate in candidates
+            ]
+
+
+# Rebuilt when the catalog changes, except for the ORM saves of single games,
+# which only replace the row of the saved game.
+similarity_matrix = CatalogSnapshot(GameSimilarityMatrix.build, [Game])
+
+
+def rebuild_similar_games(chunk_size=CHUNK_SIZE):
+    """Recompute the neighbors of every game and return the number of links."""
+    matrix = GameSimilarityMatrix.build()
+    total = 0
+
+    with transaction.atomic():
+        SimilarGame.objects.all().delete()
+
+        for start in range(0, len(matrix.game_ids), chunk_size):
+            positions = list(
+                range(start, min(start + chunk_size, len(matrix.game_ids)))
+            )
+            links = [
+                SimilarGame(
+                    game_id=game_id, similar_game_id=neighbor_id, match_count=count
+                )
+                for game_id, neighbors in matrix.neighbors(positions)
+                for neighbor_id, count in neighbors
+            ]
+            SimilarGame.objects.bulk_create(links, batch_size=1000)
+            total += len(links)
+
+    return total
+
+
+def update_similar_games(game, limit=MAX_NEIGHBORS):
+    """Recompute the neighbors of a single game after it has been saved.
+
+    The game is also added to the neighbors of the games it matches when it
+    is stronger than their weakest stored neighbor. Lists shortened by deletes
+    are only refilled by a full rebuild.
+    """
+    similarity_matrix.apply(
+        lambda matrix: matrix.with_row(
+            {
+                "id": game.id,
+                **{field: getattr(game, field) for field in SIMILARITY_FIELDS},
+            }
+        ),
+        game,
+    )
+    matrix = similarity_matrix.get()
+    position = matrix.positions.get(game.id)
+
+    with transaction.atomic():
+        SimilarGame.objects.filter(game_id=game.id).delete()
+        SimilarGame.objects.filter(similar_game_id=game.id).delete()
+
+        if position is None:
+            return
+
+        game_id, matches = next(
+            matrix.neighbors([position], limit=len(matrix.game_ids))
+        )
+        SimilarGame.objects.bulk_create(
+            [
+                SimilarGame(
+                    game_id=game_id, similar_game_id=neighbor_id, match_count=count
+                )
+                for neighbor_id, count in matches[:limit]
+            ]
+        )
+        _add_reverse_links(game_id, dict(matches), limit)
+
+
+def _add_reverse_links(game_id, match_counts, limit):
+    """Add a game to the neighbor lists of other games, evicting their weakest
+    neighbor when a list is already full."""
+    list_stats = {
+        row["game_id"]: row
+        for row in SimilarGame.objects.filter(game_id__in=match_counts)
+        .values("game_id")
+        .annotate(size=Count("id"), weakest=Min("match_count"))
+    }
+
+    links, full_lists = [], []
+    for other_id, count in match_counts.items():
+        stats = list_stats.get(other_id)
+
+        if stats is None or stats["size"] < limit:
+            links.append(
+                SimilarGame(
+                    game_id=other_id, similar_game_id=game_id, match_count=count
+                )
+            )
+        elif count > stats["weakest"]:
+            links.append(
+                SimilarGame(
+                    game_id=other_id, similar_game_id=game_id, match_count=count
+                )
+            )
+            full_lists.append(other_id)
+
+    if full_lists:
+        # The evicted neighbor is the last one shown: the weakest, latest by title.
+        evicted = {}
+        weakest_links = SimilarGame.objects.filter(game_id__in=full_lists).order_by(
+            "game_id", "match_count", "-similar_game__title"
+        )
+        for link in weakest_links.values("id", "game_id"):
+            evicted.setdefault(link["game_id"], link["id"])
+
+        SimilarGame.objects.filter(id__in=evicted.values()).delete()
+
+    SimilarGame.objects.bulk_create(links, batch_size=1000)
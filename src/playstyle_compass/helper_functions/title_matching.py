@@ -0,0 +1,50 @@
+"""
+The 'title_matching' module contains a batched fuzzy matcher over the
+titles of the games in the catalog."""
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from playstyle_compass.models import Game
+from .catalog_cache import CatalogSnapshot
+
+
+class TitleMatcher:
+    """Matches many titles against the whole catalog in a single call."""
+
+    def __init__(self, rows):
+        """Store the game ids and lowercase titles from (id, title) rows."""
+        game_ids, titles = [], []
+        for game_id, title in rows:
+            game_ids.append(game_id)
+            titles.append(title.lower())
+
+        self.game_ids = np.array(game_ids, dtype=np.int64)
+        self.titles = titles
+
+    @classmethod
+    def build(cls):
+        """Build the matcher from the current catalog, in the catalog's ordering."""
+        return cls(Game.objects.values_list("id", "title").iterator())
+
+    def match(self, queries, threshold=65):
+        """Return, for each query, the ids of the games with a similar title.
+
+        Scores are rounded like 'fuzzywuzzy.fuzz.ratio' before being compared
+        to the threshold, so the matches are the same as the pairwise version.
+        """
+        if not queries or not self.titles:
+            return [[] for _ in queries]
+
+        scores = process.cdist(
+            [query.lower() for query in queries],
+            self.titles,
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+        )
+        matches = np.rint(scores) > threshold
+
+        return [self.game_ids[row].tolist() for row in matches]
+
+
+title_matcher = CatalogSnapshot(TitleMatcher.build, [Game])
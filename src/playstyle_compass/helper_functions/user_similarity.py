@@ -0,0 +1,241 @@
+"""
+The 'user_similarity' module finds users with similar preferences by
+comparing sparse binary preference vectors and stores the closest users."""
+
+import numpy as np
+from scipy import sparse
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from playstyle_compass.models import SimilarUser, UserPreferences
+from .minhash import MinHashLSH
+from .similar_games import split_attribute
+
+# The preferences averaged into the similarity of every kind of match.
+SIMILARITY_KINDS = {
+    "playstyle": ("gaming_history", "favorite_genres", "themes", "platforms"),
+    "gaming_history": ("gaming_history",),
+}
+COMPARED_PREFERENCES = SIMILARITY_KINDS["playstyle"]
+
+MAX_SIMILAR_USERS = 100
+CHUNK_SIZE = 500
+
+
+class UserSimilarityMatrix:
+    """Computes the average Jaccard similarity between users' preferences."""
+
+    def __init__(self, rows, threshold=None):
+        """Build one sparse user/value incidence matrix per preference. Users
+        are similar from the threshold on, USER_SIMILARITY_THRESHOLD by
+        default."""
+        if threshold is None:
+            threshold = settings.USER_SIMILARITY_THRESHOLD
+        self.threshold = threshold
+
+        user_ids = []
+        vocabularies = {field: {} for field in COMPARED_PREFERENCES}
+        entries = {field: ([], []) for field in COMPARED_PREFERENCES}
+
+        for position, row in enumerate(rows):
+            user_ids.append(row["user_id"])
+
+            for field in COMPARED_PREFERENCES:
+                vocabulary = vocabularies[field]
+                positions, columns = entries[field]
+                for token in split_attribute(row[field]):
+                    positions.append(position)
+                    columns.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        self.user_ids = np.array(user_ids, dtype=np.int64)
+        self.positions = {user_id: index for index, user_id in enumerate(user_ids)}
+        self.matrices = {}
+
+        for field in COMPARED_PREFERENCES:
+            positions, columns = entries[field]
+            self.matrices[field] = sparse.csr_matrix(
+                (np.ones(len(positions), dtype=np.int32), (positions, columns)),
+                shape=(len(user_ids), len(vocabularies[field])),
+            )
+
+    @classmethod
+    def build(cls, threshold=None):
+        """Build the matrix from the preferences of every user."""
+        return cls(
+            UserPreferences.objects.values("user_id", *COMPARED_PREFERENCES),
+            threshold,
+        )
+
+    def similarities(self, positions, kind, columns=None):
+        """Return the similarity of the users at the given positions (rows) with
+        every user, or the users at the given columns, averaged over the
+        preferences of the kind."""
+        fields = SIMILARITY_KINDS[kind]
+        positions = np.asarray(positions, dtype=np.int64)
+        if columns is None:
+            columns = np.arange(len(self.user_ids))
+
+        scores = np.zeros((len(positions), len(columns)), dtype=np.float64)
+
+        for field in fields:
+            matrix = self.matrices[field]
+            sizes = matrix.getnnz(axis=1)
+            shared = (matrix[positions] @ matrix[columns].T).tocoo()
+
+            union = sizes[positions[shared.row]] + sizes[columns[shared.col]]
+            scores[shared.row, shared.col] += shared.data / (union - shared.data)
+
+        return scores / len(fields)
+
+    def similar_users(self, positions, kind, limit=MAX_SIMILAR_USERS, columns=None):
+        """Yield (user_id, [(similar_user_id, similarity), ...]) for the users
+        at the given positions, most similar first.
+
+        When columns are given, only the users at those positions are compared.
+        """
+        if columns is None:
+            columns = np.arange(len(self.user_ids))
+        columns = np.asarray(columns, dtype=np.int64)
+        scores = self.similarities(positions, kind, columns)
+
+        for row, position in zip(scores, positions):
+            row[columns == position] = 0
+            candidates = np.flatnonzero(row >= self.threshold)
+            candidates = candidates[np.argsort(-row[candidates], kind="stable")][:limit]
+
+            yield int(self.user_ids[position]), [
+                (int(self.user_ids[columns[candidate]]), float(row[candidate]))
+                for candidate in candidates
+            ]
+
+    def build_lsh(self, num_perm=128):
+        """Return a MinHash LSH index over every compared preference."""
+        return {
+            field: MinHashLSH.from_matrix(
+                matrix, threshold=self.threshold, num_perm=num_perm
+            )
+            for field, matrix in self.matrices.items()
+        }
+
+    def candidate_columns(self, position, kind, indexes):
+        """Return the positions of the users likely similar to the user at the
+        given position, looked up in the LSH indexes of the kind's preferences.
+
+        An average above the threshold needs at least one preference above
+        it, so the candidates of the single preferences cover the average.
+        """
+        candidates = set()
+        for field in SIMILARITY_KINDS[kind]:
+            matrix = self.matrices[field]
+            tokens = matrix.indices[
+                matrix.indptr[position] : matrix.indptr[position + 1]
+            ]
+            candidates |= indexes[field].candidates(tokens)
+
+        return np.array(sorted(candidates), dtype=np.int64)
+
+
+def rebuild_similar_users(chunk_size=CHUNK_SIZE, use_lsh=False, threshold=None):
+    """Recompute the similar users of every user and return the number of links.
+
+    With 'use_lsh', every user is only compared with the candidates found in
+    MinHash LSH indexes instead of with every other user. The threshold
+    defaults to USER_SIMILARITY_THRESHOLD.
+    """
+    matrix = UserSimilarityMatrix.build(threshold)
+    indexes = matrix.build_lsh() if use_lsh else None
+    total = 0
+
+    def similar_users(positions, kind):
+        if indexes is None:
+            yield from matrix.similar_users(positions, kind)
+            return
+
+        for position in positions:
+            columns = matrix.candidate_columns(position, kind, indexes)
+            yield from matrix.similar_users([position], kind, columns=columns)
+
+    with transaction.atomic():
+        SimilarUser.objects.all().delete()
+
+        for start in range(0, len(matrix.user_ids), chunk_size):
+            positions = list(
+                range(start, min(start + chunk_size, len(matrix.user_ids)))
+            )
+
+            for kind in SIMILARITY_KINDS:
+                links = [
+                    SimilarUser(
+                        user_id=user_id,
+                        similar_user_id=similar_user_id,
+                        kind=kind,
+                        similarity=similarity,
+                    )
+                    for user_id, similar_users in similar_users(positions, kind)
+                    for similar_user_id, similarity in similar_users
+                ]
+                SimilarUser.objects.bulk_create(links, batch_size=1000)
+                total += len(links)
+
+    return total
+
+
+def update_similar_users(user_preferences):
+    """Recompute the similar users of a user after their preferences changed.
+
+    The user is also added to the lists of the users similar to them. Those
+    lists may grow past the limit until the next full rebuild, which does not
+    matter because reads are capped.
+    """
+    user_id = user_preferences.user_id
+
+    with transaction.atomic():
+        SimilarUser.objects.filter(user_id=user_id).delete()
+        SimilarUser.objects.filter(similar_user_id=user_id).delete()
+
+        # Empty preferences are not similar to anything.
+        if not any(getattr(user_preferences, field) for field in COMPARED_PREFERENCES):
+            return
+
+        matrix = UserSimilarityMatrix.build()
+        position = matrix.positions[user_id]
+        links = []
+
+        for kind in SIMILARITY_KINDS:
+            _, similar_users = next(
+                matrix.similar_users([position], kind, limit=len(matrix.user_ids))
+            )
+
+            for similar_user_id, similarity in similar_users[:MAX_SIMILAR_USERS]:
+                links.append(
+                    SimilarUser(
+                        user_id=user_id,
+                        similar_user_id=similar_user_id,
+                        kind=kind,
+                        similarity=similarity,
+                    )
+                )
+            for similar_user_id, similarity in similar_users:
+                links.append(
+                    SimilarUser(
+                        user_id=similar_user_id,
+                        similar_user_id=user_id,
+                        kind=kind,
+                        similarity=similarity,
+                    )
+                )
+
+        SimilarUser.objects.bulk_create(links, batch_size=1000)
+
+
+def get_similar_users(user, kind, limit=MAX_SIMILAR_USERS):
+    """Return the preferences of the users most similar to the given user."""
+    return (
+        UserPreferences.objects.filter(
+            user__similar_to__user=user, user__similar_to__kind=kind
+        )
+        .annotate(similarity=F("user__similar_to__similarity"))
+        .select_related("user__userprofile")
+        .order_by("-similarity", "user_id")[:limit]
+    )
@@ -5,14 +5,21 @@ other helper functions used for differend views."""
 import re
 from datetime import date, datetime
 from collections import defaultdict
-from operator import itemgetter
-from fuzzywuzzy import fuzz
 
 from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
-from django.db.models import Q, Count
+from django.db.models import Q, Count, F
 from django.shortcuts import get_object_or_404
-from playstyle_compass.models import UserPreferences, Game, Review, Franchise
+from playstyle_compass.models import (
+    UserPreferences,
+    Game,
+    Review,
+    ReviewReaction,
+    Franchise,
+)
 from users.models import FriendList
+from .attribute_index import game_attribute_index
+from .title_matching import title_matcher
+from .game_attributes import attribute_filter
 
 
 class RecommendationEngine:
@@ -24,16 +31,17 @@ class RecommendationEngine:
         self.user_preferences = user_preferences
         self.matching_games = self._initialize_matching_games()
         self.current_date = date.today()
-        self.games = Game.objects.all()
 
-    def _find_matching_title_games(self, history_game):
-        """Find games with titles similar to the given history game."""
-        history_game_lower = history_game.lower()
+    def _find_matching_title_games(self, gaming_history):
+        """Find games with titles similar to each of the history games."""
+        matched_ids = title_matcher.get().match(gaming_history)
+        games = Game.objects.in_bulk(
+            {game_id for game_ids in matched_ids for game_id in game_ids}
+        )
 
         return [
-            game
-            for game in self.games
-            if fuzz.ratio(history_game_lower, game.title.lower()) > 65
+            [games[game_id] for game_id in game_ids if game_id in games]
+            for game_ids in matched_ids
         ]
 
     def _find_matching_genre_games(self, matching_game):
@@ -71,8 +79,7 @@ class RecommendationEngine:
                 if release_date is not None and release_date >= self.current_date:
                     games_to_exclude.add(genre_game)
 
-        for history_game in gaming_history:
-            matching_title_games = self._find_matching_title_games(history_game)
+        for matching_title_games in self._find_matching_title_games(gaming_history):
             for matching_game in matching_title_games:
                 if matching_game not in unique_games:
                     process_game(matching_game)
@@ -85,47 +92,8 @@ class RecommendationEngine:
         ]
 
     def _apply_filters(self, genres, themes, platforms, game_styles, connection_types):
-        """Apply filters to matching games."""
-
-        def apply_filter(filter_conditions):
-            """Helper function to apply filter conditions and exclude upcoming games."""
-            return Game.objects.filter(filter_conditions).exclude(upcoming_filter)
-
-        def calculate_recommendation_score(game):
-            """Helper function to calculate recommendation score for a game."""
-
-            score = 0
-
-            if game.genres:
-                if any(genre in game.genres for genre in genres):
-                    score += WEIGHTS["genre"]
-
-            if game.themes:
-                if any(theme in game.themes for theme in themes):
-                    score += WEIGHTS["theme"]
-
-            if game.platforms:
-                if any(platform in game.platforms for platform in platforms):
-                    score += WEIGHTS["platform"]
-
-            if game.concepts:
-                if any(game_style in game.concepts for game_style in game_styles):
-                    score += WEIGHTS["game_style"]
-
-            if game.concepts:
-                if any(
-                    connection_type in game.concepts
-                    for connection_type in connection_types
-                ):
-                    score += WEIGHTS["connection_type"]
-
-            return score
-
-        genre_filters = Q()
-        theme_filters = Q()
-        platform_filters = Q()
-        game_style_filters = Q()
-        connection_type_filters = Q()
+        """Apply filters to matching games using the catalog attribute index."""
+        index = game_attribute_index.get()
 
         # Define weight for each category in the recommendation system
         WEIGHTS = {
@@ -136,59 +104,81 @@ class RecommendationEngine:
             "connection_type": 1,
         }
 
-        # Build Q objects for filtering
-        for genre in genres:
-            genre_filters |= Q(genres__icontains=genre)
-
-        for theme in themes:
-            theme_filters |= Q(themes__icontains=theme)
-
-        for platform in platforms:
-            platform_filters |= Q(platforms__icontains=platform)
+        upcoming_filter = Q(release_date__gte=self.current_date)
+        upcoming_ids = set(
+            Game.objects.filter(upcoming_filter).values_list("id", flat=True)
+        )
 
-        for game_style in game_styles:
-            game_style_filters |= Q(concepts__icontains=game_style)
+        def apply_filter(game_ids):
+            """Helper function to load the matched games and exclude upcoming ones."""
+            return Game.objects.filter(id__in=game_ids - upcoming_ids)
+
+        genre_ids = index.games_matching_any("genres", genres)
+        theme_ids = index.games_matching_any("themes", themes)
+        platform_ids = index.games_matching_any("platforms", platforms)
+        game_style_ids = index.games_matching_any("concepts", game_styles)
+        connection_type_ids = index.games_matching_any("concepts", connection_types)
+
+        other_connection_ids = index.games_matching_any(
+            "concepts",
+            [
+                connection_type
+                for connection_type in connection_types
+                if connection_type != "Online"
+            ],
+        )
+        online_ids = index.games_matching("concepts", "Online")
 
         if "Online" in connection_types:
-            connection_type_filters |= Q(concepts__icontains="Online")
+            connection_type_filter_ids = online_ids | other_connection_ids
         else:
-            connection_type_filters &= ~Q(concepts__icontains="Online")
-
-        for connection_type in connection_types:
-            if connection_type != "Online":
-                connection_type_filters |= Q(concepts__icontains=connection_type)
-
-        common_filters = genre_filters & platform_filters
-        upcoming_filter = Q(release_date__gte=self.current_date)
+            connection_type_filter_ids = (
+                index.game_ids - online_ids
+            ) | other_connection_ids
 
         self.matching_games.update(
             {
-                "favorite_genres": apply_filter(genre_filters),
-                "themes": apply_filter(theme_filters),
-                "common_genres_platforms": apply_filter(common_filters),
-                "preferred_platforms": apply_filter(platform_filters),
-                "game_styles": apply_filter(game_style_filters),
-                "connection_types": apply_filter(connection_type_filters),
+                "favorite_genres": apply_filter(genre_ids),
+                "themes": apply_filter(theme_ids),
+                "common_genres_platforms": apply_filter(genre_ids & platform_ids),
+                "preferred_platforms": apply_filter(platform_ids),
+                "game_styles": apply_filter(game_style_ids),
+                "connection_types": apply_filter(connection_type_filter_ids),
             }
         )
 
-        # Pre-filter games before applying the recommendation algorithm
-        pre_filtered_games = Game.objects.filter(
-            genre_filters | theme_filters | platform_filters
-        ).exclude(upcoming_filter)
+        weighted_ids = (
+            (genre_ids, WEIGHTS["genre"]),
+            (theme_ids, WEIGHTS["theme"]),
+            (platform_ids, WEIGHTS["platform"]),
+            (game_style_ids, WEIGHTS["game_style"]),
+            (connection_type_ids, WEIGHTS["connection_type"]),
+        )
 
-        game_scores = defaultdict(int)
+        # Pre-filter games before applying the recommendation algorithm
+        pre_filtered_ids = (genre_ids | theme_ids | platform_ids) - upcoming_ids
 
-        for game in pre_filtered_games:
-            # Calculate the recommendation score for each game
-            game_scores[game] = calculate_recommendation_score(game)
+        game_scores = {
+            game_id: sum(
+                weight for game_ids, weight in weighted_ids if game_id in game_ids
+            )
+            for game_id in pre_filtered_ids
+        }
 
-        playstyle_games = sorted(game_scores.items(), key=itemgetter(1), reverse=True)
+        # Only load the games that pass the score threshold
+        recommended_scores = {
+            game_id: score for game_id, score in game_scores.items() if score > 6
+        }
+        recommended_games = sorted(
+            Game.objects.in_bulk(list(recommended_scores)).values(),
+            key=lambda game: game.title,
+        )
+        recommended_games.sort(
+            key=lambda game: recommended_scores[game.id], reverse=True
+        )
 
         # Add the recommended games to the matching games with a score threshold
-        self.matching_games["playstyle_games"] = [
-            game for game, score in playstyle_games if score > 6
-        ]
+        self.matching_games["playstyle_games"] = recommended_games
 
     def _process_user_data(self):
         """Process user gaming history and apply filters."""
@@ -234,6 +224,9 @@ class RecommendationEngine:
 
     def _sort_matching_games(self):
         """Sort matching games based on a specified sorting option."""
+        if self.request is None:
+            return
+
         sort_option = self.request.GET.get("sort", "recommended")
         sorting_functions = {
             "release_date_asc": lambda game: game.release_date,
@@ -338,6 +331,25 @@ def paginate_objects(request, objects, objects_per_page=10):
     return paginated_objects
 
 
+def attach_viewer_reactions(reviews, user):
+    """Set the reaction of the user on each review as 'viewer_reaction', with
+    a single query for the whole page."""
+    reviews = list(reviews)
+    liked, disliked = ReviewReaction.reactions_of(
+        user, [review.id for review in reviews]
+    )
+
+    for review in reviews:
+        if review.id in liked:
+            review.viewer_reaction = ReviewReaction.LIKE
+        elif review.id in disliked:
+            review.viewer_reaction = ReviewReaction.DISLIKE
+        else:
+            review.viewer_reaction = None
+
+    return reviews
+
+
 def gather_game_attributes(games):
     """Gather unique game attributes for filtering."""
     genres, concepts, themes, platforms, franchises = set(), set(), set(), set(), set()
@@ -363,10 +375,9 @@ def build_query(selected_filters):
 
     for filter_type, selected_items in selected_filters.items():
         if selected_items and any(selected_items):
-            filter_query = Q()
-            for item in selected_items:
-                filter_query |= Q(**{f"{filter_type}__icontains": item})
-            query |= filter_query
+            query |= attribute_filter(
+                filter_type, [item for item in selected_items if item]
+            )
 
     return query
 
@@ -437,52 +448,17 @@ def sort_articles(articles, sort_by):
         return articles
 
 
-def safe_split(value):
-    return set(value.split(",")) if value else set()
-
-
 def get_similar_games(game, min_matching_attributes=3):
-    """Find games similar to the given game based on shared attributes."""
-
-    # Extract and clean the attributes of the main game, converting them into sets for easy comparison
-    attributes = {
-        "genres": safe_split(game.genres),
-        "themes": safe_split(game.themes),
-        "concepts": safe_split(game.concepts),
-        "platforms": safe_split(game.platforms),
-        "developers": safe_split(game.developers),
-    }
-
-    def count_matching_attributes(other_game):
-        """Count how many attributes of the other_game match with the main game's attributes."""
-        # Extract and clean the attributes of the other game
-        game_attributes = {
-            "genres": safe_split(other_game.genres),
-            "themes": safe_split(other_game.themes),
-            "concepts": safe_split(other_game.concepts),
-            "platforms": safe_split(other_game.platforms),
-            "developers": safe_split(other_game.developers),
-        }
-
-        match_count = 0
-
-        # Iterate over each attribute type and check for intersections
-        for attr, values in attributes.items():
-            if values & game_attributes[attr]:  # Check if there is any common attribute
-                match_count += 1
-
-        return match_count
-
-    # Query all games from the database excluding the main game itself
-    all_games = Game.objects.exclude(guid=game.guid)
-
-    # Filter games to find those with at least the specified number of matching attributes
-    matching_games = []
-    for g in all_games:
-        if count_matching_attributes(g) >= min_matching_attributes:
-            matching_games.append(g)
-
-    return matching_games
+    """Return the games sharing at least the given number of attribute types
+    with the game, from its stored neighbors and strongest first."""
+    return (
+        Game.objects.filter(
+            neighbor_of__game=game,
+            neighbor_of__match_count__gte=min_matching_attributes,
+        )
+        .annotate(match_count=F("neighbor_of__match_count"))
+        .order_by("-match_count", "title")
+    )
 
 
 def get_first_letter(title):
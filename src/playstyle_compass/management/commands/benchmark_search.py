@@ -0,0 +1,82 @@
+"""Command used to compare the search backend and the autocomplete indexes with
+the 'icontains' scans they replace."""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.paginator import Paginator
+
+from playstyle_compass.helper_functions.autocomplete import SUGGESTION_INDEXES
+from playstyle_compass.helper_functions.search import (
+    SEARCH_FIELDS,
+    get_search_backend,
+)
+
+# Results per page of the search views.
+PAGE_SIZE = 10
+
+
+def sample_queries(names, count, seed=1):
+    """Return substrings of random names, like the queries typed by users."""
+    generator = random.Random(seed)
+    queries = []
+
+    for name in generator.sample(names, min(count, len(names))):
+        length = generator.randint(3, max(3, min(len(name), 8)))
+        start = generator.randint(0, max(0, len(name) - length))
+        queries.append(name[start : start + length])
+
+    return queries
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the first page of the search views and the autocomplete "
+        "suggestions against 'icontains' scans of the names."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=200,
+            help="Number of sampled queries per model. Defaults to 200.",
+        )
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        self.stdout.write(f"Backend: {type(backend).__name__}")
+
+        for model, (field, _) in SEARCH_FIELDS.items():
+            names = list(model.objects.values_list(field, flat=True))
+            queries = sample_queries(names, options["queries"])
+            if not queries:
+                self.stdout.write(f"{model.__name__}: no objects to search")
+                continue
+
+            start = time.perf_counter()
+            for query in queries:
+                list(
+                    model.objects.filter(**{f"{field}__icontains": query}).values(field)
+                )
+            scan_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for query in queries:
+                page = Paginator(backend.search(model, query), PAGE_SIZE).page(1)
+                list(page.object_list)
+            search_time = time.perf_counter() - start
+
+            index = SUGGESTION_INDEXES[model][0].get()
+            start = time.perf_counter()
+            for query in queries:
+                index.suggest(query)
+            suggest_time = time.perf_counter() - start
+
+            self.stdout.write(
+                f"{model.__name__}: {len(queries)} queries, "
+                f"icontains scan {scan_time * 1000 / len(queries):.2f}ms, "
+                f"search page {search_time * 1000 / len(queries):.2f}ms, "
+                f"autocomplete {suggest_time * 1000 / len(queries):.2f}ms per query"
+            )
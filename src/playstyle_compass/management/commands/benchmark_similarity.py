@@ -0,0 +1,144 @@
+"""Command used to compare the MinHash LSH candidates with exact Jaccard similarity."""
+
+import time
+
+import numpy as np
+from scipy import sparse
+from django.core.management.base import BaseCommand
+
+from playstyle_compass.helper_functions.minhash import MinHashLSH
+from playstyle_compass.helper_functions.similar_games import (
+    SIMILARITY_FIELDS,
+    GameSimilarityMatrix,
+)
+from playstyle_compass.helper_functions.user_similarity import (
+    SIMILARITY_KINDS,
+    UserSimilarityMatrix,
+)
+
+GAME_FIELDS = ("genres", "themes", "concepts", "developers")
+
+
+def exact_game_pairs(matrix, threshold, chunk_size=500):
+    """Return the pairs of rows with a Jaccard similarity of at least the threshold."""
+    sizes = matrix.getnnz(axis=1)
+    pairs = set()
+
+    for start in range(0, matrix.shape[0], chunk_size):
+        shared = (matrix[start : start + chunk_size] @ matrix.T).tocoo()
+        rows = shared.row + start
+        similarity = shared.data / (sizes[rows] + sizes[shared.col] - shared.data)
+
+        for row, col in zip(
+            rows[similarity >= threshold], shared.col[similarity >= threshold]
+        ):
+            if row != col:
+                pairs.add((int(row), int(col)))
+
+    return pairs
+
+
+def lsh_game_pairs(matrix, index, threshold):
+    """Return the pairs of rows found by verifying the LSH candidates of every row."""
+    sizes = matrix.getnnz(axis=1)
+    pairs = set()
+
+    for row in range(matrix.shape[0]):
+        tokens = matrix.indices[matrix.indptr[row] : matrix.indptr[row + 1]]
+        columns = np.array(sorted(index.candidates(tokens) - {row}), dtype=np.int64)
+        if not len(columns):
+            continue
+
+        shared = (matrix[row] @ matrix[columns].T).toarray()[0]
+        similarity = shared / (sizes[row] + sizes[columns] - shared)
+        pairs.update((row, int(col)) for col in columns[similarity >= threshold])
+
+    return pairs
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks MinHash LSH candidate generation against exact Jaccard similarity."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.6,
+            help="Jaccard similarity threshold for the games. Defaults to 0.6.",
+        )
+        parser.add_argument(
+            "--user-threshold",
+            type=float,
+            help=(
+                "Similarity threshold for the users. "
+                "Defaults to USER_SIMILARITY_THRESHOLD."
+            ),
+        )
+        parser.add_argument(
+            "--num-perm",
+            type=int,
+            default=128,
+            help="Number of MinHash permutations. Defaults to 128.",
+        )
+
+    def report(self, name, exact, exact_time, found, lsh_time):
+        recall = len(found & exact) / len(exact) if exact else 1.0
+        self.stdout.write(
+            f"{name}: exact {len(exact)} pairs in {exact_time:.2f}s, "
+            f"LSH {len(found)} pairs in {lsh_time:.2f}s, recall {recall:.1%}"
+        )
+
+    def handle(self, *args, **options):
+        num_perm = options["num_perm"]
+
+        users = UserSimilarityMatrix.build(options["user_threshold"])
+        positions = list(range(len(users.user_ids)))
+        start = time.perf_counter()
+        indexes = users.build_lsh(num_perm=num_perm)
+        index_time = time.perf_counter() - start
+
+        for kind in SIMILARITY_KINDS:
+            start = time.perf_counter()
+            exact = {
+                (user_id, similar_user_id)
+                for user_id, similar_users in users.similar_users(
+                    positions, kind, limit=None
+                )
+                for similar_user_id, _ in similar_users
+            }
+            exact_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            found = set()
+            for position in positions:
+                columns = users.candidate_columns(position, kind, indexes)
+                for user_id, similar_users in users.similar_users(
+                    [position], kind, limit=None, columns=columns
+                ):
+                    found.update(
+                        (user_id, similar_id) for similar_id, _ in similar_users
+                    )
+            lsh_time = time.perf_counter() - start + index_time
+
+            self.report(f"Users ({kind})", exact, exact_time, found, lsh_time)
+
+        games = GameSimilarityMatrix.build()
+        matrix = sparse.hstack(
+            [games.matrices[SIMILARITY_FIELDS.index(field)] for field in GAME_FIELDS],
+            format="csr",
+        )
+
+        start = time.perf_counter()
+        exact = exact_game_pairs(matrix, options["threshold"])
+        exact_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = MinHashLSH.from_matrix(
+            matrix, threshold=options["threshold"], num_perm=num_perm
+        )
+        found = lsh_game_pairs(matrix, index, options["threshold"])
+        lsh_time = time.perf_counter() - start
+
+        self.report("Games", exact, exact_time, found, lsh_time)
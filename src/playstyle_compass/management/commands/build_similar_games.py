@@ -0,0 +1,24 @@
+"""Command used to rebuild the stored similar games of the whole catalog."""
+
+from django.core.management.base import BaseCommand
+
+from playstyle_compass.helper_functions.similar_games import (
+    CHUNK_SIZE,
+    rebuild_similar_games,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the similar games of every game in the catalog."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help=f"Number of games compared with the catalog at once. Defaults to {CHUNK_SIZE}.",
+        )
+
+    def handle(self, *args, **options):
+        total = rebuild_similar_games(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Stored {total} similar game links."))
@@ -0,0 +1,38 @@
+"""Command used to rebuild the stored similar users of every user."""
+
+from django.core.management.base import BaseCommand
+
+from playstyle_compass.helper_functions.user_similarity import (
+    CHUNK_SIZE,
+    rebuild_similar_users,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the users with similar playstyles and gaming histories."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help=f"Number of users compared with every user at once. Defaults to {CHUNK_SIZE}.",
+        )
+        parser.add_argument(
+            "--lsh",
+            action="store_true",
+            help="Only compare users with the candidates found by MinHash LSH.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            help="Similarity threshold for the users. Defaults to USER_SIMILARITY_THRESHOLD.",
+        )
+
+    def handle(self, *args, **options):
+        total = rebuild_similar_users(
+            chunk_size=options["chunk_size"],
+            use_lsh=options["lsh"],
+            threshold=options["threshold"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Stored {total} similar user links."))
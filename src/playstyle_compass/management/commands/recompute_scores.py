@@ -0,0 +1,22 @@
+"""Command used to repair the review counters stored on the games."""
+
+from django.core.management.base import BaseCommand
+
+from playstyle_compass.helper_functions.review_scores import recompute_scores
+
+
+class Command(BaseCommand):
+    help = "Recomputes the review count, score sum and average score of games."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "guids",
+            nargs="*",
+            help="Guids of the games to repair. Defaults to every game.",
+        )
+
+    def handle(self, *args, **options):
+        total = recompute_scores(options["guids"] or None)
+        self.stdout.write(
+            self.style.SUCCESS(f"Recomputed the scores of {total} games.")
+        )
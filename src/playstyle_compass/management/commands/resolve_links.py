@@ -0,0 +1,24 @@
+"""Command used to resolve the linked names stored on the catalog objects."""
+
+from django.core.management.base import BaseCommand
+
+from playstyle_compass.helper_functions.link_resolution import (
+    CHUNK_SIZE,
+    update_resolved_links,
+)
+
+
+class Command(BaseCommand):
+    help = "Resolves the linked names of every game, franchise and character."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help=f"Number of objects updated at once. Defaults to {CHUNK_SIZE}.",
+        )
+
+    def handle(self, *args, **options):
+        total = update_resolved_links(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Resolved the links of {total} objects."))
@@ -0,0 +1,58 @@
+"""Command used to run the worker that precomputes user recommendations and
+sends the notifications of many users."""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from playstyle_compass.helper_functions.recommendation_jobs import (
+    claim_next_job,
+    run_job,
+)
+from users.misc.notification_fanout import claim_next_fanout_job, run_fanout_job
+
+
+class Command(BaseCommand):
+    help = "Processes queued recommendation jobs and notification fan-outs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of waiting for new jobs.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between checks of an empty queue. Defaults to 2.",
+        )
+
+    def handle(self, *args, **options):
+        processed = 0
+
+        while True:
+            # Users wait for their notifications, so the fan-outs go first
+            job, run = claim_next_fanout_job(), run_fanout_job
+            if job is None:
+                job, run = claim_next_job(), run_job
+
+            if job is None:
+                if options["once"]:
+                    break
+                # Drop connections the database may close while the worker idles.
+                close_old_connections()
+                time.sleep(options["poll_interval"])
+                continue
+
+            run(job)
+            processed += 1
+
+            if job.status == "done":
+                self.stdout.write(f"{job}")
+            else:
+                # Failed, or queued again to retry it
+                self.stdout.write(self.style.ERROR(f"{job}: {job.error}"))
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} job(s)."))
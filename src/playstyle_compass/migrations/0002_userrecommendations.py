@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("playstyle_compass", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserRecommendations",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="recommendations",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("preferences_fingerprint", models.CharField(max_length=64)),
+                ("catalog_fingerprint", models.CharField(max_length=64)),
+                ("games", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0005_similaruser"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="character",
+            name="resolved_links",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="franchise",
+            name="resolved_links",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="resolved_links",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
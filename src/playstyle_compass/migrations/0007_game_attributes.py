@@ -0,0 +1,145 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0006_resolved_links"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Concept",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=200, unique=True)),
+            ],
+            options={
+                "db_table": "Concepts",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Developer",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=200, unique=True)),
+            ],
+            options={
+                "db_table": "Developers",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="FranchiseName",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=200, unique=True)),
+            ],
+            options={
+                "db_table": "FranchiseNames",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Genre",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=200, unique=True)),
+            ],
+            options={
+                "db_table": "Genres",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Platform",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=200, unique=True)),
+            ],
+            options={
+                "db_table": "Platforms",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Theme",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=200, unique=True)),
+            ],
+            options={
+                "db_table": "Themes",
+                "ordering": ["name"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="concept_tags",
+            field=models.ManyToManyField(
+                blank=True,
+                db_table="GameConcepts",
+                related_name="games",
+                to="playstyle_compass.concept",
+            ),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="developer_tags",
+            field=models.ManyToManyField(
+                blank=True,
+                db_table="GameDevelopers",
+                related_name="games",
+                to="playstyle_compass.developer",
+            ),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="franchise_tags",
+            field=models.ManyToManyField(
+                blank=True,
+                db_table="GameFranchiseNames",
+                related_name="games",
+                to="playstyle_compass.franchisename",
+            ),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="genre_tags",
+            field=models.ManyToManyField(
+                blank=True,
+                db_table="GameGenres",
+                related_name="games",
+                to="playstyle_compass.genre",
+            ),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="platform_tags",
+            field=models.ManyToManyField(
+                blank=True,
+                db_table="GamePlatforms",
+                related_name="games",
+                to="playstyle_compass.platform",
+            ),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="theme_tags",
+            field=models.ManyToManyField(
+                blank=True,
+                db_table="GameThemes",
+                related_name="games",
+                to="playstyle_compass.theme",
+            ),
+        ),
+    ]
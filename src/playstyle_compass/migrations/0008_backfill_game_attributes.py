@@ -0,0 +1,60 @@
+from django.db import migrations
+
+ATTRIBUTE_FIELDS = {
+    "genres": ("genre_tags", "Genre"),
+    "themes": ("theme_tags", "Theme"),
+    "platforms": ("platform_tags", "Platform"),
+    "concepts": ("concept_tags", "Concept"),
+    "developers": ("developer_tags", "Developer"),
+    "franchises": ("franchise_tags", "FranchiseName"),
+}
+
+
+def split_values(value):
+    if not value:
+        return []
+
+    return list(
+        dict.fromkeys(item.strip() for item in value.split(",") if item.strip())
+    )
+
+
+def backfill_game_attributes(apps, schema_editor):
+    Game = apps.get_model("playstyle_compass", "Game")
+
+    for field, (tag_field, model_name) in ATTRIBUTE_FIELDS.items():
+        model = apps.get_model("playstyle_compass", model_name)
+        through = getattr(Game, tag_field).through
+        column = f"{model._meta.model_name}_id"
+
+        values = {
+            game_id: split_values(value)
+            for game_id, value in Game.objects.values_list("id", field).iterator()
+        }
+        names = {name for game_names in values.values() for name in game_names}
+
+        model.objects.bulk_create(
+            [model(name=name) for name in names], ignore_conflicts=True, batch_size=500
+        )
+        ids = dict(model.objects.values_list("name", "id"))
+
+        through.objects.bulk_create(
+            [
+                through(game_id=game_id, **{column: ids[name]})
+                for game_id, game_names in values.items()
+                for name in game_names
+            ],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0007_game_attributes"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_game_attributes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+from django.db import migrations
+
+# Searched tables with their name column and full-text table.
+SEARCHED_TABLES = (
+    ("Games", "title", "GamesSearch"),
+    ("Franchises", "title", "FranchisesSearch"),
+    ("Characters", "name", "CharactersSearch"),
+)
+
+SQLITE_CREATE_SQL = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS "{search}" USING fts5(
+    {column}, content='{table}', content_rowid='id', tokenize='trigram'
+)""",
+    """CREATE TRIGGER IF NOT EXISTS "{search}_insert" AFTER INSERT ON "{table}" BEGIN
+    INSERT INTO "{search}" (rowid, {column}) VALUES (new.id, new.{column});
+END""",
+    """CREATE TRIGGER IF NOT EXISTS "{search}_delete" AFTER DELETE ON "{table}" BEGIN
+    INSERT INTO "{search}" ("{search}", rowid, {column})
+    VALUES ('delete', old.id, old.{column});
+END""",
+    """CREATE TRIGGER IF NOT EXISTS "{search}_update" AFTER UPDATE OF {column} ON "{table}" BEGIN
+    INSERT INTO "{search}" ("{search}", rowid, {column})
+    VALUES ('delete', old.id, old.{column});
+    INSERT INTO "{search}" (rowid, {column}) VALUES (new.id, new.{column});
+END""",
+    """INSERT INTO "{search}" ("{search}") VALUES ('rebuild')""",
+)
+
+SQLITE_DROP_SQL = (
+    'DROP TRIGGER IF EXISTS "{search}_insert"',
+    'DROP TRIGGER IF EXISTS "{search}_delete"',
+    'DROP TRIGGER IF EXISTS "{search}_update"',
+    'DROP TABLE IF EXISTS "{search}"',
+)
+
+POSTGRES_CREATE_SQL = (
+    """CREATE INDEX IF NOT EXISTS "{table}_{column}_trgm"
+ON "{table}" USING gin ((UPPER("{column}"::text)) gin_trgm_ops)""",
+)
+
+POSTGRES_DROP_SQL = ('DROP INDEX IF EXISTS "{table}_{column}_trgm"',)
+
+
+def run_statements(schema_editor, statements):
+    for table, column, search in SEARCHED_TABLES:
+        for statement in statements:
+            schema_editor.execute(
+                statement.format(table=table, column=column, search=search)
+            )
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        run_statements(schema_editor, SQLITE_CREATE_SQL)
+    elif vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        run_statements(schema_editor, POSTGRES_CREATE_SQL)
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        run_statements(schema_editor, SQLITE_DROP_SQL)
+    elif vendor == "postgresql":
+        run_statements(schema_editor, POSTGRES_DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0008_backfill_game_attributes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:12
+
+from importlib import import_module
+
+from django.db import migrations, models
+from django.db.models import (
+    Avg,
+    Count,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Coalesce
+
+search_indexes = import_module(".0009_search_indexes", __package__)
+
+
+def backfill_review_counters(apps, schema_editor):
+    Game = apps.get_model("playstyle_compass", "Game")
+    Review = apps.get_model("playstyle_compass", "Review")
+
+    reviews = Review.objects.filter(game=OuterRef("guid")).order_by().values("game")
+
+    def aggregate(function, default, output_field):
+        return Coalesce(
+            Subquery(reviews.annotate(value=function).values("value")),
+            default,
+            output_field=output_field,
+        )
+
+    Game.objects.update(
+        total_reviews=aggregate(Count("id"), 0, IntegerField()),
+        score_total=aggregate(Sum("score"), 0, IntegerField()),
+        average_score=aggregate(Avg("score"), 0.0, FloatField()),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0009_search_indexes"),
+    ]
+
+    # SQLite rebuilds the table to add or remove the column, dropping its search
+    # triggers, so they are restored after the rebuild in both directions.
+    operations = [
+        migrations.RunPython(
+            migrations.RunPython.noop, search_indexes.create_search_indexes
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="score_total",
+            field=models.IntegerField(default=0, db_default=0),
+        ),
+        migrations.RunPython(
+            search_indexes.create_search_indexes, migrations.RunPython.noop
+        ),
+        migrations.RunPython(backfill_review_counters, migrations.RunPython.noop),
+    ]
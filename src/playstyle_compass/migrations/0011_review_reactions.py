@@ -0,0 +1,134 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+REACTION_COLUMNS = (("liked_by", "like"), ("disliked_by", "dislike"))
+
+
+def split_ids(value):
+    return {int(item) for item in (value or "").split(",") if item.strip().isdigit()}
+
+
+def explode_reactions(apps, schema_editor):
+    Review = apps.get_model("playstyle_compass", "Review")
+    ReviewReaction = apps.get_model("playstyle_compass", "ReviewReaction")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+
+    user_ids = set(User.objects.values_list("id", flat=True))
+    reviews = Review.objects.exclude(
+        Q(liked_by__isnull=True) | Q(liked_by=""),
+        Q(disliked_by__isnull=True) | Q(disliked_by=""),
+    ).values_list("id", "liked_by", "disliked_by")
+
+    reactions = []
+    for review_id, liked_by, disliked_by in reviews.iterator():
+        liked = split_ids(liked_by) & user_ids
+        disliked = split_ids(disliked_by) & user_ids - liked
+
+        reactions.extend(
+            ReviewReaction(review_id=review_id, user_id=user_id, reaction="like")
+            for user_id in liked
+        )
+        reactions.extend(
+            ReviewReaction(review_id=review_id, user_id=user_id, reaction="dislike")
+            for user_id in disliked
+        )
+
+    ReviewReaction.objects.bulk_create(reactions, ignore_conflicts=True, batch_size=500)
+
+    # The counters of the reviews start from the reactions they really have
+    counts = (
+        ReviewReaction.objects.values("review_id")
+        .annotate(
+            likes=Count("id", filter=Q(reaction="like")),
+            dislikes=Count("id", filter=Q(reaction="dislike")),
+        )
+        .order_by()
+    )
+    Review.objects.update(likes=0, dislikes=0)
+    for row in counts.iterator():
+        Review.objects.filter(id=row["review_id"]).update(
+            likes=row["likes"], dislikes=row["dislikes"]
+        )
+
+
+def implode_reactions(apps, schema_editor):
+    Review = apps.get_model("playstyle_compass", "Review")
+    ReviewReaction = apps.get_model("playstyle_compass", "ReviewReaction")
+
+    values = {}
+    rows = ReviewReaction.objects.values_list("review_id", "user_id", "reaction")
+    for review_id, user_id, reaction in rows.iterator():
+        column = "liked_by" if reaction == "like" else "disliked_by"
+        values.setdefault(review_id, {"liked_by": "", "disliked_by": ""})
+        values[review_id][column] += f"{user_id},"
+
+    for review_id, columns in values.items():
+        Review.objects.filter(id=review_id).update(**columns)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0010_review_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReviewReaction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "reaction",
+                    models.CharField(
+                        choices=[("like", "Like"), ("dislike", "Dislike")], max_length=7
+                    ),
+                ),
+                (
+                    "review",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reactions",
+                        to="playstyle_compass.review",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="review_reactions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "ReviewReactions",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("review", "user"), name="unique_review_reaction"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(explode_reactions, implode_reactions),
+        migrations.RemoveField(
+            model_name="review",
+            name="disliked_by",
+        ),
+        migrations.RemoveField(
+            model_name="review",
+            name="liked_by",
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:04
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def drop_duplicate_pending_jobs(apps, schema_editor):
+    RecommendationJob = apps.get_model("playstyle_compass", "RecommendationJob")
+
+    pending = RecommendationJob.objects.filter(status="pending")
+    kept = pending.values("user").annotate(first_id=Min("id")).values("first_id")
+    pending.exclude(id__in=kept).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0011_review_reactions"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_pending_jobs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="recommendationjob",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.comparison.Coalesce("user", models.Value(0)),
+                condition=models.Q(("status", "pending")),
+                name="unique_pending_recommendation_job",
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+# The linked fields of every model, with the model their names refer to.
+LINKED_FIELDS = {
+    "Game": {"similar_games": "Game", "dlcs": "Game", "franchises": "Franchise"},
+    "Franchise": {"games": "Game"},
+    "Character": {
+        "friends": "Character",
+        "enemies": "Character",
+        "games": "Game",
+        "first_game": "Game",
+        "franchises": "Franchise",
+    },
+}
+
+NAME_FIELDS = {
+    "Game": ("title", "guid"),
+    "Franchise": ("title", "id"),
+    "Character": ("name", "id"),
+}
+
+
+def split_names(value):
+    if not value:
+        return []
+
+    return [name.strip() for name in value.split(",")]
+
+
+def backfill_resolved_links(apps, schema_editor):
+    targets = {}
+    for model_name, (name_field, target_field) in NAME_FIELDS.items():
+        model = apps.get_model("playstyle_compass", model_name)
+        names = defaultdict(list)
+        rows = model.objects.order_by("pk").values_list(name_field, target_field)
+
+        for name, target in rows.iterator():
+            if model_name == "Game" and names[name]:
+                continue
+            names[name].append(target)
+
+        targets[model_name] = dict(names)
+
+    for model_name, fields in LINKED_FIELDS.items():
+        model = apps.get_model("playstyle_compass", model_name)
+        objects = model.objects.filter(resolved_links__isnull=True).only(*fields)
+
+        batch = []
+        for obj in objects.iterator(chunk_size=500):
+            obj.resolved_links = {
+                field: [
+                    [name, targets[target_model].get(name, [])]
+                    for name in split_names(getattr(obj, field))
+                ]
+                for field, target_model in fields.items()
+            }
+            batch.append(obj)
+
+            if len(batch) == 500:
+                model.objects.bulk_update(batch, ["resolved_links"])
+                batch = []
+
+        model.objects.bulk_update(batch, ["resolved_links"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0012_unique_pending_recommendation_job"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_resolved_links, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("playstyle_compass", "0013_backfill_resolved_links"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recommendationjob",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
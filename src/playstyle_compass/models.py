@@ -1,8 +1,9 @@
 """Defines models."""
 
 from django.conf import settings
-from django.db import models
-from django.db.models import Count, Sum
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, ExpressionWrapper, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.db.models import Avg, Count
@@ -43,14 +44,41 @@ class Game(models.Model):
     linux_req_rec = models.TextField(blank=True, null=True)
     average_score = models.FloatField(blank=True, null=True)
     total_reviews = models.IntegerField(blank=True, null=True)
+    score_total = models.IntegerField(default=0, db_default=0)
     translated_description_ro = models.TextField(blank=True, null=True)
     translated_overview_ro = models.TextField(blank=True, null=True)
+    resolved_links = models.JSONField(blank=True, null=True)
+    genre_tags = models.ManyToManyField(
+        "Genre", related_name="games", db_table="GameGenres", blank=True
+    )
+    theme_tags = models.ManyToManyField(
+        "Theme", related_name="games", db_table="GameThemes", blank=True
+    )
+    platform_tags = models.ManyToManyField(
+        "Platform", related_name="games", db_table="GamePlatforms", blank=True
+    )
+    concept_tags = models.ManyToManyField(
+        "Concept", related_name="games", db_table="GameConcepts", blank=True
+    )
+    developer_tags = models.ManyToManyField(
+        "Developer", related_name="games", db_table="GameDevelopers", blank=True
+    )
+    franchise_tags = models.ManyToManyField(
+        "FranchiseName",
+        related_name="games",
+        db_table="GameFranchiseNames",
+        blank=True,
+    )
 
     def update_score(self):
-        reviews = self.review_set.all()
-        self.total_reviews = reviews.count()
-        self.average_score = reviews.aggregate(Avg("score"))["score__avg"] or 0
-        self.save()
+        """Recompute the review counters of the game from its reviews."""
+        scores = self.review_set.aggregate(
+            total=Count("id"), score_sum=Sum("score"), average=Avg("score")
+        )
+        self.total_reviews = scores["total"]
+        self.score_total = scores["score_sum"] or 0
+        self.average_score = scores["average"] or 0
+        self.save(update_fields=["total_reviews", "score_total", "average_score"])
 
     @property
     def stores(self):
@@ -65,6 +93,63 @@ class Game(models.Model):
         ordering = ["title"]
 
 
+class GameAttribute(models.Model):
+    """Base model of the values stored in the comma separated game attributes."""
+
+    id = models.BigAutoField(primary_key=True)
+    name = models.CharField(max_length=200, unique=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        abstract = True
+        ordering = ["name"]
+
+
+class Genre(GameAttribute):
+    """Represents a game genre."""
+
+    class Meta(GameAttribute.Meta):
+        db_table = "Genres"
+
+
+class Theme(GameAttribute):
+    """Represents a game theme."""
+
+    class Meta(GameAttribute.Meta):
+        db_table = "Themes"
+
+
+class Platform(GameAttribute):
+    """Represents a gaming platform."""
+
+    class Meta(GameAttribute.Meta):
+        db_table = "Platforms"
+
+
+class Concept(GameAttribute):
+    """Represents a game concept."""
+
+    class Meta(GameAttribute.Meta):
+        db_table = "Concepts"
+
+
+class Developer(GameAttribute):
+    """Represents a game developer."""
+
+    class Meta(GameAttribute.Meta):
+        db_table = "Developers"
+
+
+class FranchiseName(GameAttribute):
+    """Represents a franchise name listed on games, which may not have a
+    Franchise entry."""
+
+    class Meta(GameAttribute.Meta):
+        db_table = "FranchiseNames"
+
+
 class GameStores(models.Model):
     guid = models.CharField(max_length=100, unique=False)
     title = models.CharField(max_length=255)
@@ -79,6 +164,27 @@ class GameStores(models.Model):
         ordering = ["title"]
 
 
+class SimilarGame(models.Model):
+    """Stores a neighbor of a game and how many attribute types they share."""
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="neighbors")
+    similar_game = models.ForeignKey(
+        Game, on_delete=models.CASCADE, related_name="neighbor_of"
+    )
+    match_count = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "similar_game"], name="unique_similar_game"
+            )
+        ]
+        indexes = [models.Index(fields=["game", "-match_count"])]
+
+    def __str__(self):
+        return f"{self.similar_game} is similar to {self.game} ({self.match_count})"
+
+
 class UserPreferences(models.Model):
     """Represents user-specific gaming preferences."""
 
@@ -103,6 +209,14 @@ class UserPreferences(models.Model):
     show_reviews = models.BooleanField(default=True)
     show_favorites = models.BooleanField(default=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user_preferences = super().from_db(db, field_names, values)
+        # Remember the stored values, so that saving the preferences only
+        # recomputes the similar users when a compared preference changes.
+        user_preferences._stored_preferences = dict(zip(field_names, values))
+        return user_preferences
+
     def add_favorite_game(self, game):
         self.favorite_games.add(game)
 
@@ -131,6 +245,102 @@ class UserPreferences(models.Model):
         return f"{self.user}'s user preferences"
 
 
+class SimilarUser(models.Model):
+    """Stores a user whose preferences are similar to another user's."""
+
+    KIND_CHOICES = [
+        ("playstyle", "PlayStyle"),
+        ("gaming_history", "Gaming History"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="similar_users"
+    )
+    similar_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="similar_to"
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    similarity = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "similar_user", "kind"], name="unique_similar_user"
+            )
+        ]
+        indexes = [models.Index(fields=["user", "kind", "-similarity"])]
+
+    def __str__(self):
+        return f"{self.similar_user} is similar to {self.user} ({self.kind})"
+
+
+class UserRecommendations(models.Model):
+    """Stores the ranked game ids recommended to a user in every category."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="recommendations",
+    )
+    preferences_fingerprint = models.CharField(max_length=64)
+    catalog_fingerprint = models.CharField(max_length=64)
+    games = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user}'s recommendations"
+
+
+class RecommendationJob(models.Model):
+    """Represents a queued recomputation of recommendations.
+
+    Jobs without a user are catalog refreshes, which are queued by the ingest
+    scripts in utils/ and fan out into one job per user with stored results.
+    """
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="recommendation_jobs",
+    )
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default="pending", db_index=True
+    )
+    error = models.TextField(blank=True, default="")
+    # Number of times the job was claimed by a worker
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when a worker claims the job
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "RecommendationJobs"
+        ordering = ["created_at", "id"]
+        constraints = [
+            # One pending job per user, and one pending catalog refresh
+            models.UniqueConstraint(
+                Coalesce("user", models.Value(0)),
+                condition=models.Q(status="pending"),
+                name="unique_pending_recommendation_job",
+            )
+        ]
+
+    def __str__(self):
+        target = self.user if self.user_id else "catalog"
+        return f"Recommendation job for {target} ({self.status})"
+
+
 class SharedGame(models.Model):
     """Represents a game shared between users."""
 
@@ -155,6 +365,18 @@ class SharedGame(models.Model):
         db_table = "Message"
 
 
+class ReviewQuerySet(models.QuerySet):
+    """QuerySet of reviews."""
+
+    def delete(self):
+        """Delete the reviews, recomputing the counters of each of their games
+        once instead of updating them once per review."""
+        from .helper_functions.review_scores import deferred_score_updates
+
+        with deferred_score_updates():
+            return super().delete()
+
+
 class Review(models.Model):
     """Represents a review for a game."""
 
@@ -170,65 +392,73 @@ class Review(models.Model):
     score = models.PositiveSmallIntegerField(choices=SCORE_CHOICES)
     likes = models.IntegerField(default=0, blank=True, null=True)
     dislikes = models.IntegerField(default=0, blank=True, null=True)
-    liked_by = models.TextField(blank=True, null=True)
-    disliked_by = models.TextField(blank=True, null=True)
     date_added = models.DateTimeField(default=now, blank=True)
 
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        self.game.update_score()
-
-    def delete(self, *args, **kwargs):
-        game = self.game
-        super().delete(*args, **kwargs)
-
-        game.update_score()
+    objects = ReviewQuerySet.as_manager()
 
-    def add_like(self, user_id):
-        """Add a like to the review."""
-        if not self.user_has_liked(user_id):
-            self.liked_by += f"{user_id},"
-            self.likes += 1
-            self.save()
-
-    def remove_like(self, user_id):
-        """Remove a like from the review.."""
-        liked_by_list = self.liked_by.split(",")
-        if str(user_id) in liked_by_list:
-            liked_by_list.remove(str(user_id))
-            self.liked_by = ",".join(liked_by_list)
-            self.likes -= 1
-            self.save()
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        review = super().from_db(db, field_names, values)
+        # Remember the stored game and score, so that saving the review only
+        # updates the counters of its game when the score changes.
+        if "game_id" in review.__dict__ and "score" in review.__dict__:
+            review._stored_score = (review.game_id, review.score)
+        return review
 
     def user_has_liked(self, user_id):
         """Check if the user has already liked the review."""
-        liked_by = self.liked_by
-        if liked_by is not None:
-            return str(user_id) in liked_by.split(",")
-        return False
-
-    def add_dislike(self, user_id):
-        """Add a dislike to the review."""
-        if not self.user_has_disliked(user_id):
-            self.disliked_by += f"{user_id},"
-            self.dislikes += 1
-            self.save()
-
-    def remove_dislike(self, user_id):
-        """Remove a dislike from the review."""
-        disliked_by_list = self.disliked_by.split(",")
-        if str(user_id) in disliked_by_list:
-            disliked_by_list.remove(str(user_id))
-            self.disliked_by = ",".join(disliked_by_list)
-            self.dislikes -= 1
-            self.save()
+        return self.reactions.filter(
+            user_id=user_id, reaction=ReviewReaction.LIKE
+        ).exists()
 
     def user_has_disliked(self, user_id):
         """Check if the user has already disliked the review."""
-        disliked_by = self.disliked_by
-        if disliked_by is not None:
-            return str(user_id) in disliked_by.split(",")
-        return False
+        return self.reactions.filter(
+            user_id=user_id, reaction=ReviewReaction.DISLIKE
+        ).exists()
+
+    def toggle_reaction(self, user_id, reaction):
+        """Add the reaction of a user to the review, replacing their other
+        reaction, or remove it when they already reacted the same way.
+
+        Every step changes the reaction row first and moves the counters by
+        the number of rows it changed, so concurrent toggles cannot lose or
+        double count a reaction. Returns the reaction the user now has.
+        """
+        other = (
+            ReviewReaction.DISLIKE
+            if reaction == ReviewReaction.LIKE
+            else ReviewReaction.LIKE
+        )
+        counters = {ReviewReaction.LIKE: "likes", ReviewReaction.DISLIKE: "dislikes"}
+        reactions = ReviewReaction.objects.filter(review=self, user_id=user_id)
+        changes = {}
+        current = reaction
+
+        with transaction.atomic():
+            if reactions.filter(reaction=reaction).delete()[0]:
+                changes[counters[reaction]] = F(counters[reaction]) - 1
+                current = None
+            elif reactions.filter(reaction=other).update(reaction=reaction):
+                changes[counters[other]] = F(counters[other]) - 1
+                changes[counters[reaction]] = F(counters[reaction]) + 1
+            else:
+                try:
+                    with transaction.atomic():
+                        ReviewReaction.objects.create(
+                            review=self, user_id=user_id, reaction=reaction
+                        )
+                except IntegrityError:
+                    # A concurrent request of the same user reacted first
+                    pass
+                else:
+                    changes[counters[reaction]] = F(counters[reaction]) + 1
+
+            if changes:
+                Review.objects.filter(pk=self.pk).update(**changes)
+
+        self.refresh_from_db(fields=["likes", "dislikes"])
+        return current
 
     def __str__(self):
         return f"Review by {self.reviewers} for {self.game.title}"
@@ -237,6 +467,49 @@ class Review(models.Model):
         db_table = "Reviews"
 
 
+class ReviewReaction(models.Model):
+    """Represents the like or dislike of a user on a review."""
+
+    LIKE = "like"
+    DISLIKE = "dislike"
+    REACTION_CHOICES = [(LIKE, "Like"), (DISLIKE, "Dislike")]
+
+    review = models.ForeignKey(
+        Review, on_delete=models.CASCADE, related_name="reactions"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="review_reactions",
+    )
+    reaction = models.CharField(max_length=7, choices=REACTION_CHOICES)
+
+    class Meta:
+        db_table = "ReviewReactions"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["review", "user"], name="unique_review_reaction"
+            )
+        ]
+
+    @classmethod
+    def reactions_of(cls, user, review_ids):
+        """Return the ids of the given reviews the user liked and the ids of
+        those they disliked, using a single query."""
+        liked, disliked = set(), set()
+        if not user.is_authenticated:
+            return liked, disliked
+
+        rows = cls.objects.filter(user=user, review_id__in=list(review_ids))
+        for review_id, reaction in rows.values_list("review_id", "reaction"):
+            (liked if reaction == cls.LIKE else disliked).add(review_id)
+
+        return liked, disliked
+
+    def __str__(self):
+        return f"{self.user} {self.reaction}s review {self.review_id}"
+
+
 class Franchise(models.Model):
     """Represents a franchise."""
 
@@ -248,6 +521,7 @@ class Franchise(models.Model):
     image = models.TextField(blank=True, null=True)
     images = models.TextField(blank=True, null=True)
     games_count = models.IntegerField(default=0)
+    resolved_links = models.JSONField(blank=True, null=True)
 
     def __str__(self):
         return f"Franchise: {self.title}"
@@ -278,6 +552,7 @@ class Character(models.Model):
     image = models.TextField(blank=True, null=True)
     images = models.TextField(blank=True, null=True)
     character_id = models.IntegerField(default=0, blank=True, null=True)
+    resolved_links = models.JSONField(blank=True, null=True)
 
     def __str__(self):
         return f"Character: {self.name}"
@@ -321,6 +596,43 @@ class News(models.Model):
         return f"Article: {self.title}"
 
 
+def count_of(model, column):
+    """Return a subquery counting the rows of a model whose column points to
+    the outer object."""
+    rows = model.objects.filter(**{column: OuterRef("pk")}).order_by().values(column)
+    return Coalesce(Subquery(rows.annotate(total=Count("*")).values("total")), 0)
+
+
+def annotated_count(obj, annotation, related):
+    """Return the count annotated on an object, or count the related rows."""
+    count = getattr(obj, annotation, None)
+    return related.count() if count is None else count
+
+
+class LikedQuerySet(models.QuerySet):
+    """QuerySet of objects liked through a 'liked_by' many-to-many field."""
+
+    def with_stats(self):
+        """Annotate the like counts, read by 'like_count' without a query."""
+        return self.annotate(
+            num_likes=count_of(self.model.liked_by.through, self.model._meta.model_name)
+        )
+
+
+class GameListQuerySet(models.QuerySet):
+    """QuerySet of game lists."""
+
+    def with_stats(self):
+        """Annotate the like, share, review and favorite counts, read by the
+        count properties of the lists without a query each."""
+        return self.annotate(
+            num_likes=count_of(GameList.liked_by.through, "gamelist"),
+            num_shares=count_of(GameList.shared_with.through, "gamelist"),
+            num_reviews=count_of(ListReview, "game_list"),
+            num_favorites=count_of(GameList.favorites.through, "gamelist"),
+        )
+
+
 class GameList(models.Model):
     """Represents a game list."""
 
@@ -345,15 +657,17 @@ class GameList(models.Model):
         settings.AUTH_USER_MODEL, blank=True, related_name="favorite_game_lists"
     )
 
+    objects = GameListQuerySet.as_manager()
+
     @property
     def like_count(self):
         """Returns the total number of likes for the game list."""
-        return self.liked_by.count()
+        return annotated_count(self, "num_likes", self.liked_by)
 
     @property
     def share_count(self):
         """Returns the number of users the game list is shared with."""
-        return self.shared_with.count()
+        return annotated_count(self, "num_shares", self.shared_with)
 
     @property
     def total_games(self):
@@ -366,11 +680,11 @@ class GameList(models.Model):
     @property
     def review_count(self):
         """Returns the total number of reviews for the game list."""
-        return self.reviews.count()
+        return annotated_count(self, "num_reviews", self.reviews)
 
     @property
     def favorite_count(self):
-        return self.favorites.count()
+        return annotated_count(self, "num_favorites", self.favorites)
 
     def toggle_favorite(self, user):
         """Adds or removes the game list from the user's favorites."""
@@ -409,6 +723,8 @@ class ListReview(models.Model):
         blank=True,
     )
 
+    objects = LikedQuerySet.as_manager()
+
     class Meta:
         unique_together = ("game_list", "user")
 
@@ -418,7 +734,7 @@ class ListReview(models.Model):
     @property
     def like_count(self):
         """Returns the number of likes."""
-        return self.liked_by.count()
+        return annotated_count(self, "num_likes", self.liked_by)
 
 
 class ListComment(models.Model):
@@ -439,6 +755,8 @@ class ListComment(models.Model):
         blank=True,
     )
 
+    objects = LikedQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
         verbose_name = _("List Comment")
@@ -453,7 +771,18 @@ class ListComment(models.Model):
     @property
     def like_count(self):
         """Returns the number of likes."""
-        return self.liked_by.count()
+        return annotated_count(self, "num_likes", self.liked_by)
+
+
+class PollQuerySet(LikedQuerySet):
+    """QuerySet of polls."""
+
+    def ended(self):
+        """Return the polls whose duration has elapsed."""
+        end_time = ExpressionWrapper(
+            F("created_at") + F("duration"), output_field=models.DateTimeField()
+        )
+        return self.alias(end_time=end_time).filter(end_time__lt=now())
 
 
 class Poll(models.Model):
@@ -475,6 +804,8 @@ class Poll(models.Model):
     duration = models.DurationField(default=timedelta(days=7))
     is_public = models.BooleanField(default=True)
 
+    objects = PollQuerySet.as_manager()
+
     def __str__(self):
         return f"Poll: {self.title} (Created by {self.created_by})"
 
@@ -488,16 +819,20 @@ class Poll(models.Model):
     @property
     def like_count(self):
         """Returns the number of likes."""
-        return self.liked_by.count()
+        return annotated_count(self, "num_likes", self.liked_by)
 
     def total_votes(self):
         """Calculate the total number of votes across all options in this poll."""
         return self.options.aggregate(total_votes=Count("votes"))["total_votes"] or 0
 
-    def options_with_percentages(self):
-        """Return options with vote percentages."""
-        total_votes = self.total_votes()
-        options_with_votes = self.options.annotate(vote_count=Count("votes"))
+    def options_with_percentages(self, options_with_votes=None):
+        """Return options with vote percentages, from the options annotated
+        with their 'vote_count' when given."""
+        if options_with_votes is None:
+            options_with_votes = self.options.annotate(vote_count=Count("votes"))
+
+        options_with_votes = list(options_with_votes)
+        total_votes = sum(option.vote_count for option in options_with_votes)
 
         options_with_percentages = []
         for option in options_with_votes:
@@ -1,8 +1,32 @@
 """Defines signals for the playstyle_compass app."""
 
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import Game
+from .models import (
+    Game,
+    UserPreferences,
+    Franchise,
+    Character,
+    Review,
+    Poll,
+    PollOption,
+    Vote,
+)
+from .helper_functions.catalog_cache import bump_catalog_version
+from .helper_functions.similar_games import SIMILARITY_FIELDS, update_similar_games
+from .helper_functions.game_attributes import ATTRIBUTE_FIELDS, sync_game_attributes
+from .helper_functions.link_resolution import LINKED_FIELDS, refresh_resolved_links
+from .helper_functions.user_similarity import (
+    COMPARED_PREFERENCES,
+    update_similar_users,
+)
+from .helper_functions.recommendation_jobs import enqueue_recommendation_job
+from .helper_functions.review_scores import apply_score_change, refresh_game_score
+from .helper_functions.review_pages import invalidate_review_pages
+from .helper_functions.poll_results import invalidate_poll_results
+
+SCORE_FIELDS = {"average_score", "total_reviews", "score_total"}
 
 
 @receiver(post_save, sender=Game)
@@ -10,3 +34,162 @@ def update_game_score(sender, instance, created, **kwargs):
     """Update the game's score after creation."""
     if created:
         instance.update_score()
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_game_review_pages(sender, instance, **kwargs):
+    """Drop the cached review pages of a game when one of its reviews changes."""
+    invalidate_review_pages(instance.game_id)
+
+    # Runs before 'update_review_counters' replaces the stored game, so a
+    # review moved to another game also leaves the pages of its former game
+    stored = getattr(instance, "_stored_score", None)
+    if stored and stored[0] != instance.game_id:
+        invalidate_review_pages(stored[0])
+
+
+@receiver(post_save, sender=Review)
+def update_review_counters(sender, instance, created, raw=False, **kwargs):
+    """Apply the score change of a saved review to the counters of its game."""
+    update_fields = kwargs.get("update_fields")
+
+    if raw or (update_fields and not {"game", "score"} & set(update_fields)):
+        return
+
+    stored = getattr(instance, "_stored_score", None)
+    current = (instance.game_id, instance.score)
+
+    if created:
+        apply_score_change(instance.game_id, 1, instance.score)
+    elif stored is None:
+        refresh_game_score(instance.game_id)
+    elif stored[0] != current[0]:
+        apply_score_change(stored[0], -1, -stored[1])
+        apply_score_change(instance.game_id, 1, instance.score)
+    elif stored[1] != current[1]:
+        apply_score_change(instance.game_id, 0, instance.score - stored[1])
+
+    instance._stored_score = current
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_counters(sender, instance, **kwargs):
+    """Remove a deleted review from the counters of its game."""
+    # Reviews deleted along with their game have no counters to update
+    if isinstance(kwargs.get("origin"), Game):
+        return
+
+    stored = getattr(instance, "_stored_score", None)
+    if stored is None:
+        refresh_game_score(instance.game_id)
+    else:
+        apply_score_change(stored[0], -1, -stored[1])
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_delete, sender=Game)
+def invalidate_game_catalog(sender, instance, **kwargs):
+    """Mark the catalog snapshots stale when a game is written."""
+    update_fields = kwargs.get("update_fields")
+
+    # Score updates do not affect any of the catalog snapshots
+    if update_fields and set(update_fields) <= SCORE_FIELDS:
+        return
+
+    bump_catalog_version(Game)
+
+
+@receiver(post_save, sender=Poll)
+@receiver(post_delete, sender=Poll)
+def invalidate_poll(sender, instance, **kwargs):
+    """Drop the cached results of a poll when it is written."""
+    invalidate_poll_results(instance.id)
+
+
+@receiver(post_save, sender=PollOption)
+@receiver(post_delete, sender=PollOption)
+@receiver(post_save, sender=Vote)
+@receiver(post_delete, sender=Vote)
+def invalidate_poll_votes(sender, instance, **kwargs):
+    """Drop the cached results of a poll when its options or votes change."""
+    invalidate_poll_results(instance.poll_id)
+
+
+@receiver(post_save, sender=Franchise)
+@receiver(post_delete, sender=Franchise)
+@receiver(post_save, sender=Character)
+@receiver(post_delete, sender=Character)
+def invalidate_name_catalog(sender, **kwargs):
+    """Mark the name indexes stale when a franchise or character is written."""
+    bump_catalog_version(sender)
+
+
+@receiver(post_save, sender=Game)
+def refresh_game_attributes(sender, instance, raw=False, **kwargs):
+    """Sync the attribute links of a game with its comma separated columns."""
+    update_fields = kwargs.get("update_fields")
+
+    if raw:
+        return
+
+    fields = [
+        field
+        for field in ATTRIBUTE_FIELDS
+        if not update_fields or field in update_fields
+    ]
+    if fields:
+        sync_game_attributes([instance], fields)
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_save, sender=Franchise)
+@receiver(post_save, sender=Character)
+def update_object_links(sender, instance, raw=False, **kwargs):
+    """Resolve the stored links of an object when its linked fields change."""
+    update_fields = kwargs.get("update_fields")
+
+    if raw or (update_fields and not set(update_fields) & set(LINKED_FIELDS[sender])):
+        return
+
+    refresh_resolved_links(instance)
+
+
+@receiver(post_save, sender=Game)
+def refresh_similar_games(sender, instance, raw=False, **kwargs):
+    """Recompute the stored neighbors of a game when its attributes change."""
+    update_fields = kwargs.get("update_fields")
+
+    if raw or (update_fields and not set(update_fields) & set(SIMILARITY_FIELDS)):
+        return
+
+    update_similar_games(instance)
+
+
+@receiver(post_save, sender=UserPreferences)
+def refresh_similar_users(sender, instance, created, raw=False, **kwargs):
+    """Recompute the users similar to a user when their preferences change."""
+    update_fields = kwargs.get("update_fields")
+
+    if raw or (update_fields and not set(update_fields) & set(COMPARED_PREFERENCES)):
+        return
+
+    stored = getattr(instance, "_stored_preferences", {})
+    compared = {field: getattr(instance, field) for field in COMPARED_PREFERENCES}
+    instance._stored_preferences = {**stored, **compared}
+
+    # New preferences are empty and cannot be similar to anything yet.
+    if created and not any(compared.values()):
+        return
+
+    # Saves that leave every compared preference as stored keep the same
+    # similar users, such as toggling a profile stat.
+    if not created and all(
+        field in stored and stored[field] == value for field, value in compared.items()
+    ):
+        return
+
+    if settings.RECOMMENDATION_WORKER:
+        enqueue_recommendation_job(instance.user_id)
+    else:
+        update_similar_users(instance)
@@ -1,6 +1,5 @@
 """Custom filters."""
 
-import difflib
 import re
 from datetime import datetime
 from django import template
@@ -12,7 +11,7 @@ from django.urls import reverse
 from pytz import timezone
 from django.utils import timezone as django_timezone
 from django.utils.safestring import mark_safe
-from ..models import Game, Franchise, Character
+from ..helper_functions.name_index import game_names, franchise_names, character_names
 from django.http import QueryDict
 from django.utils.html import escape
 
@@ -109,6 +108,25 @@ def split_commas(value):
     return [item.strip() for item in value.split(",")]
 
 
+@register.filter
+def truncate_links(links, words):
+    """
+    Keep the resolved links whose names fit in the given number of words,
+    ending with an ellipsis like 'truncatewords'.
+    """
+    if not links:
+        return None
+
+    truncated, count = [], 0
+    for name, targets in links:
+        count += len(name.split())
+        if count > int(words):
+            return truncated + [["…", []]]
+        truncated.append([name, targets])
+
+    return truncated
+
+
 @register.filter
 def check_platform(platform, user_platforms):
     """Filter to check if a platform is present in the user preferences."""
@@ -157,85 +175,45 @@ def bold_requirements(value):
 @register.filter
 def game_link(game_name):
     """This filter generates hyperlinks for games based on a provided game name.
-    It retrieves the closest match to the provided name from the database.
+    It retrieves the closest match to the provided name from the name index.
     """
-    game_titles = Game.objects.values_list("title", flat=True)
-    game_name_lower = game_name.lower()
-
     # Escape the game_name to prevent XSS
     escaped_game_name = escape(game_name)
 
-    # Find the closest match
-    closest_matches = difflib.get_close_matches(
-        game_name_lower, [title.lower() for title in game_titles], n=1, cutoff=0.70
-    )
-
-    if closest_matches:
-        closest_match = closest_matches[0]
-        try:
-            game = Game.objects.get(title__iexact=closest_match)
-            url = reverse("playstyle_compass:view_game", args=[game.guid])
-            # Return an escaped HTML anchor tag
-            return f'<a href="{escape(url)}">{escaped_game_name}</a>'
-        except Game.DoesNotExist:
-            return escaped_game_name
-    else:
+    guid = game_names.get().closest(game_name)
+    if guid is None:
         return escaped_game_name
 
+    url = reverse("playstyle_compass:view_game", args=[guid])
+    # Return an escaped HTML anchor tag
+    return f'<a href="{escape(url)}">{escaped_game_name}</a>'
+
 
 @register.filter
 def object_link(name, object_type):
     """This filter generates hyperlinks for objects
     based on a provided name and object type.
-    It retrieves the closest match to the provided name from the database
+    It retrieves the closest match to the provided name from the name index.
     """
-    name_lower = name.lower()
     escaped_name = escape(name)  # Escape the input name
 
     if object_type == "franchise":
-        titles = Franchise.objects.values_list("title", flat=True)
-        titles_lower = [title.lower() for title in titles]
+        name_index = franchise_names
         url_name = "playstyle_compass:franchise"
-        model = Franchise
     elif object_type == "character":
-        names = Character.objects.values_list("name", flat=True)
-        names_lower = [char_name.lower() for char_name in names]
+        name_index = character_names
         url_name = "playstyle_compass:character"
-        model = Character
     else:
         return escaped_name
 
-    closest_matches = difflib.get_close_matches(
-        name_lower,
-        titles_lower if object_type == "franchise" else names_lower,
-        n=1,
-        cutoff=0.70,
-    )
-
-    if closest_matches:
-        closest_match_lower = closest_matches[0]
-        try:
-            if object_type == "franchise":
-                closest_match = next(
-                    title for title in titles if title.lower() == closest_match_lower
-                )
-                obj = model.objects.get(title__iexact=closest_match)
-            else:
-                closest_match = next(
-                    char_name
-                    for char_name in names
-                    if char_name.lower() == closest_match_lower
-                )
-                obj = model.objects.get(name__iexact=closest_match)
-
-            url = reverse(url_name, args=[obj.id])
-            escaped_url = escape(url)  # Escape the URL
-            return f'<a href="{escaped_url}">{escaped_name}</a>'
-        except model.DoesNotExist:
-            return escaped_name
-    else:
+    object_id = name_index.get().closest(name)
+    if object_id is None:
         return escaped_name
 
+    url = reverse(url_name, args=[object_id])
+    escaped_url = escape(url)  # Escape the URL
+    return f'<a href="{escaped_url}">{escaped_name}</a>'
+
 
 @register.simple_tag
 def querystring_replace(request, **kwargs):
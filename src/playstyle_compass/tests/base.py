@@ -23,4 +23,17 @@ from playstyle_compass.views import (
     all_themes,
     game_style,
     connection_type,
-)
\ No newline at end of file
+)
+
+
+def create_game(guid, title, **fields):
+    defaults = {
+        "description": "",
+        "genres": "",
+        "platforms": "",
+        "concepts": "",
+        "image": "x.jpg",
+        "videos": "x.mp4",
+    }
+    defaults.update(fields)
+    return Game.objects.create(guid=guid, title=title, **defaults)
@@ -0,0 +1,86 @@
+from django.test import TestCase
+
+from playstyle_compass.models import Game
+from playstyle_compass.helper_functions.attribute_index import (
+    GameAttributeIndex,
+    game_attribute_index,
+)
+
+from .base import create_game
+
+
+class GameAttributeIndexTests(TestCase):
+    def setUp(self):
+        self.action = create_game(
+            "1",
+            "Action Game",
+            genres="Action, Role-Playing",
+            platforms="PC, PlayStation 5",
+            concepts="Split-Screen Multiplayer",
+        )
+        self.adventure = create_game(
+            "2",
+            "Adventure Game",
+            genres="Action-Adventure",
+            themes="Fantasy",
+            platforms="Xbox",
+            concepts="Online",
+        )
+        self.index = GameAttributeIndex.build()
+
+    def test_matches_tokens_case_insensitively(self):
+        self.assertEqual(
+            self.index.games_matching("genres", "role-playing"), {self.action.id}
+        )
+
+    def test_matches_substrings_like_icontains(self):
+        self.assertEqual(
+            self.index.games_matching("genres", "Action"),
+            {self.action.id, self.adventure.id},
+        )
+        self.assertEqual(
+            self.index.games_matching("concepts", "Multiplayer"), {self.action.id}
+        )
+
+    def test_blank_term_matches_games_with_a_value(self):
+        self.assertEqual(self.index.games_matching("themes", " "), {self.adventure.id})
+
+    def test_matching_any_unions_terms(self):
+        self.assertEqual(
+            self.index.games_matching_any("platforms", ["Xbox", "PC"]),
+            {self.action.id, self.adventure.id},
+        )
+
+    def test_unknown_term_matches_nothing(self):
+        self.assertEqual(self.index.games_matching("genres", "Puzzle"), set())
+
+
+class GameAttributeIndexSnapshotTests(TestCase):
+    def test_snapshot_rebuilt_after_game_save(self):
+        game = create_game("1", "Racer", genres="Driving/Racing")
+        self.assertEqual(
+            game_attribute_index.get().games_matching("genres", "Racing"), {game.id}
+        )
+
+        game.genres = "Sports"
+        game.save()
+
+        self.assertEqual(
+            game_attribute_index.get().games_matching("genres", "Racing"), set()
+        )
+
+    def test_snapshot_not_rebuilt_on_score_update(self):
+        create_game("1", "Racer", genres="Driving/Racing")
+        index = game_attribute_index.get()
+
+        Game.objects.get(guid="1").update_score()
+
+        self.assertIs(game_attribute_index.get(), index)
+
+    def test_snapshot_rebuilt_after_game_delete(self):
+        game = create_game("1", "Racer", genres="Driving/Racing")
+        game_attribute_index.get()
+
+        game.delete()
+
+        self.assertEqual(game_attribute_index.get().game_ids, set())
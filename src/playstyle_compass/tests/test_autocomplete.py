@@ -0,0 +1,145 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from playstyle_compass.models import Game
+from playstyle_compass.helper_functions.autocomplete import (
+    SUGGESTION_INDEXES,
+    PrefixIndex,
+    normalize,
+)
+from playstyle_compass.helper_functions.catalog_cache import CatalogSnapshot
+
+
+class PrefixIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = PrefixIndex(
+            [
+                ("The Witcher 3: Wild Hunt", 10),
+                ("Witcher", 0),
+                ("Switcheroo", 50),
+                ("Hollow Knight", 5),
+                ("Hollow Knight", 20),
+                ("Hogwarts Legacy", 30),
+            ]
+        )
+
+    def test_normalize(self):
+        self.assertEqual(
+            normalize("  The Witcher 3: Wild_Hunt "), "the witcher 3 wild hunt"
+        )
+
+    def test_matches_word_prefixes(self):
+        self.assertEqual(
+            self.index.suggest("witch"), ["Witcher", "The Witcher 3: Wild Hunt"]
+        )
+        self.assertEqual(
+            self.index.suggest("WITCHER 3 WILD"), ["The Witcher 3: Wild Hunt"]
+        )
+        self.assertEqual(self.index.suggest("itcher"), [])
+
+    def test_heavier_names_first(self):
+        self.assertEqual(self.index.suggest("ho"), ["Hogwarts Legacy", "Hollow Knight"])
+        self.assertEqual(self.index.suggest("ho", 1), ["Hogwarts Legacy"])
+
+    def test_duplicate_names_keep_highest_weight(self):
+        self.assertEqual(self.index.names.count("Hollow Knight"), 1)
+        self.assertEqual(
+            self.index.weights[self.index.names.index("Hollow Knight")], 20
+        )
+
+    def test_blank_prefix(self):
+        self.assertEqual(self.index.suggest(" : "), [])
+
+
+class CatalogSnapshotIntervalTests(TestCase):
+    def test_local_writes_invalidate_at_once(self):
+        snapshot = CatalogSnapshot(lambda: Game.objects.count(), [Game], 3600)
+        self.assertEqual(snapshot.get(), 0)
+
+        Game.objects.create(guid="1", title="Hollow Knight")
+
+        self.assertEqual(snapshot.get(), 1)
+
+    def test_version_checked_once_per_interval(self):
+        snapshot = CatalogSnapshot(lambda: Game.objects.count(), [Game], 3600)
+        snapshot.get()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO Games (guid, title, description, genres, platforms, "
+                "image, videos, concepts, is_casual, is_popular) "
+                "VALUES ('2', 'Silksong', '', '', '', '', '', '', 0, 0)"
+            )
+
+        self.assertEqual(snapshot.get(), 0)
+
+        with patch(
+            "playstyle_compass.helper_functions.catalog_cache.time.monotonic",
+            return_value=10**9,
+        ):
+            self.assertEqual(snapshot.get(), 1)
+
+
+    def test_apply_only_covers_the_local_write(self):
+        builds = []
+
+        def build_titles():
+            builds.append(1)
+            return set(Game.objects.values_list("title", flat=True))
+
+        def add_title(game):
+            return lambda titles: titles | {game.title}
+
+        snapshot = CatalogSnapshot(build_titles, [Game])
+        snapshot.get()
+
+        game = Game.objects.create(guid="1", title="Hollow Knight")
+        snapshot.apply(add_title(game), game)
+        self.assertEqual(snapshot.get(), {"Hollow Knight"})
+        self.assertEqual(len(builds), 1)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO Games (guid, title, description, genres, platforms, "
+                "image, videos, concepts, is_casual, is_popular) "
+                "VALUES ('2', 'Silksong', '', '', '', '', '', '', 0, 0)"
+            )
+        game = Game.objects.create(guid="3", title="Celeste")
+        snapshot.apply(add_title(game), game)
+
+        self.assertEqual(snapshot.get(), {"Hollow Knight", "Silksong", "Celeste"})
+        self.assertEqual(len(builds), 2)
+
+
+class AutocompleteResponseTests(TestCase):
+    def setUp(self):
+        Game.objects.create(guid="1", title="Hollow Knight")
+        popular = Game.objects.create(guid="2", title="Hogwarts Legacy")
+        Game.objects.filter(pk=popular.pk).update(is_popular=True)
+        SUGGESTION_INDEXES[Game][0].invalidate()
+        self.url = reverse("playstyle_compass:autocomplete")
+
+    def test_popular_games_first(self):
+        response = self.client.get(self.url, {"query": "ho"}, secure=True)
+
+        self.assertEqual(
+            response.json()["results"],
+            [{"title": "Hogwarts Legacy"}, {"title": "Hollow Knight"}],
+        )
+
+    def test_responses_are_cacheable(self):
+        response = self.client.get(self.url, {"query": "ho"}, secure=True)
+
+        self.assertIn("max-age=300", response["Cache-Control"])
+        self.assertIn("public", response["Cache-Control"])
+
+        cached = self.client.get(
+            self.url,
+            {"query": "ho"},
+            secure=True,
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(cached.status_code, 304)
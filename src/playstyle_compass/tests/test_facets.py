@@ -0,0 +1,66 @@
+from django.test import TestCase
+
+from playstyle_compass.models import Game
+from playstyle_compass.helper_functions.facets import (
+    GameFacets,
+    game_facets,
+    get_facet_counts,
+)
+
+
+class GameFacetsTests(TestCase):
+    def setUp(self):
+        self.action = Game.objects.create(
+            guid="1",
+            title="Action Game",
+            genres="Action, Role-Playing",
+            platforms="PC, PlayStation 5",
+            franchises="Souls",
+        )
+        self.puzzle = Game.objects.create(
+            guid="2",
+            title="Puzzle Game",
+            genres="Puzzle,Action",
+            platforms="PC",
+        )
+
+    def test_counts_every_distinct_value(self):
+        facets = GameFacets.build()
+
+        self.assertEqual(
+            facets.counts("genres"),
+            [("Action", 2), ("Puzzle", 1), ("Role-Playing", 1)],
+        )
+        self.assertEqual(facets.counts("franchises"), [("Souls", 1)])
+        self.assertEqual(facets.counts("themes"), [])
+
+    def test_filters_match_whole_values(self):
+        facets = GameFacets.build()
+
+        self.assertEqual(
+            facets.games_matching("platforms", "PC"), {self.action.id, self.puzzle.id}
+        )
+        self.assertEqual(facets.games_matching("platforms", "PlayStation"), set())
+        self.assertEqual(
+            facets.filtered_games(
+                {"genres": ["Puzzle"], "platforms": ["PlayStation 5"]}
+            ),
+            {self.action.id, self.puzzle.id},
+        )
+        self.assertIsNone(facets.filtered_games({"genres": [""], "themes": []}))
+
+    def test_counts_under_selected_filters(self):
+        counts = get_facet_counts({"genres": ["Puzzle"]})
+
+        self.assertEqual(
+            counts["genres"], [("Action", 1), ("Puzzle", 1), ("Role-Playing", 0)]
+        )
+        self.assertEqual(counts["platforms"], [("PC", 1), ("PlayStation 5", 0)])
+
+    def test_facets_rebuilt_after_catalog_change(self):
+        facets = game_facets.get()
+        self.assertIs(game_facets.get(), facets)
+
+        Game.objects.create(guid="3", title="Strategy Game", genres="Strategy")
+
+        self.assertIn(("Strategy", 1), game_facets.get().counts("genres"))
@@ -0,0 +1,78 @@
+from django.test import TestCase
+
+from playstyle_compass.api_filters import GameFilter
+from playstyle_compass.models import Game, Genre, FranchiseName
+from playstyle_compass.helper_functions.game_attributes import (
+    attribute_filter,
+    rebuild_game_attributes,
+    split_values,
+)
+from playstyle_compass.helper_functions.views_helpers import build_query
+
+
+class GameAttributeTests(TestCase):
+    def setUp(self):
+        self.action = Game.objects.create(
+            guid="1",
+            title="Action Game",
+            genres="Action, Role-Playing",
+            platforms="PC",
+            franchises="Souls",
+        )
+        self.adventure = Game.objects.create(
+            guid="2",
+            title="Adventure Game",
+            genres="Action-Adventure,Action-Adventure",
+            platforms="PC, PlayStation 5",
+        )
+
+    def test_split_values(self):
+        self.assertEqual(split_values("PC, PS5,PC, "), ["PC", "PS5"])
+        self.assertEqual(split_values(None), [])
+
+    def test_links_created_on_save(self):
+        self.assertEqual(
+            list(self.action.genre_tags.values_list("name", flat=True)),
+            ["Action", "Role-Playing"],
+        )
+        self.assertEqual(
+            list(self.adventure.genre_tags.values_list("name", flat=True)),
+            ["Action-Adventure"],
+        )
+        self.assertEqual(FranchiseName.objects.get().games.get(), self.action)
+
+    def test_links_follow_updated_columns(self):
+        self.action.genres = "Puzzle"
+        self.action.save(update_fields=["genres"])
+
+        self.assertEqual(
+            list(self.action.genre_tags.values_list("name", flat=True)), ["Puzzle"]
+        )
+        self.assertEqual(self.action.platform_tags.count(), 1)
+
+    def test_filter_matches_whole_values(self):
+        games = Game.objects.filter(attribute_filter("genres", ["Action"]))
+        self.assertEqual(list(games), [self.action])
+
+        games = Game.objects.filter(
+            attribute_filter("platforms", ["PC", "PlayStation 5"])
+        )
+        self.assertEqual(games.count(), 2)
+
+    def test_build_query_uses_join_tables(self):
+        query = build_query(
+            {"genres": ["Action"], "franchises": ["Souls"], "themes": [""]}
+        )
+
+        self.assertEqual(list(Game.objects.filter(query)), [self.action])
+
+    def test_api_filter_ignores_case(self):
+        games = GameFilter({"genres": "role-playing"}, queryset=Game.objects.all()).qs
+
+        self.assertEqual(list(games), [self.action])
+
+    def test_rebuild_restores_links(self):
+        Game.genre_tags.through.objects.all().delete()
+
+        self.assertEqual(rebuild_game_attributes(chunk_size=1), 2)
+        self.assertEqual(Genre.objects.get(name="Action").games.get(), self.action)
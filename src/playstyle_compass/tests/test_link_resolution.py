@@ -0,0 +1,149 @@
+from importlib import import_module
+from io import StringIO
+
+from django.apps import apps
+from django.core.management import call_command
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from playstyle_compass.models import Game, Franchise, Character
+from playstyle_compass.helper_functions.link_resolution import (
+    split_names,
+    update_resolved_links,
+)
+from playstyle_compass.templatetags.custom_filters import truncate_links
+
+
+class LinkHelperTests(SimpleTestCase):
+    def test_split_names(self):
+        self.assertEqual(split_names(" Doom , Quake"), ["Doom", "Quake"])
+        self.assertEqual(split_names(None), [])
+
+    def test_truncate_links(self):
+        links = [["Dark Souls", ["1"]], ["Hollow Knight", ["2"]]]
+
+        self.assertEqual(truncate_links(links, 4), links)
+        self.assertEqual(truncate_links(links, 3), [["Dark Souls", ["1"]], ["…", []]])
+        self.assertIsNone(truncate_links(None, 3))
+
+
+class ResolvedLinksTests(TestCase):
+    def setUp(self):
+        self.game = Game.objects.create(
+            guid="3030",
+            title="Dark Souls",
+            similar_games="Hollow Knight, Tetris",
+            dlcs="Artorias of the Abyss",
+            franchises="Souls",
+        )
+        self.similar_game = Game.objects.create(guid="3031", title="Hollow Knight")
+        self.franchise = Franchise.objects.create(title="Souls", games="Dark Souls")
+        self.other_franchise = Franchise.objects.create(title="Souls", games="")
+        self.character = Character.objects.create(
+            name="Solaire", first_game="Dark Souls", franchises="Souls"
+        )
+
+    def test_update_resolves_every_model(self):
+        self.assertEqual(update_resolved_links(), 5)
+
+        self.game.refresh_from_db()
+        self.assertEqual(
+            self.game.resolved_links,
+            {
+                "similar_games": [["Hollow Knight", ["3031"]], ["Tetris", []]],
+                "dlcs": [["Artorias of the Abyss", []]],
+                "franchises": [["Souls", [self.franchise.id, self.other_franchise.id]]],
+            },
+        )
+
+        self.franchise.refresh_from_db()
+        self.assertEqual(
+            self.franchise.resolved_links, {"games": [["Dark Souls", ["3030"]]]}
+        )
+
+        self.character.refresh_from_db()
+        self.assertEqual(
+            self.character.resolved_links["first_game"], [["Dark Souls", ["3030"]]]
+        )
+        self.assertEqual(self.character.resolved_links["friends"], [])
+
+    def test_command_resolves_links(self):
+        out = StringIO()
+
+        call_command("resolve_links", stdout=out)
+
+        self.assertIn("Resolved the links of 5 objects.", out.getvalue())
+        self.assertFalse(Game.objects.filter(resolved_links__isnull=True).exists())
+
+    def test_resolved_links_render_without_queries(self):
+        update_resolved_links()
+        game = Game.objects.get(pk=self.game.pk)
+        url = reverse("playstyle_compass:view_game", args=["3031"])
+
+        with self.assertNumQueries(0):
+            html = render_to_string(
+                "base/display_items.html",
+                {
+                    "items": game.similar_games,
+                    "links": game.resolved_links["similar_games"],
+                    "model_name": "Game",
+                    "view_name": "playstyle_compass:view_game",
+                },
+            )
+
+        self.assertIn(f'<a href="{url}">Hollow Knight</a>', html)
+        self.assertIn("Tetris", html)
+
+    def test_saves_resolve_their_own_links(self):
+        self.game.similar_games = "Hollow Knight"
+        self.game.save()
+
+        self.game.refresh_from_db()
+        self.assertEqual(
+            self.game.resolved_links["similar_games"], [["Hollow Knight", ["3031"]]]
+        )
+
+        self.character.friends = "Solaire"
+        self.character.save(update_fields=["friends"])
+
+        self.character.refresh_from_db()
+        self.assertEqual(
+            self.character.resolved_links["friends"],
+            [["Solaire", [self.character.id]]],
+        )
+
+    def test_migration_backfills_missing_links(self):
+        backfill = import_module(
+            "playstyle_compass.migrations.0013_backfill_resolved_links"
+        )
+        Character.objects.update(resolved_links=None)
+
+        backfill.backfill_resolved_links(apps, None)
+
+        self.character.refresh_from_db()
+        self.assertEqual(
+            self.character.resolved_links["franchises"],
+            [["Souls", [self.franchise.id, self.other_franchise.id]]],
+        )
+
+    def test_unresolved_links_fall_back_to_lookups(self):
+        Character.objects.update(resolved_links=None)
+        character = Character.objects.get(pk=self.character.pk)
+        url = reverse("playstyle_compass:franchise", args=[self.franchise.id])
+
+        # Rendered as the character page passes them, from a NULL column
+        for links in (
+            "character.resolved_links.franchises",
+            "character.resolved_links.franchises|truncate_links:60",
+        ):
+            html = Template(
+                "{% load custom_filters %}"
+                "{% include 'base/display_items.html' with "
+                f"items=character.franchises links={links} "
+                "model_name='Franchise' view_name='playstyle_compass:franchise' %}"
+            ).render(Context({"character": character}))
+
+            self.assertIn(f'<a href="{url}">Souls</a>', html)
+            self.assertNotIn("N/A", html)
@@ -0,0 +1,96 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from playstyle_compass.models import GameList, ListComment, ListReview, Poll
+
+User = get_user_model()
+
+
+class ListStatsTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", password="pass")
+        self.users = [
+            User.objects.create_user(username=f"user{number}", password="pass")
+            for number in range(3)
+        ]
+
+        self.game_list = GameList.objects.create(
+            owner=self.owner, title="Favorites", is_public=True
+        )
+        self.game_list.liked_by.add(*self.users)
+        self.game_list.shared_with.add(self.users[0])
+        self.game_list.favorites.add(*self.users[:2])
+        self.empty_list = GameList.objects.create(
+            owner=self.owner, title="Empty", is_public=True
+        )
+
+        self.review = ListReview.objects.create(
+            game_list=self.game_list, user=self.users[0], title="Great", rating=5
+        )
+        self.review.liked_by.add(*self.users[1:])
+
+    def test_annotated_counts_match_related_counts(self):
+        game_lists = {
+            game_list.pk: game_list for game_list in GameList.objects.with_stats()
+        }
+
+        with self.assertNumQueries(0):
+            game_list = game_lists[self.game_list.pk]
+            self.assertEqual(
+                (
+                    game_list.like_count,
+                    game_list.share_count,
+                    game_list.review_count,
+                    game_list.favorite_count,
+                ),
+                (3, 1, 1, 2),
+            )
+
+            empty_list = game_lists[self.empty_list.pk]
+            self.assertEqual((empty_list.like_count, empty_list.review_count), (0, 0))
+
+    def test_unannotated_objects_count_with_queries(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.game_list.like_count, 3)
+
+    def test_liked_objects_annotate_like_counts(self):
+        comment = ListComment.objects.create(
+            game_list=self.game_list, user=self.owner, text="Nice"
+        )
+        comment.liked_by.add(self.users[0])
+        poll = Poll.objects.create(title="Best game", created_by=self.owner)
+
+        review = ListReview.objects.with_stats().get()
+        comment = ListComment.objects.with_stats().get()
+        poll = Poll.objects.with_stats().get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                (review.like_count, comment.like_count, poll.like_count), (2, 1, 0)
+            )
+
+    def test_listing_counts_do_not_grow_with_lists(self):
+        self.client.login(username="owner", password="pass")
+        url = reverse("playstyle_compass:explore_game_lists")
+        self.client.get(url, secure=True)
+
+        with CaptureQueriesContext(connection) as few_lists:
+            response = self.client.get(url, secure=True)
+        self.assertEqual(response.status_code, 200)
+
+        for number in range(5):
+            game_list = GameList.objects.create(
+                owner=self.owner, title=f"List {number}", is_public=True
+            )
+            game_list.liked_by.add(self.users[0])
+
+        with CaptureQueriesContext(connection) as many_lists:
+            self.client.get(url, secure=True)
+
+        def count_queries(context):
+            return [query for query in context if "COUNT(" in query["sql"]]
+
+        self.assertEqual(len(count_queries(many_lists)), len(count_queries(few_lists)))
@@ -0,0 +1,98 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class ReviewReactionsMigrationTest(TransactionTestCase):
+    """Migrate the comma separated liked_by and disliked_by columns into
+    ReviewReaction rows with migration 0011."""
+
+    migrate_from = ("playstyle_compass", "0010_review_counters")
+    migrate_to = ("playstyle_compass", "0011_review_reactions")
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate([target])
+        return executor.loader.project_state([target]).apps
+
+    def setUp(self):
+        apps = self.migrate(self.migrate_from)
+        User = apps.get_model("auth", "User")
+        Game = apps.get_model("playstyle_compass", "Game")
+        Review = apps.get_model("playstyle_compass", "Review")
+
+        first = User.objects.create(username="first")
+        second = User.objects.create(username="second")
+        stale_id = second.id + 100
+        game = Game.objects.create(guid="1", title="Game")
+
+        def create_review(liked_by, disliked_by):
+            return Review.objects.create(
+                game=game,
+                reviewers="Reviewer",
+                review_deck="Deck",
+                review_description="Description",
+                score=5,
+                likes=7,
+                dislikes=7,
+                liked_by=liked_by,
+                disliked_by=disliked_by,
+            ).id
+
+        self.user_ids = (first.id, second.id)
+        self.reviews = {
+            "blank": create_review(None, ""),
+            "separators": create_review(" , ,", ","),
+            "duplicates": create_review(
+                f"{first.id},{first.id},{second.id},", f"{second.id},{second.id}"
+            ),
+            "stale": create_review(f"{stale_id},{first.id}", f"{stale_id},x,"),
+        }
+
+        self.apps = self.migrate(self.migrate_to)
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def reactions(self, name):
+        ReviewReaction = self.apps.get_model("playstyle_compass", "ReviewReaction")
+        return set(
+            ReviewReaction.objects.filter(review_id=self.reviews[name]).values_list(
+                "user_id", "reaction"
+            )
+        )
+
+    def counters(self, name):
+        Review = self.apps.get_model("playstyle_compass", "Review")
+        return Review.objects.values_list("likes", "dislikes").get(
+            id=self.reviews[name]
+        )
+
+    def test_blank_columns_have_no_reactions(self):
+        for name in ("blank", "separators"):
+            self.assertEqual(self.reactions(name), set())
+            self.assertEqual(self.counters(name), (0, 0))
+
+    def test_duplicate_ids_react_once(self):
+        first, second = self.user_ids
+
+        # The like wins over a dislike of the same user
+        self.assertEqual(
+            self.reactions("duplicates"), {(first, "like"), (second, "like")}
+        )
+        self.assertEqual(self.counters("duplicates"), (2, 0))
+
+    def test_stale_ids_are_skipped(self):
+        first, _ = self.user_ids
+
+        self.assertEqual(self.reactions("stale"), {(first, "like")})
+        self.assertEqual(self.counters("stale"), (1, 0))
+
+    def test_columns_are_dropped(self):
+        Review = self.apps.get_model("playstyle_compass", "Review")
+        fields = {field.name for field in Review._meta.get_fields()}
+
+        self.assertNotIn("liked_by", fields)
+        self.assertNotIn("disliked_by", fields)
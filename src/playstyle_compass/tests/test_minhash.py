@@ -0,0 +1,86 @@
+from io import StringIO
+
+import numpy as np
+from scipy import sparse
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from playstyle_compass.models import SimilarUser
+from playstyle_compass.helper_functions.minhash import MinHashLSH, optimal_bands
+
+
+class MinHashLSHTests(SimpleTestCase):
+    def test_bands_fit_in_signature(self):
+        bands, rows = optimal_bands(0.6, 128)
+
+        self.assertLessEqual(bands * rows, 128)
+        # The S-curve of the split rises around the threshold.
+        self.assertLess((1 / bands) ** (1 / rows), 0.7)
+        self.assertGreater((1 / bands) ** (1 / rows), 0.4)
+
+    def test_identical_sets_are_candidates(self):
+        index = MinHashLSH()
+        index.add("first", [1, 2, 3, 4, 5])
+        index.add("second", [6, 7, 8, 9, 10])
+
+        self.assertEqual(index.candidates([1, 2, 3, 4, 5]), {"first"})
+
+    def test_empty_sets_are_not_indexed(self):
+        index = MinHashLSH()
+        index.add("empty", [])
+
+        self.assertEqual(index.candidates([]), set())
+
+    def test_index_rows_of_matrix(self):
+        matrix = sparse.csr_matrix(
+            np.array([[1, 1, 1, 0], [1, 1, 1, 0], [0, 0, 0, 1]], dtype=np.int32)
+        )
+
+        index = MinHashLSH.from_matrix(matrix)
+
+        self.assertEqual(index.candidates([0, 1, 2]), {0, 1})
+
+
+class LSHRebuildTests(TestCase):
+    def setUp(self):
+        for username, history in (
+            ("first", "Doom, Quake"),
+            ("second", "Doom, Quake"),
+            ("third", "Tetris"),
+        ):
+            user = User.objects.create_user(username=username, password="pass")
+            user.userpreferences.gaming_history = history
+            user.userpreferences.favorite_genres = "Shooter"
+            user.userpreferences.themes = "Sci-Fi"
+            user.userpreferences.save()
+
+    def test_lsh_rebuild_matches_exact_rebuild(self):
+        expected = set(SimilarUser.objects.values_list("user", "similar_user", "kind"))
+
+        call_command("build_similar_users", "--lsh", stdout=StringIO())
+
+        self.assertEqual(
+            set(SimilarUser.objects.values_list("user", "similar_user", "kind")),
+            expected,
+        )
+
+    def test_benchmark_reports_every_dataset(self):
+        out = StringIO()
+
+        call_command("benchmark_similarity", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Users (playstyle): exact 2 pairs", output)
+        self.assertIn("Users (gaming_history): exact 2 pairs", output)
+        self.assertIn("Games: exact 0 pairs", output)
+
+    def test_user_threshold_option(self):
+        out = StringIO()
+
+        call_command("benchmark_similarity", "--user-threshold", "0.4", stdout=out)
+        call_command("build_similar_users", "--lsh", "--threshold", "0.4", stdout=out)
+
+        # The users who only share their genres and themes are similar too
+        self.assertIn("Users (playstyle): exact 6 pairs", out.getvalue())
+        self.assertEqual(SimilarUser.objects.filter(kind="playstyle").count(), 6)
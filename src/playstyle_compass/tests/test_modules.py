@@ -230,8 +230,6 @@ class ReviewModelTest(TestCase):
             score=4,
             likes=0,
             dislikes=0,
-            liked_by="",
-            disliked_by="",
             date_added=now(),
         )
 
@@ -248,19 +246,15 @@ class ReviewModelTest(TestCase):
         self.assertFalse(self.review.user_has_liked(user_id))
 
         # Add a like
-        self.review.add_like(user_id)
-        self.review.refresh_from_db()
+        self.assertEqual(
+            self.review.toggle_reaction(user_id, ReviewReaction.LIKE),
+            ReviewReaction.LIKE,
+        )
         self.assertEqual(self.review.likes, 1)
         self.assertTrue(self.review.user_has_liked(user_id))
-        self.assertIn(str(user_id), self.review.liked_by)
 
-        # Add like again should not increment
-        self.review.add_like(user_id)
-        self.review.refresh_from_db()
-        self.assertEqual(self.review.likes, 1)  # no double count
-
-        # Remove like
-        self.review.remove_like(user_id)
+        # Liking again removes the like
+        self.assertIsNone(self.review.toggle_reaction(user_id, ReviewReaction.LIKE))
         self.review.refresh_from_db()
         self.assertEqual(self.review.likes, 0)
         self.assertFalse(self.review.user_has_liked(user_id))
@@ -273,48 +267,56 @@ class ReviewModelTest(TestCase):
         self.assertFalse(self.review.user_has_disliked(user_id))
 
         # Add a dislike
-        self.review.add_dislike(user_id)
-        self.review.refresh_from_db()
+        self.review.toggle_reaction(user_id, ReviewReaction.DISLIKE)
         self.assertEqual(self.review.dislikes, 1)
         self.assertTrue(self.review.user_has_disliked(user_id))
-        self.assertIn(str(user_id), self.review.disliked_by)
 
-        # Add dislike again should not increment
-        self.review.add_dislike(user_id)
-        self.review.refresh_from_db()
-        self.assertEqual(self.review.dislikes, 1)  # no double count
-
-        # Remove dislike
-        self.review.remove_dislike(user_id)
+        # Disliking again removes the dislike
+        self.review.toggle_reaction(user_id, ReviewReaction.DISLIKE)
         self.review.refresh_from_db()
         self.assertEqual(self.review.dislikes, 0)
         self.assertFalse(self.review.user_has_disliked(user_id))
 
-    def test_save_updates_game_score(self):
-        # Mock the game's update_score method to track calls
-        called = []
+    def test_reaction_switches_between_like_and_dislike(self):
+        user_id = self.user.id
 
-        def mock_update_score():
-            called.append(True)
+        self.review.toggle_reaction(user_id, ReviewReaction.LIKE)
+        self.review.toggle_reaction(user_id, ReviewReaction.DISLIKE)
 
-        self.game.update_score = mock_update_score
+        self.assertEqual((self.review.likes, self.review.dislikes), (0, 1))
+        self.assertEqual(self.review.reactions.count(), 1)
+        self.assertTrue(self.review.user_has_disliked(user_id))
+        self.assertFalse(self.review.user_has_liked(user_id))
 
-        # Save review triggers game.update_score
-        self.review.save()
-        self.assertTrue(called)
+    def test_reactions_are_unique_per_user(self):
+        ReviewReaction.objects.create(
+            review=self.review, user=self.user, reaction=ReviewReaction.LIKE
+        )
 
-    def test_delete_updates_game_score(self):
-        # Mock the game's update_score method to track calls
-        called = []
+        with self.assertRaises(IntegrityError):
+            ReviewReaction.objects.create(
+                review=self.review, user=self.user, reaction=ReviewReaction.DISLIKE
+            )
 
-        def mock_update_score():
-            called.append(True)
+    def test_save_updates_game_score(self):
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_reviews, 1)
+        self.assertEqual(self.game.average_score, 4)
 
-        self.game.update_score = mock_update_score
+        # Changing the score applies the difference to the game's counters
+        self.review.score = 2
+        self.review.save()
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_reviews, 1)
+        self.assertEqual(self.game.score_total, 2)
+        self.assertEqual(self.game.average_score, 2)
 
-        # Delete review triggers game.update_score
+    def test_delete_updates_game_score(self):
         self.review.delete()
-        self.assertTrue(called)
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.total_reviews, 0)
+        self.assertEqual(self.game.score_total, 0)
+        self.assertEqual(self.game.average_score, 0)
 
 
 class FranchiseModelTest(TestCase):
@@ -804,8 +806,6 @@ class SharedReviewModelTest(TestCase):
             score=4,
             likes=0,
             dislikes=0,
-            liked_by="",
-            disliked_by="",
             date_added=now(),
         )
 
@@ -0,0 +1,82 @@
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from playstyle_compass.models import Game, Franchise, Character
+from playstyle_compass.helper_functions.name_index import NameIndex, game_names
+from playstyle_compass.templatetags.custom_filters import game_link, object_link
+
+
+class NameIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = NameIndex(
+            [
+                ("The Witcher 3: Wild Hunt", 1),
+                ("Dark Souls", 2),
+                ("dark souls", 3),
+                ("Hollow Knight", 4),
+            ]
+        )
+
+    def test_exact_match_ignores_case(self):
+        self.assertEqual(self.index.closest("HOLLOW KNIGHT"), 4)
+
+    def test_first_target_kept_for_duplicate_names(self):
+        self.assertEqual(self.index.closest("Dark Souls"), 2)
+
+    def test_fuzzy_match_uses_cutoff(self):
+        self.assertEqual(self.index.closest("Witcher 3: Wild Hunt"), 1)
+        self.assertEqual(self.index.closest("Hollow Knigt"), 4)
+        self.assertIsNone(self.index.closest("Stardew Valley"))
+
+
+class NameLinkFilterTests(TestCase):
+    def setUp(self):
+        self.game = Game.objects.create(guid="3030", title="Hollow Knight")
+        self.franchise = Franchise.objects.create(title="Dark Souls", games="")
+        self.character = Character.objects.create(name="Geralt of Rivia")
+
+    def test_game_link(self):
+        url = reverse("playstyle_compass:view_game", args=[self.game.guid])
+
+        self.assertEqual(game_link("Hollow Knigt"), f'<a href="{url}">Hollow Knigt</a>')
+        self.assertEqual(game_link("<b>Tetris</b>"), "&lt;b&gt;Tetris&lt;/b&gt;")
+
+    def test_object_link(self):
+        franchise_url = reverse("playstyle_compass:franchise", args=[self.franchise.id])
+        character_url = reverse("playstyle_compass:character", args=[self.character.id])
+
+        self.assertEqual(
+            object_link("dark souls", "franchise"),
+            f'<a href="{franchise_url}">dark souls</a>',
+        )
+        self.assertEqual(object_link("Geralt", "character"), "Geralt")
+        self.assertEqual(
+            object_link("Geralt of Rivia", "character"),
+            f'<a href="{character_url}">Geralt of Rivia</a>',
+        )
+
+    def test_links_do_not_query_within_refresh_interval(self):
+        game_link("Hollow Knight")
+        object_link("Dark Souls", "franchise")
+
+        with self.assertNumQueries(0):
+            for _ in range(5):
+                game_link("Hollow Knight")
+                object_link("Dark Souls", "franchise")
+
+    def test_index_rebuilt_after_save(self):
+        self.assertIsNone(game_names.get().closest("Silksong"))
+
+        Game.objects.create(guid="3031", title="Silksong")
+
+        self.assertEqual(game_names.get().closest("Silksong"), "3031")
+
+    def test_object_index_rebuilt_after_save(self):
+        self.assertEqual(object_link("Malenia", "character"), "Malenia")
+
+        character = Character.objects.create(name="Malenia")
+
+        self.assertIn(
+            reverse("playstyle_compass:character", args=[character.id]),
+            object_link("Malenia", "character"),
+        )
@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from playstyle_compass.models import Poll, PollOption, Vote
+from playstyle_compass.helper_functions.poll_results import (
+    get_poll_results,
+    polls_with_results,
+)
+
+User = get_user_model()
+
+
+class PollResultsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="voter", password="pass")
+        self.other = User.objects.create_user(username="other", password="pass")
+
+        self.ended = self.poll("Ended", days_ago=8)
+        self.active = self.poll("Active", days_ago=1)
+
+        self.ended_options = self.options(self.ended, "A", "B")
+        self.active_options = self.options(self.active, "C", "D")
+
+        Vote.objects.create(
+            poll=self.ended, option=self.ended_options[0], user=self.user
+        )
+        Vote.objects.create(
+            poll=self.ended, option=self.ended_options[1], user=self.other
+        )
+        Vote.objects.create(
+            poll=self.active, option=self.active_options[1], user=self.other
+        )
+
+    def poll(self, title, days_ago):
+        poll = Poll.objects.create(
+            title=title, created_by=self.user, duration=timedelta(days=7)
+        )
+        Poll.objects.filter(id=poll.id).update(
+            created_at=timezone.now() - timedelta(days=days_ago)
+        )
+        poll.refresh_from_db()
+        return poll
+
+    def options(self, poll, *texts):
+        return [PollOption.objects.create(poll=poll, text=text) for text in texts]
+
+    def percentages(self, poll_results):
+        return [
+            (option["option"].text, option["percentage"])
+            for option in poll_results["options_with_percentages"]
+        ]
+
+    def test_ended_filters_polls_in_sql(self):
+        self.assertEqual(list(Poll.objects.ended()), [self.ended])
+
+    def test_results_match_poll_methods(self):
+        results = get_poll_results([self.ended, self.active])
+
+        for poll in (self.ended, self.active):
+            self.assertEqual(results[poll.id]["total_votes"], poll.total_votes())
+            self.assertEqual(
+                self.percentages(results[poll.id]),
+                [
+                    (option["option"].text, option["percentage"])
+                    for option in poll.options_with_percentages()
+                ],
+            )
+
+        self.assertEqual(
+            self.percentages(results[self.ended.id]), [("A", 50.0), ("B", 50.0)]
+        )
+
+    def test_page_results_take_two_queries(self):
+        polls = [self.poll(f"Poll {number}", days_ago=1) for number in range(5)]
+
+        # One grouped count of the votes, one lookup of the viewer's votes
+        with self.assertNumQueries(2):
+            polls_with_data, user_votes = polls_with_results(polls, self.user)
+
+        self.assertEqual(len(polls_with_data), 5)
+        self.assertEqual(user_votes, {})
+
+    def test_ended_poll_results_are_cached(self):
+        get_poll_results([self.ended, self.active])
+
+        with self.assertNumQueries(0):
+            get_poll_results([self.ended])
+
+        with self.assertNumQueries(1):
+            get_poll_results([self.active])
+
+    def test_vote_changes_drop_cached_results(self):
+        get_poll_results([self.ended])
+        Vote.objects.filter(user=self.other).delete()
+
+        results = get_poll_results([self.ended])
+        self.assertEqual(results[self.ended.id]["total_votes"], 1)
+
+    def test_user_votes(self):
+        _, user_votes = polls_with_results([self.ended, self.active], self.user)
+        self.assertEqual(user_votes, {self.ended.id: self.ended_options[0].id})
+
+        _, user_votes = polls_with_results([self.ended], AnonymousUser())
+        self.assertEqual(user_votes, {})
+
+    def test_completed_polls_fill_pages_with_ended_polls(self):
+        for number in range(10):
+            self.poll(f"Active {number}", days_ago=0)
+
+        self.client.login(username="voter", password="pass")
+        response = self.client.get(
+            reverse("playstyle_compass:completed_polls"), secure=True
+        )
+
+        polls = [data["poll"] for data in response.context["polls_with_data"]]
+        self.assertEqual(polls, [self.ended])
+        self.assertEqual(response.context["polls"].paginator.num_pages, 1)
@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import tempfile
+from contextlib import redirect_stdout
+from importlib.util import module_from_spec, spec_from_file_location
+from io import StringIO
+from unittest import skipUnless
+
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+
+
+def load_populate_db():
+    path = os.path.join(settings.BASE_DIR, "utils", "populate_db.py")
+    spec = spec_from_file_location("populate_db", path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@skipUnless(connection.vendor == "sqlite", "The loader writes SQLite files")
+class PopulateDbTests(TestCase):
+    """Run utils/populate_db.py against a copy of the migrated schema."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "playstyle_db.sqlite3")
+
+        # A copy of the migrated test database, with its search tables
+        connection.ensure_connection()
+        database = sqlite3.connect(self.path)
+        connection.connection.backup(database)
+        # Only user 3 of the reacting users exists
+        database.execute(
+            "INSERT INTO auth_user (id, password, is_superuser, username, "
+            "first_name, last_name, email, is_staff, is_active, date_joined) "
+            "VALUES (3, '', 0, 'reviewer', '', '', '', 0, 1, '2025-01-01')"
+        )
+        database.commit()
+        database.close()
+
+        self.populate = load_populate_db().populate
+
+    def run_loader(self):
+        with redirect_stdout(StringIO()):
+            return self.populate(self.path)
+
+    def query(self, sql, *params):
+        database = sqlite3.connect(self.path)
+        self.addCleanup(database.close)
+        return database.execute(sql, params).fetchall()
+
+    def test_reviews_and_reactions_are_loaded(self):
+        self.assertGreater(self.run_loader(), 0)
+
+        self.assertGreater(self.query("SELECT COUNT(*) FROM Reviews")[0][0], 0)
+        self.assertEqual(
+            self.query("SELECT DISTINCT user_id FROM ReviewReactions"), [(3,)]
+        )
+        self.assertEqual(
+            self.query(
+                "SELECT review_id, reaction FROM ReviewReactions WHERE review_id < 4 "
+                "ORDER BY review_id"
+            ),
+            [(1, "dislike"), (2, "like"), (3, "dislike")],
+        )
+
+    def test_counters_follow_the_loaded_reactions(self):
+        self.run_loader()
+
+        self.assertEqual(
+            self.query("SELECT likes, dislikes FROM Reviews WHERE id IN (2, 129)"),
+            [(1, 0), (0, 0)],
+        )
+
+    def test_loading_again_inserts_nothing(self):
+        self.run_loader()
+
+        self.assertEqual(self.run_loader(), 0)
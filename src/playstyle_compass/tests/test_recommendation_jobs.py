@@ -0,0 +1,201 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.db.models.query import QuerySet
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from playstyle_compass.models import Game, RecommendationJob, UserRecommendations
+from playstyle_compass.helper_functions.recommendation_jobs import (
+    JOB_TIMEOUT,
+    MAX_ATTEMPTS,
+    STATUS_TIMEOUT,
+    claim_next_job,
+    enqueue_recommendation_job,
+    get_recommendation_status,
+    request_recommendation_refresh,
+    run_job,
+)
+
+
+class RecommendationJobQueueTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="pass")
+        self.preferences = self.user.userpreferences
+        self.preferences.gaming_history = "Alpha Quest"
+        self.preferences.favorite_genres = "Action"
+        self.preferences.save()
+
+        Game.objects.create(
+            guid="1",
+            title="Alpha Quest",
+            genres="Action",
+            platforms="PC",
+            release_date="2020-01-01",
+        )
+
+    def test_pending_jobs_are_not_duplicated(self):
+        first = enqueue_recommendation_job(self.user.id)
+        second = enqueue_recommendation_job(self.user.id)
+
+        self.assertEqual(first, second)
+        self.assertEqual(RecommendationJob.objects.count(), 1)
+
+    def test_database_rejects_duplicate_pending_jobs(self):
+        RecommendationJob.objects.create(user=self.user)
+        RecommendationJob.objects.create(user=self.user, status="done")
+        RecommendationJob.objects.create()
+
+        for user in (self.user, None):
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                RecommendationJob.objects.create(user=user)
+
+    def test_concurrently_queued_job_is_reused(self):
+        queued = RecommendationJob.objects.create(user=self.user)
+        first = QuerySet.first
+        lookups = []
+
+        def first_after_race(queryset):
+            # The first lookup runs before the other request commits its job
+            lookups.append(queryset)
+            return None if len(lookups) == 1 else first(queryset)
+
+        with patch.object(QuerySet, "first", first_after_race):
+            job = enqueue_recommendation_job(self.user.id)
+
+        self.assertEqual(job, queued)
+        self.assertEqual(RecommendationJob.objects.count(), 1)
+
+    @override_settings(RECOMMENDATION_WORKER=False)
+    def test_refresh_is_not_queued_without_worker(self):
+        request_recommendation_refresh(self.user.id)
+
+        self.assertFalse(RecommendationJob.objects.exists())
+
+    def test_claimed_job_is_not_claimed_again(self):
+        enqueue_recommendation_job(self.user.id)
+
+        job = claim_next_job()
+
+        self.assertEqual(job.status, "running")
+        self.assertIsNotNone(job.started_at)
+        self.assertIsNone(claim_next_job())
+
+    def test_user_job_stores_recommendations(self):
+        enqueue_recommendation_job(self.user.id)
+
+        job = run_job(claim_next_job())
+
+        self.assertEqual(job.status, "done")
+        self.assertIsNotNone(job.finished_at)
+        self.assertTrue(UserRecommendations.objects.filter(user=self.user).exists())
+        self.assertEqual(get_recommendation_status(self.preferences), "ready")
+
+    def test_catalog_job_queues_users_with_stored_results(self):
+        UserRecommendations.objects.create(user=self.user)
+        enqueue_recommendation_job()
+
+        run_job(claim_next_job())
+
+        self.assertTrue(
+            RecommendationJob.objects.filter(user=self.user, status="pending").exists()
+        )
+
+    def abandon(self, job, attempts=1):
+        """Make a claimed job look like its worker stopped long ago."""
+        started_at = timezone.now() - timedelta(seconds=JOB_TIMEOUT + 1)
+        RecommendationJob.objects.filter(pk=job.pk).update(
+            started_at=started_at, attempts=attempts
+        )
+        job.started_at, job.attempts = started_at, attempts
+
+    @patch(
+        "playstyle_compass.helper_functions.recommendation_jobs.compute_recommendations",
+        side_effect=RuntimeError("engine error"),
+    )
+    def test_failed_job_is_retried_then_records_error(self, mock_compute):
+        enqueue_recommendation_job(self.user.id)
+
+        for attempt in range(1, MAX_ATTEMPTS):
+            job = run_job(claim_next_job())
+            self.assertEqual((job.status, job.attempts), ("pending", attempt))
+            self.assertEqual(get_recommendation_status(self.preferences), "pending")
+
+        job = run_job(claim_next_job())
+
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.error, "engine error")
+        self.assertIsNone(claim_next_job())
+        self.assertEqual(mock_compute.call_count, MAX_ATTEMPTS)
+        self.assertEqual(get_recommendation_status(self.preferences), "failed")
+
+    @patch(
+        "playstyle_compass.helper_functions.recommendation_jobs.compute_recommendations",
+        side_effect=RuntimeError("engine error"),
+    )
+    def test_failed_job_is_not_retried_over_newer_job(self, mock_compute):
+        enqueue_recommendation_job(self.user.id)
+        job = claim_next_job()
+        newer = enqueue_recommendation_job(self.user.id)
+
+        run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(claim_next_job(), newer)
+
+    def test_abandoned_job_is_claimed_again(self):
+        enqueue_recommendation_job(self.user.id)
+        job = claim_next_job()
+        self.assertIsNone(claim_next_job())
+
+        self.abandon(job)
+        reclaimed = claim_next_job()
+
+        self.assertEqual((reclaimed.pk, reclaimed.attempts), (job.pk, 2))
+        self.assertGreater(reclaimed.started_at, job.started_at)
+
+        # The stopped worker no longer records its outcome
+        run_job(job)
+        self.assertEqual(RecommendationJob.objects.get().status, "running")
+
+        self.assertEqual(run_job(reclaimed).status, "done")
+
+    def test_abandoned_last_attempt_fails(self):
+        enqueue_recommendation_job(self.user.id)
+        self.abandon(claim_next_job(), attempts=MAX_ATTEMPTS)
+
+        self.assertIsNone(claim_next_job())
+
+        job = RecommendationJob.objects.get()
+        self.assertEqual((job.status, job.error), ("failed", "Timed out."))
+
+    def test_status_times_out_for_long_queued_job(self):
+        job = enqueue_recommendation_job(self.user.id)
+        self.assertEqual(get_recommendation_status(self.preferences), "pending")
+
+        RecommendationJob.objects.filter(pk=job.pk).update(
+            created_at=timezone.now() - timedelta(seconds=STATUS_TIMEOUT + 1)
+        )
+
+        self.assertEqual(get_recommendation_status(self.preferences), "timeout")
+
+    def test_status_queues_job_for_missing_results(self):
+        self.assertEqual(get_recommendation_status(self.preferences), "pending")
+        self.assertTrue(
+            RecommendationJob.objects.filter(user=self.user, status="pending").exists()
+        )
+
+    def test_worker_command_processes_queue(self):
+        enqueue_recommendation_job(self.user.id)
+        out = StringIO()
+
+        call_command("run_recommendation_worker", "--once", stdout=out)
+
+        self.assertIn("Processed 1 job(s).", out.getvalue())
+        self.assertEqual(RecommendationJob.objects.get().status, "done")
+        self.assertEqual(get_recommendation_status(self.preferences), "ready")
@@ -0,0 +1,116 @@
+from functools import partial
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase, RequestFactory
+
+from playstyle_compass.models import Game, UserRecommendations
+from playstyle_compass.helper_functions.recommendation_store import (
+    RECOMMENDATION_CATEGORIES,
+    get_user_recommendations,
+    paginate_recommendations,
+    preferences_fingerprint,
+)
+
+from .base import create_game
+
+
+# The attributes the games share with the user's preferences.
+create_matching_game = partial(
+    create_game,
+    genres="Action",
+    platforms="PC",
+    themes="Fantasy",
+    release_date="2020-01-01",
+)
+
+
+class UserRecommendationsStoreTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username="testuser", password="pass")
+        self.preferences = self.user.userpreferences
+        self.preferences.gaming_history = "Alpha Quest"
+        self.preferences.favorite_genres = "Action"
+        self.preferences.themes = "Fantasy"
+        self.preferences.platforms = "PC"
+        self.preferences.save()
+
+        self.alpha = create_matching_game("1", "Alpha Quest")
+        self.beta = create_matching_game("2", "Beta Quest")
+
+    def test_results_are_stored_for_every_category(self):
+        recommendations = get_user_recommendations(self.preferences)
+
+        self.assertEqual(set(recommendations.games), set(RECOMMENDATION_CATEGORIES))
+        self.assertEqual(
+            recommendations.games["favorite_genres"], [self.alpha.id, self.beta.id]
+        )
+        self.assertEqual(
+            recommendations.preferences_fingerprint,
+            preferences_fingerprint(self.preferences),
+        )
+
+    @patch(
+        "playstyle_compass.helper_functions.recommendation_store.RecommendationEngine"
+    )
+    def test_fresh_results_are_reused(self, mock_engine_class):
+        mock_engine_class.return_value.matching_games = {}
+        get_user_recommendations(self.preferences)
+        get_user_recommendations(self.preferences)
+
+        self.assertEqual(mock_engine_class.call_count, 1)
+
+    def test_results_recomputed_when_preferences_change(self):
+        get_user_recommendations(self.preferences)
+
+        self.preferences.favorite_genres = "Puzzle"
+        self.preferences.save()
+        recommendations = get_user_recommendations(self.preferences)
+
+        self.assertEqual(recommendations.games["favorite_genres"], [])
+
+    def test_results_recomputed_when_games_are_added(self):
+        get_user_recommendations(self.preferences)
+
+        gamma = create_matching_game("3", "Gamma Quest")
+        recommendations = get_user_recommendations(self.preferences)
+
+        self.assertIn(gamma.id, recommendations.games["favorite_genres"])
+        self.assertEqual(UserRecommendations.objects.count(), 1)
+
+    def test_recommended_order_is_kept_when_paginating(self):
+        recommendations = get_user_recommendations(self.preferences)
+        recommendations.games["favorite_genres"] = [self.beta.id, self.alpha.id]
+
+        pages = paginate_recommendations(self.factory.get("/"), recommendations)
+
+        self.assertEqual(
+            list(pages["favorite_genres"].object_list), [self.beta, self.alpha]
+        )
+
+    def test_sorting_is_applied_to_stored_ids(self):
+        Game.objects.filter(id=self.alpha.id).update(average_score=2)
+        Game.objects.filter(id=self.beta.id).update(average_score=5)
+        recommendations = get_user_recommendations(self.preferences)
+
+        pages = paginate_recommendations(
+            self.factory.get("/", {"sort": "score_desc"}), recommendations
+        )
+
+        self.assertEqual(
+            list(pages["favorite_genres"].object_list), [self.beta, self.alpha]
+        )
+
+    def test_category_pages_are_independent(self):
+        for number in range(3, 15):
+            create_matching_game(str(number), f"Quest {number:02d}")
+        recommendations = get_user_recommendations(self.preferences)
+
+        pages = paginate_recommendations(
+            self.factory.get("/", {"favorite_genres_page": 2}), recommendations
+        )
+
+        self.assertEqual(pages["favorite_genres"].number, 2)
+        self.assertEqual(len(pages["favorite_genres"].object_list), 4)
+        self.assertEqual(pages["themes"].number, 1)
@@ -0,0 +1,113 @@
+from datetime import timedelta, timezone
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.timezone import now
+
+from playstyle_compass.models import Game, Review
+from playstyle_compass.helper_functions.review_pages import (
+    decode_cursor,
+    get_review_page,
+)
+
+User = get_user_model()
+
+
+class ReviewPagesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.game = Game.objects.create(guid="42", title="Alpha")
+        self.user = User.objects.create_user(username="reviewer", password="pass")
+        start = now() - timedelta(days=30)
+
+        # Two reviews share a date to exercise the id tie breaker
+        self.reviews = [
+            Review.objects.create(
+                game=self.game,
+                user=self.user,
+                reviewers=f"Reviewer {number}",
+                score=3,
+                date_added=start + timedelta(days=min(number, 10)),
+            )
+            for number in range(12)
+        ]
+
+    def test_cursor_pages_cover_every_review_once(self):
+        reviews, cursor = get_review_page("42")
+        self.assertEqual(len(reviews), 10)
+        self.assertIsNotNone(cursor)
+
+        rest, last_cursor = get_review_page("42", cursor)
+        self.assertIsNone(last_cursor)
+
+        ids = [review["id"] for review in reviews + rest]
+        expected = sorted(
+            self.reviews, key=lambda review: (review.date_added, review.id)
+        )
+        self.assertEqual(ids, [review.id for review in reversed(expected)])
+
+    def test_pages_are_cached(self):
+        get_review_page("42")
+
+        with self.assertNumQueries(0):
+            get_review_page("42")
+
+    def test_review_writes_invalidate_pages(self):
+        reviews, _ = get_review_page("42")
+        newest = Review.objects.get(id=reviews[0]["id"])
+
+        newest.review_deck = "Edited"
+        newest.save()
+        reviews, _ = get_review_page("42")
+        self.assertEqual(reviews[0]["title"], "Edited")
+
+        newest.delete()
+        reviews, _ = get_review_page("42")
+        self.assertNotIn(newest.id, [review["id"] for review in reviews])
+
+    def test_likes_invalidate_pages(self):
+        liker = User.objects.create_user(username="liker", password="pass")
+        reviews, _ = get_review_page("42")
+        self.client.login(username="liker", password="pass")
+
+        self.client.post(
+            reverse("playstyle_compass:like"),
+            {"review_id": reviews[0]["id"]},
+            secure=True,
+        )
+
+        response = self.client.get(
+            reverse("playstyle_compass:get_game_reviews", args=[42]), secure=True
+        )
+        first = response.json()["reviews"][0]
+        self.assertEqual((first["likes"], first["liked"]), (1, True))
+        self.assertEqual(liker.review_reactions.count(), 1)
+
+    def test_invalid_cursor_returns_first_page(self):
+        self.assertIsNone(decode_cursor("not-a-cursor"))
+        self.assertEqual(get_review_page("42", "not-a-cursor"), get_review_page("42"))
+
+    def test_cursor_without_offset_is_utc(self):
+        _, cursor = get_review_page("42")
+        date_added, review_id = decode_cursor(cursor)
+        naive = date_added.astimezone(timezone.utc).replace(tzinfo=None)
+
+        self.assertEqual(
+            decode_cursor(f"{naive.isoformat()}_{review_id}"), (date_added, review_id)
+        )
+        self.assertEqual(
+            get_review_page("42", f"{naive.isoformat()}_{review_id}"),
+            get_review_page("42", cursor),
+        )
+
+    def test_view_returns_next_cursor(self):
+        url = reverse("playstyle_compass:get_game_reviews", args=[42])
+
+        data = self.client.get(url, secure=True).json()
+        self.assertEqual(len(data["reviews"]), 10)
+
+        data = self.client.get(url, {"cursor": data["next_cursor"]}, secure=True).json()
+        self.assertEqual(len(data["reviews"]), 2)
+        self.assertIsNone(data["next_cursor"])
@@ -0,0 +1,145 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from playstyle_compass.models import Game, Review
+from playstyle_compass.helper_functions import review_scores
+from playstyle_compass.helper_functions.review_scores import (
+    deferred_score_updates,
+    recompute_scores,
+)
+
+
+class ReviewCountersTests(TestCase):
+    def setUp(self):
+        self.game = Game.objects.create(guid="1", title="Alpha")
+        self.other = Game.objects.create(guid="2", title="Beta")
+
+    def review(self, score, game=None):
+        return Review.objects.create(game=game or self.game, score=score)
+
+    def assertCounters(self, game, total_reviews, score_total, average_score):
+        game.refresh_from_db()
+        self.assertEqual(
+            (game.total_reviews, game.score_total, game.average_score),
+            (total_reviews, score_total, average_score),
+        )
+
+    def test_reviews_update_running_counters(self):
+        self.review(5)
+        review = self.review(2)
+        self.assertCounters(self.game, 2, 7, 3.5)
+
+        review.score = 4
+        review.save()
+        self.assertCounters(self.game, 2, 9, 4.5)
+
+        review.delete()
+        self.assertCounters(self.game, 1, 5, 5.0)
+
+    def test_unchanged_score_does_not_touch_game(self):
+        review = self.review(3)
+        review = Review.objects.get(pk=review.pk)
+        review.review_deck = "Edited"
+
+        # Only the review is written
+        with self.assertNumQueries(1):
+            review.save()
+
+    def test_moving_a_review_updates_both_games(self):
+        review = self.review(4)
+        review = Review.objects.get(pk=review.pk)
+        review.game = self.other
+        review.save()
+
+        self.assertCounters(self.game, 0, 0, 0.0)
+        self.assertCounters(self.other, 1, 4, 4.0)
+
+    def test_queryset_delete_updates_counters(self):
+        self.review(1)
+        self.review(5)
+        Review.objects.filter(score=1).delete()
+
+        self.assertCounters(self.game, 1, 5, 5.0)
+
+    def test_deferred_updates_recompute_each_game_once(self):
+        with deferred_score_updates():
+            with self.assertNumQueries(4):
+                for score in (1, 2, 3, 4):
+                    self.review(score)
+            self.review(5, game=self.other)
+
+            self.assertCounters(self.game, 0, 0, 0.0)
+
+        self.assertCounters(self.game, 4, 10, 2.5)
+        self.assertCounters(self.other, 1, 5, 5.0)
+
+    def test_recompute_scores_repairs_counters(self):
+        self.review(3)
+        Game.objects.update(total_reviews=7, score_total=1, average_score=0.5)
+
+        self.assertEqual(recompute_scores(["1"]), 1)
+        self.assertCounters(self.game, 1, 3, 3.0)
+        self.assertCounters(self.other, 7, 1, 0.5)
+
+    def test_recompute_scores_command(self):
+        self.review(2)
+        Game.objects.update(total_reviews=None, score_total=0, average_score=None)
+
+        out = StringIO()
+        call_command("recompute_scores", stdout=out)
+
+        self.assertIn("Recomputed the scores of 2 games.", out.getvalue())
+        self.assertCounters(self.game, 1, 2, 2.0)
+        self.assertCounters(self.other, 0, 0, 0.0)
+
+
+class BulkReviewDeletesTests(TestCase):
+    """Deleting many reviews recomputes each of their games once."""
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="StrongPass123!"
+        )
+        for guid in ("1", "2"):
+            game = Game.objects.create(guid=guid, title=f"Game {guid}")
+            for score in (2, 4):
+                Review.objects.create(game=game, score=score)
+        self.kept = Review.objects.create(game_id="1", score=5)
+
+        self.recompute = patch.object(
+            review_scores, "recompute_scores", wraps=recompute_scores
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    def assertRecomputedOnce(self):
+        self.recompute.assert_called_once_with({"1", "2"})
+        counters = Game.objects.order_by("guid").values_list(
+            "total_reviews", "score_total", "average_score"
+        )
+        self.assertEqual(list(counters), [(1, 5, 5.0), (0, 0, 0.0)])
+
+    def test_queryset_delete(self):
+        Review.objects.exclude(pk=self.kept.pk).delete()
+
+        self.assertRecomputedOnce()
+
+    def test_admin_delete_selected(self):
+        self.client.login(username="admin", password="StrongPass123!")
+        reviews = Review.objects.exclude(pk=self.kept.pk).values_list("id", flat=True)
+        response = self.client.post(
+            reverse("admin:playstyle_compass_review_changelist"),
+            {
+                "action": "delete_selected",
+                "_selected_action": list(reviews),
+                "post": "yes",
+            },
+            secure=True,
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertRecomputedOnce()
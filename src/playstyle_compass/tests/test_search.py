@@ -0,0 +1,96 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from playstyle_compass.models import Game, Franchise, Character
+from playstyle_compass.helper_functions.autocomplete import SUGGESTIONS_LIMIT
+from playstyle_compass.helper_functions.search import (
+    SearchBackend,
+    SQLiteSearchBackend,
+    get_search_backend,
+)
+
+
+class SearchBackendTests(TestCase):
+    def setUp(self):
+        for guid, title in (
+            ("1", "The Witcher III"),
+            ("2", "Witcher"),
+            ("3", "Switcheroo"),
+            ("4", "Hollow Knight"),
+        ):
+            Game.objects.create(guid=guid, title=title)
+
+    def search(self, backend, query, model=Game, field="title"):
+        return list(backend.search(model, query).values_list(field, flat=True))
+
+    def test_sqlite_backend_used_by_default(self):
+        self.assertIsInstance(get_search_backend(), SQLiteSearchBackend)
+
+    @override_settings(
+        SEARCH_BACKEND="playstyle_compass.helper_functions.search.SearchBackend"
+    )
+    def test_backend_set_in_settings(self):
+        self.assertIs(type(get_search_backend()), SearchBackend)
+
+    def test_results_ranked_by_relevance(self):
+        for backend in (SearchBackend(), SQLiteSearchBackend()):
+            self.assertEqual(
+                self.search(backend, "witch"),
+                ["Witcher", "The Witcher III", "Switcheroo"],
+            )
+
+    def test_short_queries_scan_names(self):
+        self.assertEqual(self.search(SQLiteSearchBackend(), "Ho"), ["Hollow Knight"])
+
+    def test_empty_query_matches_everything(self):
+        self.assertEqual(get_search_backend().search(Game, "").count(), 4)
+
+    def test_raw_inserts_and_updates_are_indexed(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO Characters (name, first_game) VALUES ('Geralt of Rivia', '')"
+            )
+        self.assertEqual(
+            self.search(get_search_backend(), "rivia", Character, "name"),
+            ["Geralt of Rivia"],
+        )
+
+        Character.objects.filter(name="Geralt of Rivia").update(name="Ciri")
+        self.assertEqual(
+            self.search(get_search_backend(), "rivia", Character, "name"), []
+        )
+
+    def test_quotes_in_queries(self):
+        Franchise.objects.create(title='The "Souls" Series', games="")
+
+        self.assertEqual(
+            self.search(get_search_backend(), '"Souls"', Franchise),
+            ['The "Souls" Series'],
+        )
+
+    def test_benchmark_reports_every_model(self):
+        out = StringIO()
+
+        call_command("benchmark_search", "--queries", "5", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Backend: SQLiteSearchBackend", output)
+        self.assertIn("Game: 4 queries", output)
+        self.assertIn("autocomplete", output)
+        self.assertIn("Franchise: no objects to search", output)
+
+
+class AutocompleteLimitTests(TestCase):
+    def test_autocomplete_results_are_capped(self):
+        for index in range(SUGGESTIONS_LIMIT + 5):
+            Game.objects.create(guid=str(index), title=f"Mario Game {index}")
+
+        response = self.client.get(
+            reverse("playstyle_compass:autocomplete"), {"query": "Mario"}, secure=True
+        )
+
+        self.assertEqual(len(response.json()["results"]), SUGGESTIONS_LIMIT)
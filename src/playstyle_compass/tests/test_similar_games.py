@@ -0,0 +1,183 @@
+from functools import partial
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from playstyle_compass.models import Game, SimilarGame
+from playstyle_compass.helper_functions.similar_games import (
+    GameSimilarityMatrix,
+    rebuild_similar_games,
+    similarity_matrix,
+    update_similar_games,
+)
+from playstyle_compass.helper_functions.views_helpers import get_similar_games
+
+from .base import create_game
+
+
+# The attributes the games share unless a test overrides them.
+create_matching_game = partial(
+    create_game,
+    genres="Action",
+    themes="Fantasy",
+    concepts="Online",
+    platforms="PC",
+    developers="Studio A",
+)
+
+
+class GameSimilarityMatrixTests(TestCase):
+    def test_counts_shared_attribute_types(self):
+        matrix = GameSimilarityMatrix(
+            [
+                {
+                    "id": 1,
+                    "genres": "Action, RPG",
+                    "themes": "Fantasy",
+                    "concepts": None,
+                    "platforms": "PC",
+                    "developers": "Studio A",
+                },
+                {
+                    "id": 2,
+                    "genres": "RPG",
+                    "themes": "Sci-Fi",
+                    "concepts": None,
+                    "platforms": "PC,Xbox",
+                    "developers": "Studio A",
+                },
+            ]
+        )
+
+        self.assertEqual(next(matrix.neighbors([0]))[1], [(2, 3)])
+
+    def test_replaced_rows_match_a_full_build(self):
+        rows = [
+            {
+                "id": 1,
+                "genres": "Action",
+                "themes": "Fantasy",
+                "concepts": None,
+                "platforms": "PC",
+                "developers": "Studio A",
+            },
+            {
+                "id": 2,
+                "genres": "Puzzle",
+                "themes": "Horror",
+                "concepts": None,
+                "platforms": "Switch",
+                "developers": "Studio B",
+            },
+        ]
+        changed = {**rows[1], "genres": "Action", "platforms": "PC, Xbox"}
+        added = {**rows[0], "id": 3, "concepts": "Online", "developers": "Studio C"}
+
+        matrix = GameSimilarityMatrix(rows).with_row(changed).with_row(added)
+        expected = GameSimilarityMatrix([rows[0], changed, added])
+
+        self.assertEqual(
+            list(matrix.neighbors([0, 1, 2])), list(expected.neighbors([0, 1, 2]))
+        )
+
+
+class SimilarGamesStoreTests(TestCase):
+    def setUp(self):
+        similarity_matrix.invalidate()
+        self.main = create_matching_game("1", "Main Game")
+        self.strong = create_matching_game("2", "Strong Match")
+        self.weak = create_matching_game(
+            "3", "Weak Match", genres="Puzzle", themes="Horror", developers="Studio B"
+        )
+        self.unrelated = create_matching_game(
+            "4",
+            "Unrelated",
+            genres="Puzzle",
+            themes="Horror",
+            concepts="Offline",
+            platforms="Switch",
+            developers="Studio B",
+        )
+
+    def test_neighbors_are_kept_up_to_date_on_save(self):
+        self.assertEqual(list(get_similar_games(self.main)), [self.strong])
+        self.assertEqual(
+            list(get_similar_games(self.main, min_matching_attributes=2)),
+            [self.strong, self.weak],
+        )
+
+        self.unrelated.genres = "Action"
+        self.unrelated.themes = "Fantasy"
+        self.unrelated.platforms = "PC"
+        self.unrelated.save()
+
+        self.assertIn(self.unrelated, get_similar_games(self.main))
+        self.assertIn(self.main, get_similar_games(self.unrelated))
+
+    def test_saves_do_not_rebuild_the_matrix(self):
+        similarity_matrix.get()
+
+        with patch.object(
+            similarity_matrix, "builder", side_effect=AssertionError("rebuilt")
+        ):
+            self.unrelated.genres = "Action"
+            self.unrelated.themes = "Fantasy"
+            self.unrelated.platforms = "PC"
+            self.unrelated.save()
+            sequel = create_matching_game("5", "Sequel")
+
+        self.assertIn(self.unrelated, get_similar_games(self.main))
+        self.assertIn(sequel, get_similar_games(self.main))
+        self.assertIn(self.main, get_similar_games(sequel))
+
+    def test_neighbors_are_ranked_by_match_count(self):
+        games = get_similar_games(self.main, min_matching_attributes=2)
+
+        self.assertEqual(games[0].match_count, 5)
+        self.assertEqual(games[1].match_count, 2)
+
+    def test_rebuild_matches_incremental_updates(self):
+        expected = set(
+            SimilarGame.objects.values_list("game", "similar_game", "match_count")
+        )
+
+        rebuild_similar_games(chunk_size=2)
+
+        self.assertEqual(
+            set(SimilarGame.objects.values_list("game", "similar_game", "match_count")),
+            expected,
+        )
+
+    def test_full_lists_evict_their_weakest_neighbor(self):
+        SimilarGame.objects.all().delete()
+        SimilarGame.objects.create(
+            game=self.strong, similar_game=self.weak, match_count=2
+        )
+
+        update_similar_games(self.main, limit=1)
+
+        self.assertEqual(
+            list(
+                SimilarGame.objects.filter(game=self.strong).values_list(
+                    "similar_game", flat=True
+                )
+            ),
+            [self.main.id],
+        )
+
+    def test_score_updates_do_not_recompute_neighbors(self):
+        SimilarGame.objects.all().delete()
+
+        self.main.update_score()
+
+        self.assertFalse(SimilarGame.objects.exists())
+
+    def test_build_command_rebuilds_links(self):
+        SimilarGame.objects.all().delete()
+        out = StringIO()
+
+        call_command("build_similar_games", stdout=out)
+
+        self.assertIn("Stored 8 similar game links.", out.getvalue())
@@ -0,0 +1,58 @@
+from django.test import TestCase, SimpleTestCase
+from fuzzywuzzy import fuzz
+
+from playstyle_compass.models import Game
+from playstyle_compass.helper_functions.title_matching import (
+    TitleMatcher,
+    title_matcher,
+)
+
+
+class TitleMatcherTests(SimpleTestCase):
+    def setUp(self):
+        self.titles = [
+            "The Witcher 3: Wild Hunt",
+            "The Witcher 2: Assassins of Kings",
+            "Baldur's Gate 3",
+            "Hogwarts Legacy",
+            "Diablo IV",
+        ]
+        self.matcher = TitleMatcher(enumerate(self.titles, start=1))
+
+    def test_matches_all_queries_in_one_call(self):
+        matches = self.matcher.match(["the witcher 3", "Baldurs Gate III"])
+
+        self.assertEqual(len(matches), 2)
+        self.assertIn(1, matches[0])
+        self.assertEqual(matches[1], [3])
+
+    def test_matches_agree_with_pairwise_ratio(self):
+        queries = ["Witcher", "Diablo 4", "Hogwarts", "Baldur's Gate", "Unknown"]
+
+        matches = self.matcher.match(queries)
+
+        for query, matched_ids in zip(queries, matches):
+            expected = [
+                game_id
+                for game_id, title in enumerate(self.titles, start=1)
+                if fuzz.ratio(query.lower(), title.lower()) > 65
+            ]
+            self.assertEqual(matched_ids, expected)
+
+    def test_empty_queries(self):
+        self.assertEqual(self.matcher.match([]), [])
+        self.assertEqual(self.matcher.match([""]), [[]])
+
+    def test_empty_catalog(self):
+        self.assertEqual(TitleMatcher([]).match(["Diablo IV"]), [[]])
+
+
+class TitleMatcherSnapshotTests(TestCase):
+    def test_snapshot_rebuilt_after_title_change(self):
+        game = Game.objects.create(guid="1", title="Diablo IV", genres="Action")
+        self.assertEqual(title_matcher.get().match(["Diablo IV"]), [[game.id]])
+
+        game.title = "Hades"
+        game.save()
+
+        self.assertEqual(title_matcher.get().match(["Diablo IV"]), [[]])
@@ -0,0 +1,164 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from playstyle_compass.models import RecommendationJob, SimilarUser, UserPreferences
+from playstyle_compass.helper_functions.user_similarity import (
+    UserSimilarityMatrix,
+    get_similar_users,
+    rebuild_similar_users,
+)
+
+
+def create_user(username, **preferences):
+    user = User.objects.create_user(username=username, password="pass")
+    for field, value in preferences.items():
+        setattr(user.userpreferences, field, value)
+    user.userpreferences.save()
+    return user
+
+
+class UserSimilarityMatrixTests(TestCase):
+    def test_averages_jaccard_similarity_over_preferences(self):
+        matrix = UserSimilarityMatrix(
+            [
+                {
+                    "user_id": 1,
+                    "gaming_history": "Doom, Quake",
+                    "favorite_genres": "Shooter",
+                    "themes": "",
+                    "platforms": "PC",
+                },
+                {
+                    "user_id": 2,
+                    "gaming_history": "Quake,Doom",
+                    "favorite_genres": "Shooter, Action",
+                    "themes": "",
+                    "platforms": "PC",
+                },
+            ]
+        )
+
+        scores = matrix.similarities([0], "playstyle")
+        self.assertAlmostEqual(scores[0][1], (1 + 0.5 + 0 + 1) / 4)
+        self.assertEqual(
+            next(matrix.similar_users([0], "gaming_history"))[1], [(2, 1.0)]
+        )
+
+    @override_settings(USER_SIMILARITY_THRESHOLD=0.9)
+    def test_threshold_defaults_to_setting(self):
+        rows = [
+            {
+                "user_id": user_id,
+                "gaming_history": history,
+                "favorite_genres": "",
+                "themes": "",
+                "platforms": "",
+            }
+            for user_id, history in ((1, "Doom, Quake"), (2, "Doom, Quake, Hexen"))
+        ]
+
+        self.assertEqual(
+            next(UserSimilarityMatrix(rows).similar_users([0], "gaming_history"))[1], []
+        )
+        self.assertEqual(
+            next(
+                UserSimilarityMatrix(rows, threshold=0.6).similar_users(
+                    [0], "gaming_history"
+                )
+            )[1],
+            [(2, 2 / 3)],
+        )
+
+
+class SimilarUsersStoreTests(TestCase):
+    def setUp(self):
+        self.user = create_user(
+            "first",
+            gaming_history="Doom, Quake",
+            favorite_genres="Shooter",
+            themes="Sci-Fi",
+            platforms="PC",
+        )
+        self.similar = create_user(
+            "second",
+            gaming_history="Doom, Quake",
+            favorite_genres="Shooter",
+            themes="Sci-Fi",
+            platforms="PC, Xbox",
+        )
+        self.different = create_user(
+            "third",
+            gaming_history="Tetris",
+            favorite_genres="Puzzle",
+            themes="Abstract",
+            platforms="Mobile",
+        )
+
+    def test_similar_users_are_updated_on_save(self):
+        self.assertEqual(
+            list(get_similar_users(self.user, "playstyle")),
+            [self.similar.userpreferences],
+        )
+
+        self.different.userpreferences.gaming_history = "Doom, Quake"
+        self.different.userpreferences.save()
+
+        self.assertIn(
+            self.different.userpreferences,
+            get_similar_users(self.user, "gaming_history"),
+        )
+        self.assertNotIn(
+            self.different.userpreferences, get_similar_users(self.user, "playstyle")
+        )
+
+    def test_unchanged_preferences_are_not_compared_again(self):
+        preferences = UserPreferences.objects.get(user=self.user)
+
+        with patch("playstyle_compass.signals.update_similar_users") as mock_update:
+            preferences.show_reviews = False
+            preferences.save()
+            preferences.quiz_recommendations = "1,2"
+            preferences.save()
+            mock_update.assert_not_called()
+
+            preferences.themes = "Horror"
+            preferences.save()
+            mock_update.assert_called_once_with(preferences)
+
+    def test_cleared_preferences_remove_links(self):
+        self.similar.userpreferences.gaming_history = ""
+        self.similar.userpreferences.favorite_genres = ""
+        self.similar.userpreferences.themes = ""
+        self.similar.userpreferences.platforms = ""
+        self.similar.userpreferences.save()
+
+        self.assertFalse(SimilarUser.objects.exists())
+
+    def test_rebuild_matches_incremental_updates(self):
+        expected = set(SimilarUser.objects.values_list("user", "similar_user", "kind"))
+        out = StringIO()
+
+        call_command("build_similar_users", "--chunk-size", "2", stdout=out)
+
+        self.assertEqual(
+            set(SimilarUser.objects.values_list("user", "similar_user", "kind")),
+            expected,
+        )
+        self.assertIn(f"Stored {len(expected)} similar user links.", out.getvalue())
+
+    @override_settings(RECOMMENDATION_WORKER=True)
+    def test_worker_refreshes_similar_users(self):
+        SimilarUser.objects.all().delete()
+
+        self.user.userpreferences.platforms = "PC, Switch"
+        self.user.userpreferences.save()
+        self.assertFalse(SimilarUser.objects.exists())
+        self.assertTrue(RecommendationJob.objects.filter(user=self.user).exists())
+
+        call_command("run_recommendation_worker", "--once", stdout=StringIO())
+
+        self.assertTrue(SimilarUser.objects.filter(user=self.user).exists())
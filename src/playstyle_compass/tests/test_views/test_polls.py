@@ -621,12 +621,9 @@ class CompletedPollsViewTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertIn("/users/login/", response.url)
 
-    @patch("playstyle_compass.views.paginate_objects")
-    def test_completed_poll_is_listed(self, mock_paginate):
+    def test_completed_poll_is_listed(self):
         self.client.login(username="testuser", password="pass")
 
-        mock_paginate.return_value = [self.completed_poll, self.active_poll]
-
         response = self.client.get(self.url, secure=True)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "polls/completed_polls.html")
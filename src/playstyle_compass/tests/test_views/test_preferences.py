@@ -1,4 +1,5 @@
 from django.utils.translation import gettext_lazy as _
+from django.test import override_settings
 from ..base import *
 
 
@@ -208,6 +209,15 @@ class SaveAllPreferencesViewTest(TestCase):
         self.assertEqual(self.preferences.connection_types, 'Connection1, Connection2')
         self.assertEqual(self.preferences.game_styles, 'Style1, Style2')
 
+    @override_settings(RECOMMENDATION_WORKER=True)
+    def test_save_all_preferences_queues_recommendation_job(self):
+        self.client.login(username='testuser', password='testpass')
+        self.client.post(self.url, {'gaming_history': ['History1']}, secure=True)
+
+        self.assertTrue(
+            RecommendationJob.objects.filter(user=self.user, status="pending").exists()
+        )
+
     def test_save_all_preferences_get_does_nothing(self):
         self.client.login(username='testuser', password='testpass')
         response = self.client.get(self.url, secure=True)
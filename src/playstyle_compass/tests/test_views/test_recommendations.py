@@ -1,3 +1,5 @@
+from django.test import override_settings
+
 from ..base import *
 
 
@@ -7,17 +9,14 @@ class GetRecommendationsViewTest(TestCase):
         self.preferences = self.user.userpreferences
         self.url = reverse('playstyle_compass:get_recommendations')
 
-    @patch('playstyle_compass.views.paginate_matching_games')
-    @patch('playstyle_compass.views.RecommendationEngine')
-    def test_authenticated_user_gets_recommendations(self, mock_engine_class, mock_paginate):
+    @patch('playstyle_compass.views.paginate_recommendations')
+    @patch('playstyle_compass.views.get_user_recommendations')
+    def test_authenticated_user_gets_recommendations(self, mock_get_recommendations, mock_paginate):
         self.client.login(username='testuser', password='testpass')
         self.preferences.gaming_history = "Baldur's Gate III"
         self.preferences.favorite_genres = "Action, RPG"
         self.preferences.save()
 
-        mock_engine_instance = mock_engine_class.return_value
-        mock_engine_instance.matching_games = ['Game1', 'Game2']
-        mock_engine_instance.process.return_value = None
         mock_paginate.return_value = {"page_obj": ['Game1', 'Game2']}
 
         response = self.client.get(self.url, secure=True)
@@ -26,6 +25,45 @@ class GetRecommendationsViewTest(TestCase):
         self.assertTemplateUsed(response, "games/recommendations.html")
         self.assertIn("paginated_games", response.context)
         self.assertEqual(response.context["user_preferences"], self.preferences)
+        mock_get_recommendations.assert_called_once_with(self.preferences)
+
+    def test_recommendations_are_rendered_from_stored_results(self):
+        self.client.login(username='testuser', password='testpass')
+        self.preferences.gaming_history = "Shadow Runner"
+        self.preferences.favorite_genres = "Action"
+        self.preferences.save()
+        game = Game.objects.create(
+            guid="1", title="Shadow Runner", genres="Action", platforms="PC"
+        )
+
+        self.client.get(self.url, secure=True)
+        response = self.client.get(self.url, {"sort": "title_asc"}, secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(UserRecommendations.objects.filter(user=self.user).count(), 1)
+        self.assertIn(
+            game, response.context["paginated_games"]["favorite_genres"].object_list
+        )
+
+    @override_settings(RECOMMENDATION_WORKER=True)
+    def test_pending_page_rendered_while_worker_computes(self):
+        self.client.login(username='testuser', password='testpass')
+        self.preferences.gaming_history = "Shadow Runner"
+        self.preferences.favorite_genres = "Action"
+        self.preferences.save()
+
+        response = self.client.get(self.url, secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["recommendations_pending"])
+        self.assertEqual(response.context["paginated_games"], {})
+        self.assertContains(
+            response, reverse('playstyle_compass:recommendation_status')
+        )
+        self.assertFalse(UserRecommendations.objects.filter(user=self.user).exists())
+        self.assertTrue(
+            RecommendationJob.objects.filter(user=self.user, status="pending").exists()
+        )
 
     def test_redirects_if_missing_preferences(self):
         self.client.login(username='testuser', password='testpass')
@@ -45,6 +83,36 @@ class GetRecommendationsViewTest(TestCase):
         self.assertIn("/users/login/", response.url)
 
 
+class RecommendationStatusViewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.preferences = self.user.userpreferences
+        self.preferences.gaming_history = "Shadow Runner"
+        self.preferences.favorite_genres = "Action"
+        self.preferences.save()
+        self.url = reverse('playstyle_compass:recommendation_status')
+
+    def test_status_pending_before_results_exist(self):
+        self.client.login(username='testuser', password='testpass')
+
+        response = self.client.get(self.url, secure=True)
+
+        self.assertJSONEqual(response.content, {"status": "pending"})
+
+    def test_status_ready_after_results_are_stored(self):
+        self.client.login(username='testuser', password='testpass')
+        self.client.get(reverse('playstyle_compass:get_recommendations'), secure=True)
+
+        response = self.client.get(self.url, secure=True)
+
+        self.assertJSONEqual(response.content, {"status": "ready"})
+
+    def test_unauthenticated_user_redirected(self):
+        response = self.client.get(self.url, secure=True)
+
+        self.assertEqual(response.status_code, 302)
+
+
 class SearchResultsViewTest(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(username='testuser', password='testpass')
@@ -12,6 +12,11 @@ urlpatterns = [
     path("gaming_preferences/", views.gaming_preferences, name="gaming_preferences"),
     path("preferences/", views.update_preferences, name="update_preferences"),
     path("get-recommendations/", views.get_recommendations, name="get_recommendations"),
+    path(
+        "recommendations/status/",
+        views.recommendation_status,
+        name="recommendation_status",
+    ),
     path("search/", views.search_results, name="search_results"),
     path("autocomplete/games/", views.autocomplete_games, name="autocomplete"),
     path("clear_preferences/", views.clear_preferences, name="clear_preferences"),
@@ -1,6 +1,7 @@
 """Views for the playstyle_compass app."""
 
 from datetime import date
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.models import User
 from django.contrib.auth.decorators import login_required
@@ -30,10 +31,12 @@ from utils.constants import (
 )
 from users.models import Notification, Follow
 from users.misc.helper_functions import create_notification
+from users.misc.notification_fanout import fan_out_notification
 from .models import (
     UserPreferences,
     Game,
     Review,
+    ReviewReaction,
     SharedGame,
     Franchise,
     Character,
@@ -61,12 +64,10 @@ from .forms import (
 )
 
 from .helper_functions.views_helpers import (
-    RecommendationEngine,
     paginate_matching_games,
     paginate_objects,
+    attach_viewer_reactions,
     get_friend_list,
-    calculate_average_similarity,
-    gather_game_attributes,
     build_query,
     get_selected_filters,
     sort_game_library,
@@ -76,6 +77,23 @@ from .helper_functions.views_helpers import (
     get_similar_games,
     get_first_letter,
 )
+from .helper_functions.recommendation_store import (
+    get_fresh_recommendations,
+    get_user_recommendations,
+    paginate_recommendations,
+)
+from .helper_functions.user_similarity import get_similar_users
+from .helper_functions.facets import get_facet_counts
+from .helper_functions.game_attributes import attribute_filter
+from .helper_functions.search import get_search_backend
+from .helper_functions.autocomplete import autocomplete_response
+from .helper_functions.review_pages import get_review_page, invalidate_review_pages
+from .helper_functions.poll_results import polls_with_results
+from .helper_functions.recommendation_jobs import (
+    enqueue_recommendation_job,
+    request_recommendation_refresh,
+    get_recommendation_status,
+)
 
 
 def index(request):
@@ -175,6 +193,7 @@ def update_preferences(request):
         user_preferences.connection_types = ", ".join(connection_types)
         user_preferences.game_styles = ", ".join(game_styles)
         user_preferences.save()
+        request_recommendation_refresh(user.id)
 
     context = {
         "page_title": _("Your PlayStyle :: PlayStyle Compass"),
@@ -244,6 +263,7 @@ def _save_user_preference(request, field_name, redirect_view):
         user_preferences = get_object_or_404(UserPreferences, user=request.user)
         setattr(user_preferences, field_name, ", ".join(new_values))
         user_preferences.save()
+        request_recommendation_refresh(request.user.id)
 
     return redirect(redirect_view)
 
@@ -268,6 +288,7 @@ def save_all_preferences(request):
         user_preferences.game_styles = ", ".join(request.POST.getlist("game_styles"))
 
         user_preferences.save()
+        request_recommendation_refresh(request.user.id)
 
     return JsonResponse({"success": True})
 
@@ -286,6 +307,7 @@ def clear_preferences(request):
         user_preferences.connection_types = ""
         user_preferences.game_styles = ""
         user_preferences.save()
+        request_recommendation_refresh(user.id)
 
     return redirect("playstyle_compass:update_preferences")
 
@@ -299,11 +321,16 @@ def get_recommendations(request):
     if user_preferences.gaming_history == "" or user_preferences.favorite_genres == "":
         return redirect("playstyle_compass:update_preferences")
 
-    recommendation_engine = RecommendationEngine(request, user_preferences)
-    recommendation_engine.process()
+    if settings.RECOMMENDATION_WORKER:
+        recommendations = get_fresh_recommendations(user_preferences)
+        if recommendations is None:
+            enqueue_recommendation_job(user.id)
+    else:
+        recommendations = get_user_recommendations(user_preferences)
 
-    matching_games = recommendation_engine.matching_games
-    paginated_games = paginate_matching_games(request, matching_games)
+    paginated_games = {}
+    if recommendations is not None:
+        paginated_games = paginate_recommendations(request, recommendations)
 
     user_friends = get_friend_list(user)
 
@@ -311,12 +338,21 @@ def get_recommendations(request):
         "page_title": _("Recommendations :: PlayStyle Compass"),
         "user_preferences": user_preferences,
         "paginated_games": dict(paginated_games),
+        "recommendations_pending": recommendations is None,
         "user_friends": user_friends,
     }
 
     return render(request, "games/recommendations.html", context)
 
 
+@login_required
+def recommendation_status(request):
+    """Return the state of the user's recommendations for the page to poll."""
+    user_preferences = get_object_or_404(UserPreferences, user=request.user)
+
+    return JsonResponse({"status": get_recommendation_status(user_preferences)})
+
+
 def search_results(request):
     """Retrieves games from the database that match a given
     search query and renders a search results page.
@@ -330,7 +366,7 @@ def search_results(request):
             "Invalid query. Please enter at least 2 characters."
         )
 
-    games = Game.objects.filter(title__icontains=query)
+    games = get_search_backend().search(Game, query)
     games = paginate_matching_games(request, games)
 
     context = {
@@ -356,7 +392,7 @@ def search_franchises(request):
             "Invalid query. Please enter at least 2 characters."
         )
 
-    franchises = Franchise.objects.filter(title__icontains=query)
+    franchises = get_search_backend().search(Franchise, query)
     franchises = paginate_objects(request, franchises)
 
     context = {
@@ -371,26 +407,12 @@ def search_franchises(request):
 
 def autocomplete_games(request):
     """Provides autocomplete suggestions for games based on a user's query."""
-    query = request.GET.get("query", "")
-    results = []
-
-    if query:
-        games = Game.objects.filter(title__icontains=query)
-        results = list(games.values("title"))
-
-    return JsonResponse({"results": results})
+    return autocomplete_response(request, Game)
 
 
 def autocomplete_franchises(request):
     """Provides autocomplete suggestions for franchises based on a user's query."""
-    query = request.GET.get("query", "")
-    results = []
-
-    if query:
-        franchises = Franchise.objects.filter(title__icontains=query)
-        results = list(franchises.values("title"))
-
-    return JsonResponse({"results": results})
+    return autocomplete_response(request, Franchise)
 
 
 @login_required
@@ -625,26 +647,25 @@ def add_review(request, game_id):
 
             Review.objects.create(**review_data)
 
-            followers = Follow.objects.filter(followed=user).select_related("follower")
-            for follower in followers:
-                follower_user = follower.follower
-                profile_url = reverse("users:view_profile", args=[profile_name])
-                game_url = reverse("playstyle_compass:view_game", args=[game.guid])
+            profile_url = reverse("users:view_profile", args=[profile_name])
+            game_url = reverse("playstyle_compass:view_game", args=[game.guid])
 
-                message = (
-                    f'<a class="notification-profile" title="View Profile" href="{profile_url}">{profile_name}</a> '
-                    f'has posted a new review for <a class="notification-link" title="View Game" href="{game_url}">{game.title}</a>!'
-                )
+            message = (
+                f'<a class="notification-profile" title="View Profile" href="{profile_url}">{profile_name}</a> '
+                f'has posted a new review for <a class="notification-link" title="View Game" href="{game_url}">{game.title}</a>!'
+            )
 
-                create_notification(
-                    follower_user,
-                    message=message,
-                    notification_type="review",
-                    profile_url=profile_url,
-                    profile_name=profile_name,
-                    game_url=game_url,
-                    game_title=game.title,
-                )
+            fan_out_notification(
+                Follow.objects.filter(followed=user).values_list(
+                    "follower_id", flat=True
+                ),
+                message=message,
+                notification_type="review",
+                profile_url=profile_url,
+                profile_name=profile_name,
+                game_url=game_url,
+                game_title=game.title,
+            )
 
             messages.success(request, _("Your review has been successfully submitted."))
             return HttpResponseRedirect(
@@ -706,33 +727,22 @@ def edit_review(request, game_id):
 
 
 def get_game_reviews(request, game_id):
-    """View to get the reviews for a game."""
-    game_reviews = Review.objects.filter(game_id=game_id)
-    invalid_user_id = "invalid_user"
-    inactive_user = "inactive-user"
+    """View to get a page of the reviews for a game, newest first."""
+    reviews, next_cursor = get_review_page(game_id, request.GET.get("cursor"))
+    liked, disliked = ReviewReaction.reactions_of(
+        request.user, [review["id"] for review in reviews]
+    )
 
     reviews_data = [
         {
-            "id": review.id,
-            "reviewer": (
-                inactive_user
-                if "deactivated-" in str(review.reviewers)
-                else review.reviewers
-            ),
-            "title": review.review_deck,
-            "description": review.review_description,
-            "score": review.score,
-            "likes": review.likes,
-            "dislikes": review.dislikes,
-            "date_added": localtime(review.date_added).strftime("%d/%m/%Y"),
-            "user_id": (
-                invalid_user_id if "-" in str(review.user_id) else review.user_id
-            ),
+            **review,
+            "liked": review["id"] in liked,
+            "disliked": review["id"] in disliked,
         }
-        for review in game_reviews
+        for review in reviews
     ]
 
-    return JsonResponse({"reviews": reviews_data})
+    return JsonResponse({"reviews": reviews_data, "next_cursor": next_cursor})
 
 
 @login_required
@@ -750,16 +760,16 @@ def like_review(request):
             if "-" in str(review.user_id):
                 review.user_id = -1
 
-            if review.user_has_disliked(request.user.id):
-                review.remove_dislike(request.user.id)
-
-            if review.user_has_liked(request.user.id):
-                review.remove_like(request.user.id)
-            else:
-                review.add_like(request.user.id)
+            reaction = review.toggle_reaction(request.user.id, ReviewReaction.LIKE)
+            invalidate_review_pages(review.game_id)
 
             return JsonResponse(
-                {"likes": review.likes, "dislikes": review.dislikes, "message": ""}
+                {
+                    "likes": review.likes,
+                    "dislikes": review.dislikes,
+                    "reaction": reaction,
+                    "message": "",
+                }
             )
 
         return JsonResponse({"error": _("Review ID invalid.")})
@@ -786,16 +796,16 @@ def dislike_review(request):
             if "-" in str(review.user_id):
                 review.user_id = -1
 
-            if review.user_has_liked(request.user.id):
-                review.remove_like(request.user.id)
-
-            if review.user_has_disliked(request.user.id):
-                review.remove_dislike(request.user.id)
-            else:
-                review.add_dislike(request.user.id)
+            reaction = review.toggle_reaction(request.user.id, ReviewReaction.DISLIKE)
+            invalidate_review_pages(review.game_id)
 
             return JsonResponse(
-                {"dislikes": review.dislikes, "likes": review.likes, "message": ""}
+                {
+                    "dislikes": review.dislikes,
+                    "likes": review.likes,
+                    "reaction": reaction,
+                    "message": "",
+                }
             )
 
         return JsonResponse({"error": _("Review ID invalid.")})
@@ -999,23 +1009,8 @@ def similar_playstyles(request):
     """View used to show users with similar playstyles."""
     user_preferences, created = UserPreferences.objects.get_or_create(user=request.user)
 
-    preferences_to_compare = [
-        "gaming_history",
-        "favorite_genres",
-        "themes",
-        "platforms",
-    ]
-    similarity_threshold = 0.6
-
-    all_user_prefs = UserPreferences.objects.exclude(user=request.user)
-
     # Find users with similar playstyles based on preferences
-    similar_user_playstyles = [
-        user
-        for user in all_user_prefs
-        if calculate_average_similarity(user_preferences, user, preferences_to_compare)
-        >= similarity_threshold
-    ]
+    similar_user_playstyles = get_similar_users(request.user, "playstyle")
 
     context = {
         "page_title": _("Similar PlayStyles :: PlayStyle Compass"),
@@ -1031,19 +1026,8 @@ def play_histories(request):
     """View used to show users with similar gaming history."""
     user_preferences, created = UserPreferences.objects.get_or_create(user=request.user)
 
-    # Compare gaming history
-    preferences_to_compare = ["gaming_history"]
-    similarity_threshold = 0.6
-
-    all_user_prefs = UserPreferences.objects.exclude(user=request.user)
-
     # Find users with similar gaming history
-    similar_user_gaming_history = [
-        user
-        for user in all_user_prefs
-        if calculate_average_similarity(user_preferences, user, preferences_to_compare)
-        >= similarity_threshold
-    ]
+    similar_user_gaming_history = get_similar_users(request.user, "gaming_history")
 
     context = {
         "page_title": _("Kinded Play Histories :: PlayStyle Compass"),
@@ -1136,7 +1120,7 @@ def search_characters(request):
             "Invalid query. Please enter at least 2 characters."
         )
 
-    characters = Character.objects.filter(name__icontains=query)
+    characters = get_search_backend().search(Character, query)
     characters = paginate_objects(request, characters)
 
     context = {
@@ -1151,14 +1135,7 @@ def search_characters(request):
 
 def autocomplete_characters(request):
     """Provides autocomplete suggestions for characters based on a user's query."""
-    query = request.GET.get("query", "")
-    results = []
-
-    if query:
-        characters = Character.objects.filter(name__icontains=query)
-        results = list(characters.values("name"))
-
-    return JsonResponse({"results": results})
+    return autocomplete_response(request, Character)
 
 
 def get_games_and_context(request, game_mode):
@@ -1166,20 +1143,14 @@ def get_games_and_context(request, game_mode):
     user, user_preferences, user_friends = get_user_context(request)
 
     games_query = GameModes.objects.filter(game_mode=game_mode)
-    game_ids = [game.game_id for game in games_query]
-    games = Game.objects.filter(guid__in=game_ids)
+    query = Q(guid__in=games_query.values("game_id"))
 
-    additional_games = None
     if game_mode == "Singleplayer":
-        additional_games = Game.objects.filter(concepts__icontains="Single-Player Only")
+        query |= attribute_filter("concepts", ["Single-Player Only"])
     elif game_mode == "Multiplayer":
-        additional_games = Game.objects.filter(
-            concepts__icontains="Split-Screen Multiplayer"
-        )
+        query |= attribute_filter("concepts", ["Split-Screen Multiplayer"])
 
-    if additional_games is not None:
-        games = list(games) + list(additional_games)
-        games = Game.objects.filter(pk__in=[game.pk for game in games])
+    games = Game.objects.filter(query)
 
     games = paginate_matching_games(request, games)
 
@@ -1217,12 +1188,12 @@ def game_library(request):
 
     games = Game.objects.all()
 
-    # Gather various game attributes for filtering purposes
-    genres, concepts, themes, platforms, franchises = gather_game_attributes(games)
-
     # Get the selected filters from the request
     selected_filters = get_selected_filters(request)
 
+    # Count the games having each filter value, among the filtered games if any
+    facets = get_facet_counts(selected_filters)
+
     # Build a query based on the selected filters
     query = build_query(selected_filters)
 
@@ -1241,11 +1212,11 @@ def game_library(request):
     context = {
         "page_title": _("Game Library :: PlayStyle Compass"),
         "games": games,
-        "genres": sorted(genres),
-        "concepts": sorted(concepts),
-        "themes": sorted(themes),
-        "platforms": sorted(platforms),
-        "franchises": sorted(franchises),
+        "genres": facets["genres"],
+        "concepts": facets["concepts"],
+        "themes": facets["themes"],
+        "platforms": facets["platforms"],
+        "franchises": facets["franchises"],
         "selected_genres": selected_filters["genres"],
         "selected_concepts": selected_filters["concepts"],
         "selected_themes": selected_filters["themes"],
@@ -1290,7 +1261,7 @@ def latest_news(request):
 
 def similar_games_directory(request):
     """View to display all games with links to their similar games pages, organized alphabetically."""
-    games = Game.objects.all().order_by("title")
+    games = Game.objects.only("guid", "title").order_by("title")
 
     # Initialize a dictionary to categorize games by their starting letter
     games_by_letter = {}
@@ -1346,7 +1317,8 @@ def get_filtered_games(request, filter_keyword):
     user, user_preferences, user_friends = get_user_context(request)
 
     # Filter games by keyword and order by title
-    games = Game.objects.filter(concepts__icontains=filter_keyword).order_by("title")
+    games = Game.objects.filter(attribute_filter("concepts", [filter_keyword]))
+    games = games.order_by("title")
 
     # Paginate the filtered games
     games = paginate_matching_games(request, games)
@@ -1556,12 +1528,20 @@ def game_list_detail(request, pk):
     )
     user, user_preferences, user_friends = get_user_context(request)
 
-    reviews = ListReview.objects.filter(game_list=game_list).order_by("-created_at")
+    reviews = (
+        ListReview.objects.filter(game_list=game_list)
+        .with_stats()
+        .order_by("-created_at")
+    )
     review_form = ListReviewForm()
     review = ListReview.objects.filter(game_list=game_list, user=user).first()
 
     comment_form = ListCommentForm()
-    comments = ListComment.objects.filter(game_list=game_list).order_by("created_at")
+    comments = (
+        ListComment.objects.filter(game_list=game_list)
+        .with_stats()
+        .order_by("created_at")
+    )
 
     context = {
         "page_title": _("View Game List :: PlayStyle Compass"),
@@ -1653,7 +1633,7 @@ def share_game_list(request, pk):
 def user_game_lists(request, user_id):
     """View used to display game lists of a user with sorting options."""
     user = get_object_or_404(User, id=user_id)
-    game_lists = GameList.objects.filter(owner=user)
+    game_lists = GameList.objects.filter(owner=user).with_stats()
 
     sort_by = request.GET.get("sort_by", "created_at")
     order = request.GET.get("order", "desc")
@@ -1701,7 +1681,7 @@ def shared_game_lists(request):
     order = request.GET.get("order", "desc")
 
     if view_type == "shared":
-        game_lists = GameList.objects.all()
+        game_lists = GameList.objects.with_stats()
         game_lists = [
             game_list
             for game_list in game_lists
@@ -1710,7 +1690,7 @@ def shared_game_lists(request):
         page_title = _("Game Lists You Shared with Others")
     else:
         # Get lists that have been shared with the user
-        game_lists = GameList.objects.filter(shared_with=user)
+        game_lists = GameList.objects.filter(shared_with=user).with_stats()
         page_title = _("Game Lists Shared With You")
 
         # Track all users who shared the list with the current user
@@ -1861,9 +1841,10 @@ def reviewed_game_lists(request, user_id=None):
     other_user_profile = user != request.user
     user_preferences, created = UserPreferences.objects.get_or_create(user=user)
 
-    # Retrieve reviewed game lists
-    reviewed_lists = ListReview.objects.filter(user=user)
-    reviewed_game_lists = [review.game_list for review in reviewed_lists]
+    # Retrieve reviewed game lists in the order they were reviewed
+    reviewed_game_lists = (
+        GameList.objects.filter(reviews__user=user).with_stats().order_by("reviews")
+    )
 
     current_viewer_preferences, created = UserPreferences.objects.get_or_create(
         user=request.user
@@ -1906,7 +1887,7 @@ def privacy_settings(request):
 
 def explore_game_lists(request):
     """View used to explore public game lists."""
-    game_lists = GameList.objects.filter(is_public=True)
+    game_lists = GameList.objects.filter(is_public=True).with_stats()
 
     sort_by = request.GET.get("sort_by", "created_at")
     order = request.GET.get("order", "desc")
@@ -2086,7 +2067,7 @@ def favorite_game_lists(request, user_id=None):
         user = request.user
         other_user = False
 
-    game_lists = GameList.objects.filter(favorites=user)
+    game_lists = GameList.objects.filter(favorites=user).with_stats()
 
     sort_by = request.GET.get("sort_by", "created_at")
     order = request.GET.get("order", "desc")
@@ -2218,29 +2199,13 @@ def vote(request, id):
 
 def community_polls(request):
     """View used to display polls."""
-    polls = Poll.objects.filter(is_public=True).order_by("-created_at")
+    polls = Poll.objects.filter(is_public=True).with_stats().order_by("-created_at")
     polls = paginate_objects(request, polls)
-    user_votes = {}
 
-    polls_with_data = []
     for poll in polls:
         poll.vote_form = VoteForm(poll=poll)
 
-        if request.user.is_authenticated:
-            user_vote = poll.user_vote(request.user)
-
-            if user_vote:
-                user_votes[poll.id] = user_vote.id
-
-        options_with_percentages = poll.options_with_percentages()
-
-        polls_with_data.append(
-            {
-                "poll": poll,
-                "total_votes": poll.total_votes(),
-                "options_with_percentages": options_with_percentages,
-            }
-        )
+    polls_with_data, user_votes = polls_with_results(polls, request.user)
 
     context = {
         "page_title": _("Community Polls :: PlayStyle Compass"),
@@ -2256,24 +2221,9 @@ def community_polls(request):
 def user_polls(request, user_id):
     """View to display polls created by a specific user."""
     user = get_object_or_404(User, id=user_id)
-    polls = Poll.objects.filter(created_by=user).order_by("-created_at")
+    polls = Poll.objects.filter(created_by=user).with_stats().order_by("-created_at")
 
-    user_votes = {}
-    polls_with_data = []
-    for poll in polls:
-        user_vote = poll.user_vote(request.user)
-        if user_vote:
-            user_votes[poll.id] = user_vote.id
-
-        options_with_percentages = poll.options_with_percentages()
-
-        polls_with_data.append(
-            {
-                "poll": poll,
-                "total_votes": poll.total_votes(),
-                "options_with_percentages": options_with_percentages,
-            }
-        )
+    polls_with_data, user_votes = polls_with_results(polls, request.user)
 
     context = {
         "page_title": _("User Polls :: PlayStyle Compass"),
@@ -2303,26 +2253,13 @@ def delete_poll(request, poll_id):
 def voted_polls(request):
     """View to display polls that the user has voted on."""
     votes = Vote.objects.filter(user=request.user)
-    voted_polls = Poll.objects.filter(id__in=[vote.poll.id for vote in votes]).order_by(
-        "-created_at"
+    voted_polls = (
+        Poll.objects.filter(id__in=[vote.poll_id for vote in votes])
+        .with_stats()
+        .order_by("-created_at")
     )
 
-    user_votes = {}
-    polls_with_data = []
-    for poll in voted_polls:
-        user_vote = poll.user_vote(request.user)
-        if user_vote:
-            user_votes[poll.id] = user_vote.id
-
-        options_with_percentages = poll.options_with_percentages()
-
-        polls_with_data.append(
-            {
-                "poll": poll,
-                "total_votes": poll.total_votes(),
-                "options_with_percentages": options_with_percentages,
-            }
-        )
+    polls_with_data, user_votes = polls_with_results(voted_polls, request.user)
 
     context = {
         "page_title": _("Voted Polls:: PlayStyle Compass"),
@@ -2499,32 +2436,15 @@ def shared_polls(request):
 @login_required
 def completed_polls(request):
     """View to display all completed polls."""
-    all_polls = Poll.objects.all().order_by("-created_at")
-    all_polls = paginate_objects(request, all_polls)
-
-    completed_polls = [poll for poll in all_polls if poll.has_ended()]
-
-    user_votes = {}
-    polls_with_data = []
-    for poll in completed_polls:
-        user_vote = poll.user_vote(request.user)
-        if user_vote:
-            user_votes[poll.id] = user_vote.id
+    completed_polls = Poll.objects.ended().with_stats().order_by("-created_at")
+    completed_polls = paginate_objects(request, completed_polls)
 
-        options_with_percentages = poll.options_with_percentages()
-
-        polls_with_data.append(
-            {
-                "poll": poll,
-                "total_votes": poll.total_votes(),
-                "options_with_percentages": options_with_percentages,
-            }
-        )
+    polls_with_data, user_votes = polls_with_results(completed_polls, request.user)
 
     context = {
         "page_title": _("Completed Polls :: PlayStyle Compass"),
         "polls_with_data": polls_with_data,
-        "polls": all_polls,
+        "polls": completed_polls,
         "user_votes": user_votes,
         "pagination": True,
     }
@@ -2572,7 +2492,7 @@ def game_reviews(request):
     user = request.user
     sort_order = request.GET.get("sort_order", "date_desc")
 
-    all_reviews = Review.objects.all()
+    all_reviews = Review.objects.select_related("game")
 
     if sort_order == "date_desc":
         all_reviews = all_reviews.order_by("-date_added")
@@ -2588,6 +2508,7 @@ def game_reviews(request):
         all_reviews = all_reviews.order_by("likes")
 
     reviews = paginate_objects(request, all_reviews)
+    reviews.object_list = attach_viewer_reactions(reviews.object_list, user)
 
     context = {
         "page_title": _("Game Reviews :: PlayStyle Compass"),
@@ -2684,7 +2605,8 @@ def shared_deals_view(request):
 @login_required
 def single_review(request, review_id):
     """View used to display a single game review."""
-    review = get_object_or_404(Review, id=review_id)
+    review = get_object_or_404(Review.objects.select_related("game"), id=review_id)
+    attach_viewer_reactions([review], request.user)
 
     context = {
         "page_title": _("Game Review :: PlayStyle Compass"),
@@ -199,8 +199,77 @@ PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.ScryptPasswordHasher",
 ]
 
-# Channel Layers
-CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+# Precompute recommendations with 'python manage.py run_recommendation_worker'
+# instead of computing them while rendering the recommendations page.
+RECOMMENDATION_WORKER = os.getenv("RECOMMENDATION_WORKER", "False") == "True"
+
+# Average Jaccard similarity of their preferences from which users are listed
+# as similar to each other, also the threshold of their MinHash LSH indexes.
+USER_SIMILARITY_THRESHOLD = float(os.getenv("USER_SIMILARITY_THRESHOLD") or 0.6)
+
+# The notifications of many users, such as the followers of a reviewer, are
+# queued for 'python manage.py run_recommendation_worker'. Only with
+# NOTIFICATION_FANOUT_BACKGROUND=False, for development without the worker,
+# are they sent inline during the request.
+NOTIFICATION_FANOUT_BACKGROUND = os.getenv("NOTIFICATION_FANOUT_BACKGROUND") != "False"
+
+# Dotted path of the search backend. Defaults to the backend of the database in
+# use, FTS5 trigram tables on SQLite or pg_trgm indexes on PostgreSQL.
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND") or None
+
+# Cache shared by the workers for the online presence, chat rate limits and
+# quiz questions of users. CACHE_BACKEND selects redis (with CACHE_LOCATION
+# the Redis URL) or database (the table created by 'createcachetable'), each
+# with a default location. Without it, every process keeps its own in-memory
+# cache.
+CACHE_BACKENDS = {
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "database": "django.core.cache.backends.db.DatabaseCache",
+}
+CACHE_LOCATIONS = {
+    "redis": "redis://127.0.0.1:6379/1",
+    "database": "playstyle_cache",
+}
+
+if os.getenv("CACHE_BACKEND"):
+    CACHES = {
+        "default": {
+            "BACKEND": CACHE_BACKENDS[os.getenv("CACHE_BACKEND")],
+            "LOCATION": os.getenv("CACHE_LOCATION")
+            or CACHE_LOCATIONS[os.getenv("CACHE_BACKEND")],
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+# The database cache increments by reading the value and writing it back, so
+# with it the online presence and chat rate limit counters are kept in the
+# SharedCounter table instead, and incremented with UPDATE statements.
+SHARED_COUNTERS_IN_DATABASE = os.getenv("CACHE_BACKEND") == "database"
+
+# Channel Layers. Setting CHANNEL_REDIS_URL shares the layer between the ASGI
+# workers, through Redis lists or, with CHANNEL_LAYER_BACKEND=pubsub, Redis
+# Pub/Sub. Without it, messages are only delivered within a single process. For
+# local runs without a Redis server, `python manage.py run_fake_redis` serves a
+# fakeredis stand-in at redis://127.0.0.1:6379/0.
+CHANNEL_LAYER_BACKENDS = {
+    "redis": "channels_redis.core.RedisChannelLayer",
+    "pubsub": "channels_redis.pubsub.RedisPubSubChannelLayer",
+}
+
+if os.getenv("CHANNEL_REDIS_URL"):
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": CHANNEL_LAYER_BACKENDS[
+                os.getenv("CHANNEL_LAYER_BACKEND") or "redis"
+            ],
+            "CONFIG": {"hosts": [os.getenv("CHANNEL_REDIS_URL")]},
+        }
+    }
+else:
+    CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
 
 # SendGrid Email Settings
 SENDGRID_SANDBOX_MODE_IN_DEBUG = False
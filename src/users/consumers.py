@@ -6,9 +6,9 @@ events such as connection, disconnection, and message handling.
 import json
 import asyncio
 import pytz
-from datetime import datetime
 
 from http.cookies import SimpleCookie
+from urllib.parse import parse_qs
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.utils import timezone
@@ -17,7 +17,8 @@ from django.conf import settings
 from django.urls import reverse
 from django.db.models import Q, F, Value, CharField
 from django.db.models.functions import Concat
-from django.core.cache import cache
+from .misc.counters import mark_online, mark_offline, refresh_online
+from .misc.notification_fanout import notification_event
 
 
 class NotificationConsumer(AsyncWebsocketConsumer):
@@ -36,39 +37,67 @@ class NotificationConsumer(AsyncWebsocketConsumer):
 
             self.current_language = get_language()
 
-            past_notifications = await self.get_all_notifications(user)
-
-            for notification in past_notifications:
-                notification_message = (
-                    notification.message_ro
-                    if self.current_language == "ro"
-                    else notification.message
-                )
-
-                await self.send_notification(
-                    {
-                        "id": notification.id,
-                        "message": notification.message,
-                        "message_ro": notification.message_ro,
-                        "is_read": notification.is_read,
-                        "is_active": notification.is_active,
-                        "timestamp": notification.timestamp.isoformat(),
-                        "delivered": notification.delivered,
-                    }
-                )
+            # The client passes the id of the newest notification it has
+            # already received, so only the newer ones are sent again, along
+            # with the current state of the ones it already has
+            notifications, has_more, states = await self.get_notification_backlog(
+                user, self.get_since()
+            )
+            await self.send_backlog(notifications, has_more, states=states)
 
     async def disconnect(self, close_code):
         if hasattr(self, "user_id"):
             await self.channel_layer.group_discard(self.group_name, self.channel_name)
 
-    async def send_notification(self, event):
+    async def receive(self, text_data):
+        """Send the page of notifications older than the 'before' id the client
+        asks for, while it loads a backlog that did not fit in one frame."""
+        if not hasattr(self, "user_id"):
+            return
+
+        try:
+            before = json.loads(text_data).get("before")
+        except (ValueError, AttributeError):
+            return
+        if before is not None and not isinstance(before, int):
+            return
+
+        notifications, has_more = await self.get_notification_page(
+            self.scope["user"], before
+        )
+        await self.send_backlog(notifications, has_more, before=before)
+
+    async def send_backlog(self, notifications, has_more, **fields):
+        await self.send(
+            text_data=json.dumps(
+                {
+                    "type": "backlog",
+                    "notifications": [
+                        self.notification_data(notification_event(notification))
+                        for notification in notifications
+                    ],
+                    "has_more": has_more,
+                    **fields,
+                }
+            )
+        )
 
+    def get_since(self):
+        """Return the notification id passed as 'since' in the query string."""
+        query = parse_qs(self.scope.get("query_string", b"").decode())
+        try:
+            return int(query["since"][0])
+        except (KeyError, ValueError):
+            return None
+
+    def notification_data(self, event):
+        """Return the notification of an event in the current language."""
         if self.current_language == "ro":
             notification_message = event.get("message_ro", event.get("message"))
         else:
             notification_message = event.get("message")
 
-        notification_data = {
+        return {
             "id": event.get("id"),
             "message": notification_message,
             "is_read": event.get("is_read"),
@@ -77,14 +106,29 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             "delivered": event.get("delivered"),
         }
 
-        await self.send(text_data=json.dumps(notification_data))
+    async def send_notification(self, event):
+        await self.send(text_data=json.dumps(self.notification_data(event)))
 
     @database_sync_to_async
-    def get_all_notifications(self, user):
-        from .models import Notification
-        return list(
-            Notification.objects.filter(user=user, is_active=True, delivered=True)
+    def get_notification_backlog(self, user, since):
+        from .misc.helper_functions import (
+            get_notification_backlog,
+            get_notification_states,
         )
+        notifications, has_more = get_notification_backlog(user, since)
+        states = None
+        if since:
+            states, more_states = get_notification_states(user, since)
+            # Not all of the stored notifications can be brought up to date,
+            # so the client loads them again
+            if more_states:
+                states, has_more = None, True
+        return notifications, has_more, states
+
+    @database_sync_to_async
+    def get_notification_page(self, user, before):
+        from .misc.helper_functions import get_notification_backlog
+        return get_notification_backlog(user, before=before)
 
 
 class ChatConsumer(AsyncWebsocketConsumer):
@@ -185,6 +229,8 @@ class ChatConsumer(AsyncWebsocketConsumer):
 class PrivateChatConsumer(AsyncWebsocketConsumer):
     """
     Handles WebSocket connections for private chat between two users.
+    Messages are only published by the create_message view once they are saved,
+    so frames sent by the clients are ignored.
     """
 
     async def connect(self):
@@ -207,39 +253,6 @@ class PrivateChatConsumer(AsyncWebsocketConsumer):
     async def disconnect(self, close_code):
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
 
-    async def receive(self, text_data):
-        """
-        Process incoming WebSocket messages and broadcast to the group.
-        """
-        text_data_json = json.loads(text_data)
-
-        message = text_data_json.get("message")
-        file = text_data_json.get("file")
-        file_size = text_data_json.get("file_size")
-        is_pinned = text_data_json.get("is_pinned")
-        edited = text_data_json.get("edited")
-        message_id = text_data_json.get("message_id")
-
-        profile_picture_url = await self.get_profile_picture_url(self.user)
-
-        if message or file:
-            await self.channel_layer.group_send(
-                self.room_group_name,
-                {
-                    "type": "private_chat_message",
-                    "message": message,
-                    "sender_id": self.user.id,
-                    "recipient_id": self.other_user.id,
-                    "file": file,
-                    "file_size": file_size,
-                    "created_at": datetime.now().isoformat(),
-                    "profile_picture_url": profile_picture_url,
-                    "is_pinned": is_pinned,
-                    "edited": edited,
-                    "id": message_id,
-                },
-            )
-
     async def private_chat_message(self, event):
         """
         Send the chat message event to the WebSocket client.
@@ -267,13 +280,6 @@ class PrivateChatConsumer(AsyncWebsocketConsumer):
         """
         return f"private_chat_{min(user_id_1, user_id_2)}_{max(user_id_1, user_id_2)}"
 
-    @database_sync_to_async
-    def get_profile_picture_url(self, user):
-        """
-        Retrieve the profile picture URL for a given user.
-        """
-        return user.userprofile.profile_picture.url
-
     @database_sync_to_async
     def get_user(self, user_id):
         """
@@ -358,6 +364,8 @@ class PrivateChatConsumer(AsyncWebsocketConsumer):
 class GlobalChatConsumer(AsyncWebsocketConsumer):
     """
     Handles WebSocket connections for the global chat room where all users can join and exchange messages.
+    Messages are only published by the create_global_chat_message view once they are saved,
+    so frames sent by the clients are ignored.
     """
 
     async def connect(self):
@@ -371,41 +379,10 @@ class GlobalChatConsumer(AsyncWebsocketConsumer):
     async def disconnect(self, close_code):
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
 
-    @database_sync_to_async
-    def get_user_profile_name(self, user):
-        """Retrieve the profile name of the user."""
-        return user.userprofile.profile_name
-
-    @database_sync_to_async
-    def get_profile_picture_url(self, user):
-        """Retrieve the profile picture URL for the user."""
-        return user.userprofile.profile_picture.url
-
     def get_full_profile_picture_url(self, profile_picture_path):
         """Generates the full URL for the profile picture."""
         return f"{settings.MEDIA_URL}{profile_picture_path}"
 
-    async def receive(self, text_data):
-        text_data_json = json.loads(text_data)
-        message = text_data_json.get("message")
-
-        if message:
-            profile_picture_url = await self.get_profile_picture_url(self.user)
-            profile_name = await self.get_user_profile_name(self.user)
-            created_at = datetime.now().isoformat()
-
-            await self.channel_layer.group_send(
-                self.room_group_name,
-                {
-                    "type": "chat_message",
-                    "message": message,
-                    "sender_id": self.user.id,
-                    "sender_name": profile_name,
-                    "profile_picture_url": profile_picture_url,
-                    "created_at": created_at,
-                },
-            )
-
     async def chat_message(self, event):
         message = event["message"]
         sender_id = event["sender_id"]
@@ -416,6 +393,7 @@ class GlobalChatConsumer(AsyncWebsocketConsumer):
         await self.send(
             text_data=json.dumps(
                 {
+                    "id": event.get("id"),
                     "message": message,
                     "sender_id": sender_id,
                     "sender_name": sender_name,
@@ -475,8 +453,6 @@ class PresenceConsumer(AsyncWebsocketConsumer):
             await self.close()
             return
 
-        self.key = f"online:{self.user.id}"
-
         await database_sync_to_async(self.increment)()
         await self.accept()
 
@@ -495,23 +471,15 @@ class PresenceConsumer(AsyncWebsocketConsumer):
             await database_sync_to_async(self.refresh_cache)()
 
     def increment(self):
-        count = cache.get(self.key, 0) + 1
-        cache.set(self.key, count, timeout=70)
+        mark_online(self.user.id)
 
     def decrement(self):
-        count = cache.get(self.key, 0) - 1
-
-        if count <= 0:
-            cache.delete(self.key)
+        if mark_offline(self.user.id):
             from .models import UserProfile
             UserProfile.objects.filter(user_id=self.user.id).update(
                 last_online=timezone.now()
             )
-        else:
-            cache.set(self.key, count, timeout=70)
 
     def refresh_cache(self):
         """Refresh the cache to keep user online"""
-        count = cache.get(self.key, 0)
-        if count > 0:
-            cache.set(self.key, count, timeout=70)
\ No newline at end of file
+        refresh_online(self.user.id)
\ No newline at end of file
@@ -0,0 +1,204 @@
+"""Command used to measure the delivery of group messages to websockets held
+by several worker processes, like the global chat sockets of the ASGI workers
+sharing the channel layer."""
+
+import asyncio
+import multiprocessing
+import queue
+import statistics
+import time
+
+from channels.layers import InMemoryChannelLayer, get_channel_layer
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.utils.module_loading import import_string
+
+from users.misc.fake_redis import redis_channel_layers, start_fake_redis
+from users.routing import websocket_urlpatterns
+
+GROUP_NAME = "global_chat"
+SOCKET_PATH = "/ws/global_chat/"
+SENDER_NAME = "benchmark_channel_layer"
+
+# Seconds a socket waits for the next message before counting it as lost.
+RECEIVE_TIMEOUT = 5
+
+
+def run_worker(index, sockets, messages, ready, results):
+    """Open websockets to the global chat, then receive the benchmark messages
+    on every socket and report their delivery latencies."""
+
+    async def receive():
+        application = URLRouter(websocket_urlpatterns)
+        communicators = []
+        for _ in range(sockets):
+            communicator = WebsocketCommunicator(application, SOCKET_PATH)
+            communicator.scope["user"] = AnonymousUser()
+            connected, _ = await communicator.connect()
+            if connected:
+                communicators.append(communicator)
+        ready.set()
+
+        async def receive_on(communicator):
+            latencies = []
+            while len(latencies) < messages:
+                try:
+                    frame = await communicator.receive_json_from(RECEIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                # The existing messages sent on connect are not measured
+                if frame.get("sender_name") == SENDER_NAME:
+                    latencies.append(time.time() - frame["created_at"])
+            return latencies
+
+        received = await asyncio.gather(*map(receive_on, communicators))
+
+        for communicator in communicators:
+            await communicator.disconnect()
+
+        return [latency for latencies in received for latency in latencies]
+
+    results.put((index, asyncio.run(receive())))
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks global chat messages sent through the channel layer to "
+        "websockets opened in several worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of worker processes holding sockets. Defaults to 4.",
+        )
+        parser.add_argument(
+            "--sockets",
+            type=int,
+            default=250,
+            help="Number of websockets per worker. Defaults to 250.",
+        )
+        parser.add_argument(
+            "--messages",
+            type=int,
+            default=20,
+            help="Number of group messages sent. Defaults to 20.",
+        )
+        parser.add_argument(
+            "--fake-redis",
+            choices=sorted(settings.CHANNEL_LAYER_BACKENDS),
+            help=(
+                "Share the given Redis channel layer through the fakeredis "
+                "stand-in instead of the configured one."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["fake_redis"]:
+            server, url = start_fake_redis()
+            try:
+                with override_settings(
+                    CHANNEL_LAYERS=redis_channel_layers(url, options["fake_redis"])
+                ):
+                    self.benchmark(options)
+            finally:
+                server.shutdown()
+                server.server_close()
+        else:
+            self.benchmark(options)
+
+    def benchmark(self, options):
+        # The layer is only created after forking, so that each worker has its
+        # own client like the ASGI workers do
+        backend = import_string(settings.CHANNEL_LAYERS["default"]["BACKEND"])
+        if issubclass(backend, InMemoryChannelLayer):
+            raise CommandError(
+                "The in-memory channel layer only delivers within one process, "
+                "set CHANNEL_REDIS_URL or pass --fake-redis to benchmark a "
+                "shared channel layer."
+            )
+
+        workers, sockets, messages = (
+            options["workers"],
+            options["sockets"],
+            options["messages"],
+        )
+
+        # Forked workers share the settings of this process, such as the
+        # channel layer of --fake-redis
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        processes = []
+        for index in range(workers):
+            ready = context.Event()
+            process = context.Process(
+                target=run_worker, args=(index, sockets, messages, ready, results)
+            )
+            process.start()
+            processes.append((process, ready))
+
+        for process, ready in processes:
+            if not ready.wait(60):
+                raise CommandError("A worker did not open its sockets in time.")
+
+        async def send():
+            layer = get_channel_layer()
+            start = time.perf_counter()
+            for number in range(messages):
+                await layer.group_send(
+                    GROUP_NAME,
+                    {
+                        "type": "chat_message",
+                        "id": number,
+                        "message": f"Message {number}",
+                        "sender_id": 0,
+                        "sender_name": SENDER_NAME,
+                        "profile_picture_url": "",
+                        "created_at": time.time(),
+                    },
+                )
+            return time.perf_counter() - start
+
+        send_time = asyncio.run(send())
+
+        latencies = {}
+        for _ in processes:
+            try:
+                index, received = results.get(timeout=RECEIVE_TIMEOUT * messages)
+            except queue.Empty:
+                break
+            latencies[index] = received
+        for process, _ in processes:
+            process.join()
+
+        self.stdout.write(
+            f"Backend: {backend.__name__}, {workers} workers, "
+            f"{workers * sockets} sockets, {messages} group messages "
+            f"sent in {send_time * 1000:.1f}ms"
+        )
+        for index in range(workers):
+            self.write_delivery(
+                f"Worker {index + 1}", latencies.get(index, []), sockets * messages
+            )
+        self.write_delivery(
+            "Total",
+            [latency for received in latencies.values() for latency in received],
+            workers * sockets * messages,
+        )
+
+    def write_delivery(self, label, latencies, expected):
+        line = f"{label}: delivered {len(latencies)} of {expected} messages"
+        if latencies:
+            latencies = sorted(latencies)
+            line += (
+                f", latency median {statistics.median(latencies) * 1000:.1f}ms, "
+                f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f}ms, "
+                f"max {latencies[-1] * 1000:.1f}ms"
+            )
+        self.stdout.write(line)
@@ -0,0 +1,95 @@
+"""Command used to measure how many private chat messages per second one worker
+creates and publishes through the create_message endpoint."""
+
+import asyncio
+import time
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import AsyncClient
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+# Messages a sender can create before the chat rate limit applies.
+MESSAGES_PER_SENDER = 20
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the private chat messages created per second by the "
+        "create_message endpoint in this process. The benchmark users and "
+        "messages are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--messages",
+            type=int,
+            default=400,
+            help="Number of messages sent. Defaults to 400.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=10,
+            help="Number of requests in flight at once. Defaults to 10.",
+        )
+
+    def handle(self, *args, **options):
+        messages, concurrency = options["messages"], options["concurrency"]
+        url = reverse("users:create_message")
+
+        async def send(senders):
+            clients = []
+            for sender, recipient in senders:
+                client = AsyncClient()
+                await client.aforce_login(sender)
+                session = await client.asession()
+                await session.aset("user_id", sender.id)
+                await session.aset("recipient_id", recipient.id)
+                await session.asave()
+                clients.append(client)
+
+            pending = [
+                clients[number // MESSAGES_PER_SENDER] for number in range(messages)
+            ]
+            limit = asyncio.Semaphore(concurrency)
+            statuses = []
+
+            async def post(client, number):
+                async with limit:
+                    response = await client.post(
+                        url, {"content": f"Message {number}"}, secure=True
+                    )
+                    statuses.append(response.status_code)
+
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(post(client, number) for number, client in enumerate(pending))
+            )
+            return time.perf_counter() - start, statuses
+
+        setup_test_environment()
+        try:
+            with transaction.atomic():
+                recipient = User.objects.create_user(username="benchmark_recipient")
+                senders = [
+                    (
+                        User.objects.create_user(username=f"benchmark_{number}"),
+                        recipient,
+                    )
+                    for number in range(-(-messages // MESSAGES_PER_SENDER))
+                ]
+                elapsed, statuses = async_to_sync(send)(senders)
+                transaction.set_rollback(True)
+        finally:
+            teardown_test_environment()
+
+        created = statuses.count(201)
+        self.stdout.write(
+            f"Created {created} of {messages} messages in {elapsed * 1000:.1f}ms, "
+            f"{concurrency} in flight"
+        )
+        self.stdout.write(f"Throughput: {created / elapsed:.1f} messages/second")
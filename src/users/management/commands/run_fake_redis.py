@@ -0,0 +1,36 @@
+"""Command used to serve the fakeredis stand-in, so several local ASGI workers
+can share a Redis channel layer without a Redis server."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from users.misc.fake_redis import start_fake_redis
+
+
+class Command(BaseCommand):
+    help = (
+        "Serves a fakeredis stand-in for Redis until interrupted. Point "
+        "CHANNEL_REDIS_URL of the workers at the printed URL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=6379,
+            help="Port to listen on. Defaults to 6379.",
+        )
+
+    def handle(self, *args, **options):
+        server, url = start_fake_redis(port=options["port"])
+        self.stdout.write(f"Serving fakeredis at {url}")
+
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+            server.server_close()
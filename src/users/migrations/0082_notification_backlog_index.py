@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0081_remove_userprofile_is_online_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "is_active", "delivered", "-timestamp"],
+                name="users_notif_user_id_e09570_idx",
+            ),
+        ),
+    ]
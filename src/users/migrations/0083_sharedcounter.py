@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0082_notification_backlog_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SharedCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=255, unique=True)),
+                ("value", models.IntegerField(default=0)),
+                ("expires", models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
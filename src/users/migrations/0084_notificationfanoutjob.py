@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0083_sharedcounter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationFanoutJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("user_ids", models.JSONField()),
+                ("message", models.TextField()),
+                ("message_ro", models.TextField()),
+                (
+                    "notification_type",
+                    models.CharField(
+                        choices=[
+                            ("review", "Review"),
+                            ("follow", "Follow"),
+                            ("friend_request", "Friend Request"),
+                            ("message", "Message"),
+                            ("chat_message", "Chat Message"),
+                            ("shared_game", "Shared Game"),
+                            ("shared_game_list", "Shared Game List"),
+                            ("shared_deal", "Shared Game Deal"),
+                            ("shared_review", "Shared Game Review"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ["created_at", "id"],
+            },
+        ),
+    ]
@@ -0,0 +1,161 @@
+"""This module contains the counters shared by the workers, for the online
+presence of users and the rate limits of chat messages.
+
+The counters only change through atomic increments, so the connections and
+requests handled by different workers add up instead of overwriting each other's
+counts. They are cache increments when the cache is Redis, or the memory cache
+of a single process. With the database cache, whose increments read the value
+and write it back, they are UPDATE statements on the SharedCounter table."""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ..models import SharedCounter
+
+# Seconds a user stays online without a heartbeat from any connection.
+PRESENCE_TIMEOUT = 70
+
+
+class CacheCounters:
+    """Counters kept in the cache, as cache increments."""
+
+    def increment(self, key, timeout):
+        """Add one to a counter, creating it with the timeout when it does not
+        exist, and return the new count."""
+        cache.add(key, 0, timeout=timeout)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # The counter expired between the two calls
+            cache.add(key, 1, timeout=timeout)
+            return 1
+
+    def decrement(self, key):
+        """Subtract one from a counter and return the new count, or 0 when it
+        does not exist."""
+        try:
+            count = cache.decr(key)
+        except ValueError:
+            return 0
+
+        if count < 0:
+            # Only this decrement is undone, so the counter stays at zero
+            # without losing the increments of other workers
+            cache.incr(key)
+            return 0
+        return count
+
+    def get(self, key):
+        """Return the count of a counter, or None when it does not exist."""
+        return cache.get(key)
+
+    def touch(self, key, timeout):
+        """Expire a counter after another timeout."""
+        cache.touch(key, timeout)
+
+    def discard(self, key):
+        """Leave a counter that dropped to zero to expire. Deleting it could
+        drop the increment of another worker made since it was read."""
+
+
+class DatabaseCounters:
+    """Counters kept in the SharedCounter table, as UPDATE statements adding to
+    the stored value."""
+
+    def live(self, key):
+        return SharedCounter.objects.filter(key=key, expires__gt=timezone.now())
+
+    def increment(self, key, timeout):
+        """Add one to a counter, creating it with the timeout when it does not
+        exist, and return the new count."""
+        while True:
+            counters = self.live(key)
+            if counters.update(value=F("value") + 1):
+                return counters.values_list("value", flat=True).first() or 1
+
+            now = timezone.now()
+            try:
+                with transaction.atomic():
+                    # Also removes the counters of past rate limit windows
+                    SharedCounter.objects.filter(expires__lte=now).delete()
+                    SharedCounter.objects.create(
+                        key=key, value=1, expires=now + timedelta(seconds=timeout)
+                    )
+                return 1
+            except IntegrityError:
+                # Another worker created the counter in the meantime
+                continue
+
+    def decrement(self, key):
+        """Subtract one from a counter and return the new count, or 0 when it
+        does not exist."""
+        counters = self.live(key)
+        if not counters.update(value=F("value") - 1):
+            return 0
+        return counters.values_list("value", flat=True).first() or 0
+
+    def get(self, key):
+        """Return the count of a counter, or None when it does not exist."""
+        return self.live(key).values_list("value", flat=True).first()
+
+    def touch(self, key, timeout):
+        """Expire a counter after another timeout."""
+        self.live(key).update(expires=timezone.now() + timedelta(seconds=timeout))
+
+    def discard(self, key):
+        """Remove a counter that dropped to zero, unless another worker counted
+        up again in the meantime."""
+        SharedCounter.objects.filter(key=key, value__lte=0).delete()
+
+
+cache_counters = CacheCounters()
+database_counters = DatabaseCounters()
+
+
+def get_counters():
+    """Return the counters selected by the SHARED_COUNTERS_IN_DATABASE setting."""
+    if settings.SHARED_COUNTERS_IN_DATABASE:
+        return database_counters
+    return cache_counters
+
+
+def presence_key(user_id):
+    """Return the key counting the open connections of a user."""
+    return f"online:{user_id}"
+
+
+def mark_online(user_id):
+    """Count a new connection of a user."""
+    counters, key = get_counters(), presence_key(user_id)
+    counters.increment(key, PRESENCE_TIMEOUT)
+    counters.touch(key, PRESENCE_TIMEOUT)
+
+
+def mark_offline(user_id):
+    """Count a closed connection of a user. Returns True when it was the last
+    open connection of the user."""
+    counters, key = get_counters(), presence_key(user_id)
+    if counters.decrement(key) <= 0:
+        counters.discard(key)
+        return True
+
+    counters.touch(key, PRESENCE_TIMEOUT)
+    return False
+
+
+def refresh_online(user_id):
+    """Keep a user with open connections online for another timeout."""
+    get_counters().touch(presence_key(user_id), PRESENCE_TIMEOUT)
+
+
+def is_rate_limited(key, limit, window):
+    """Count an action of the key and return True when more than limit actions
+    were counted in the current window of seconds."""
+    window_key = f"{key}:{int(time.time() // window)}"
+    return get_counters().increment(window_key, window) > limit
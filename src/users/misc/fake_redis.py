@@ -0,0 +1,30 @@
+"""This module contains a Redis stand-in served by fakeredis from a thread of
+the current process. The Redis channel layers of several worker processes can
+share it without a Redis server, in the tests, the benchmarks and local runs."""
+
+import threading
+
+
+def start_fake_redis(host="127.0.0.1", port=0):
+    """Serve a fakeredis server from a daemon thread, on a free port unless one
+    is given, and return the server and its Redis URL. The server stops with
+    server.shutdown()."""
+    from fakeredis import TcpFakeServer
+
+    server = TcpFakeServer((host, port), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    host, port = server.server_address
+    return server, f"redis://{host}:{port}/0"
+
+
+def redis_channel_layers(url, backend="redis"):
+    """Return the CHANNEL_LAYERS setting of a Redis channel layer at the URL."""
+    from django.conf import settings
+
+    return {
+        "default": {
+            "BACKEND": settings.CHANNEL_LAYER_BACKENDS[backend],
+            "CONFIG": {"hosts": [url]},
+        }
+    }
@@ -4,14 +4,23 @@ import random
 from collections import defaultdict
 from ..models import FriendList, QuizUserResponse, QuizQuestion, Notification, UserProfile
 from playstyle_compass.models import Game
+from playstyle_compass.helper_functions.game_attributes import attribute_filter
 from django.utils import timezone
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
 from datetime import timedelta
 from django.urls import reverse
 from .variables import NOTIFICATION_TEMPLATES_RO
+from .counters import get_counters, presence_key
 import pytz
 
+# Most notifications sent when a notifications socket connects.
+NOTIFICATION_BACKLOG_LIMIT = 50
+
+
 def are_friends(user1, user2):
     """Function to check if two users are friends."""
     friend_list_user1, created = FriendList.objects.get_or_create(user=user1)
@@ -77,9 +86,9 @@ class QuizRecommendations:
         for concept, num_games in concept_recommendations.items():
             num_games = max(num_games, 1)
             # Query games for the concept that are not already recommended
-            games = Game.objects.filter(concepts__icontains=concept).exclude(
-                pk__in=recommended_game_guids
-            )
+            games = Game.objects.filter(
+                attribute_filter("concepts", concept, "iexact")
+            ).exclude(pk__in=recommended_game_guids)
             # Convert queryset to list for random selection
             games_list = list(games)
             # Randomly select recommended games
@@ -92,7 +101,7 @@ class QuizRecommendations:
     def _save_recommendations_to_preferences(self, recommended_game_guids):
         """Save recommended game guids in user preferences."""
         self.user.userpreferences.quiz_recommendations = recommended_game_guids
-        self.user.userpreferences.save()
+        self.user.userpreferences.save(update_fields=["quiz_recommendations"])
 
     def get_recommendations(self):
         """Get game recommendations based on user responses."""
@@ -145,17 +154,9 @@ def save_quiz_responses(user, questions, form):
             raise ValidationError("Invalid option selected")
 
 
-def create_notification(user, message, notification_type, **kwargs):
-    """Helper function used to create a notification and mark the delivered
-    based on user preferences."""
-    user_preferences = user.userprofile
-
-    delivered = True
-    preference_field = f"receive_{notification_type}_notifications"
-
-    if hasattr(user_preferences, preference_field):
-        delivered = getattr(user_preferences, preference_field)
-
+def format_notification_messages(message, notification_type, **kwargs):
+    """Helper function used to return the English and Romanian messages of a
+    notification, the latter formatted from its template with the kwargs."""
     if isinstance(message, str):
         message = message.replace("/ro", "/en")
 
@@ -185,6 +186,24 @@ def create_notification(user, message, notification_type, **kwargs):
             **updated_kwargs
         )
 
+    return message, message_ro
+
+
+def create_notification(user, message, notification_type, **kwargs):
+    """Helper function used to create a notification and mark the delivered
+    based on user preferences."""
+    user_preferences = user.userprofile
+
+    delivered = True
+    preference_field = f"receive_{notification_type}_notifications"
+
+    if hasattr(user_preferences, preference_field):
+        delivered = getattr(user_preferences, preference_field)
+
+    message, message_ro = format_notification_messages(
+        message, notification_type, **kwargs
+    )
+
     notification = Notification(
         user=user,
         message=message,
@@ -196,6 +215,32 @@ def create_notification(user, message, notification_type, **kwargs):
     notification.save()
 
 
+def save_chat_file(file):
+    """Helper function used to store a file sent in chat and return its url."""
+    file_name = default_storage.save(
+        f"chat_files/{file.name}", ContentFile(file.read())
+    )
+    return default_storage.url(file_name)
+
+
+async def get_chat_block(sender, recipient):
+    """Helper function used to check with a single query whether either user
+    blocked the other. Returns the user that blocked the other one, if any."""
+    blocked_ids = {
+        blocked_id
+        async for blocked_id in UserProfile.blocked_users.through.objects.filter(
+            Q(userprofile_id=recipient.userprofile.id, user_id=sender.id)
+            | Q(userprofile_id=sender.userprofile.id, user_id=recipient.id)
+        ).values_list("user_id", flat=True)
+    }
+
+    if sender.id in blocked_ids:
+        return recipient
+    if recipient.id in blocked_ids:
+        return sender
+    return None
+
+
 def process_chat_notification(sender, recipient):
     """Helper function used to send a notification when a message in chat is sent
     if the right amount of time has passed since the last notification was sent."""
@@ -228,8 +273,42 @@ def process_chat_notification(sender, recipient):
         recipient.userprofile.last_chat_notification = now
         recipient.userprofile.save()
 
+
+def get_notification_backlog(
+    user, since=None, before=None, limit=NOTIFICATION_BACKLOG_LIMIT
+):
+    """Return the newest active notifications delivered to the user after the
+    notification with the 'since' id and before the one with the 'before' id,
+    at most 'limit' of them, and whether older ones were left out."""
+    notifications = Notification.objects.filter(
+        user=user, is_active=True, delivered=True
+    )
+    if since:
+        notifications = notifications.filter(id__gt=since)
+    if before:
+        notifications = notifications.filter(id__lt=before)
+
+    notifications = list(notifications.order_by("-timestamp", "-id")[: limit + 1])
+    return notifications[:limit], len(notifications) > limit
+
+
+def get_notification_states(user, since, limit=NOTIFICATION_BACKLOG_LIMIT):
+    """Return the id and read state of the newest active notifications delivered
+    to the user up to the notification with the 'since' id, at most 'limit' of
+    them, so a client that already received them can bring them up to date,
+    and whether older ones were left out."""
+    states = list(
+        Notification.objects.filter(
+            user=user, is_active=True, delivered=True, id__lte=since
+        )
+        .order_by("-timestamp", "-id")
+        .values_list("id", "is_read")[: limit + 1]
+    )
+    return states[:limit], len(states) > limit
+
+
 def is_user_online(user_id):
-    return cache.get(f"online:{user_id}") is not None
+    return (get_counters().get(presence_key(user_id)) or 0) > 0
 
 
 def format_last_online(user_profile):
@@ -248,4 +327,4 @@ def format_last_online(user_profile):
         last_online = last_online.astimezone(user_tz)
         return last_online.strftime("%B %d, %Y, %I:%M %p")
 
-    return None
\ No newline at end of file
+    return None
@@ -0,0 +1,165 @@
+"""This module contains the fan-out of a notification to many users, such as
+the followers of a user, with bulk inserts and batched channel layer sends. The
+fan-outs are queued as NotificationFanoutJob rows, committed along with the
+request, and sent by the worker of the recommendation jobs."""
+
+import asyncio
+from datetime import datetime
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+
+from ..models import Notification, NotificationFanoutJob, UserProfile
+from .helper_functions import format_notification_messages
+
+# Notifications inserted, then sent to the channel layer, at once.
+FANOUT_BATCH_SIZE = 500
+
+
+def notification_event(notification):
+    """Return the channel layer event sending a notification to its user."""
+    # Shared channel layers only carry plain values, not datetimes
+    timestamp = notification.timestamp
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+
+    return {
+        "type": "send_notification",
+        "id": notification.id,
+        "message": notification.message,
+        "message_ro": notification.message_ro,
+        "is_read": notification.is_read,
+        "is_active": notification.is_active,
+        "timestamp": timestamp,
+        "delivered": notification.delivered,
+        "notification_type": notification.notification_type,
+    }
+
+
+def publish_notifications(notifications):
+    """Send notifications to the groups of their users, concurrently."""
+    channel_layer = get_channel_layer()
+
+    async def publish():
+        await asyncio.gather(
+            *(
+                channel_layer.group_send(
+                    f"user_{notification.user_id}", notification_event(notification)
+                )
+                for notification in notifications
+            )
+        )
+
+    async_to_sync(publish)()
+
+
+def delivery_preferences(user_ids, notification_type):
+    """Return whether each user receives notifications of the type, by id,
+    with a single query."""
+    preference_field = f"receive_{notification_type}_notifications"
+    try:
+        UserProfile._meta.get_field(preference_field)
+    except FieldDoesNotExist:
+        return {}
+
+    return dict(
+        UserProfile.objects.filter(user_id__in=user_ids).values_list(
+            "user_id", preference_field
+        )
+    )
+
+
+def notify_users(user_ids, message, notification_type, **kwargs):
+    """Create the same notification for every user in batches of bulk inserts,
+    and send the delivered ones to the channel layer after each batch."""
+    message, message_ro = format_notification_messages(
+        message, notification_type, **kwargs
+    )
+    deliver_notifications(user_ids, message, message_ro, notification_type)
+
+
+def deliver_notifications(user_ids, message, message_ro, notification_type):
+    """Create and send a notification whose messages are already formatted."""
+    user_ids = list(user_ids)
+    preferences = delivery_preferences(user_ids, notification_type)
+    timestamp = timezone.now()
+
+    for start in range(0, len(user_ids), FANOUT_BATCH_SIZE):
+        notifications = Notification.objects.bulk_create(
+            Notification(
+                user_id=user_id,
+                message=message,
+                message_ro=message_ro,
+                notification_type=notification_type,
+                delivered=preferences.get(user_id, True),
+                timestamp=timestamp,
+            )
+            for user_id in user_ids[start : start + FANOUT_BATCH_SIZE]
+        )
+        publish_notifications(
+            [notification for notification in notifications if notification.delivered]
+        )
+
+
+def fan_out_notification(user_ids, message, notification_type, **kwargs):
+    """Notify every user off the request path, by queueing a job for the
+    worker. Only when NOTIFICATION_FANOUT_BACKGROUND is disabled, for
+    development without the worker, are they notified inline."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+
+    if not settings.NOTIFICATION_FANOUT_BACKGROUND:
+        notify_users(user_ids, message, notification_type, **kwargs)
+        return
+
+    message, message_ro = format_notification_messages(
+        message, notification_type, **kwargs
+    )
+    NotificationFanoutJob.objects.create(
+        user_ids=user_ids,
+        message=message,
+        message_ro=message_ro,
+        notification_type=notification_type,
+    )
+
+
+def claim_next_fanout_job():
+    """Mark the oldest pending fan-out as running and return it, or None if
+    idle. The status is switched with a conditional update, so a fan-out is
+    never sent by two workers."""
+    while True:
+        job = NotificationFanoutJob.objects.filter(status="pending").first()
+        if job is None:
+            return None
+
+        started_at = timezone.now()
+        claimed = NotificationFanoutJob.objects.filter(
+            pk=job.pk, status="pending"
+        ).update(status="running", started_at=started_at)
+
+        if claimed:
+            job.status = "running"
+            job.started_at = started_at
+            return job
+
+
+def run_fanout_job(job):
+    """Send a claimed fan-out and record its outcome."""
+    try:
+        deliver_notifications(
+            job.user_ids, job.message, job.message_ro, job.notification_type
+        )
+    except Exception as error:
+        job.status = "failed"
+        job.error = str(error)
+    else:
+        job.status = "done"
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "error", "finished_at"])
+
+    return job
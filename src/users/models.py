@@ -236,6 +236,11 @@ class Notification(models.Model):
     delivered = models.BooleanField(default=True)
     message_ro = models.TextField(null=False, blank=False, default="")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "is_active", "delivered", "-timestamp"])
+        ]
+
     def save(self, *args, **kwargs):
         if self.timestamp is None:
             self.timestamp = timezone.now().isoformat()
@@ -331,3 +336,47 @@ class GlobalChatMessage(models.Model):
 
     def __str__(self):
         return f"{self.sender.username}: {self.content}"
+
+
+class SharedCounter(models.Model):
+    """A counter shared by the workers when the cache is the database, such as
+    the open connections of a user or the chat messages in a rate limit window."""
+
+    key = models.CharField(max_length=255, unique=True)
+    value = models.IntegerField(default=0)
+    expires = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.key}: {self.value}"
+
+
+class NotificationFanoutJob(models.Model):
+    """Represents a queued notification of many users, such as the followers of
+    a reviewer, sent by 'python manage.py run_recommendation_worker'."""
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    user_ids = models.JSONField()
+    message = models.TextField()
+    message_ro = models.TextField()
+    notification_type = models.CharField(
+        max_length=20, choices=Notification.NOTIFICATION_TYPES
+    )
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default="pending", db_index=True
+    )
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at", "id"]
+
+    def __str__(self):
+        return f"Notification fan-out to {len(self.user_ids)} users ({self.status})"
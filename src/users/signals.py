@@ -7,6 +7,7 @@ from django.dispatch import receiver
 from django.contrib.auth.models import User
 from playstyle_compass.models import UserPreferences
 from .models import UserProfile, Notification
+from .misc.notification_fanout import notification_event
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 from channels.db import database_sync_to_async
@@ -62,18 +63,7 @@ def notification_created(sender, instance, created, **kwargs):
         user_group_name = f"user_{user.id}"
 
         async_to_sync(channel_layer.group_send)(
-            user_group_name,
-            {
-                "type": "send_notification",
-                "id": instance.id,
-                "message": instance.message,
-                "message_ro": instance.message_ro,
-                "is_read": instance.is_read,
-                "is_active": instance.is_active,
-                "timestamp": instance.timestamp,
-                "delivered": instance.delivered,
-                "notification_type": instance.notification_type,
-            },
+            user_group_name, notification_event(instance)
         )
 
 
@@ -0,0 +1,108 @@
+import asyncio
+import multiprocessing
+from io import StringIO
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, override_settings
+
+from users.consumers import GlobalChatConsumer, NotificationConsumer
+from users.misc.fake_redis import redis_channel_layers, start_fake_redis
+from users.misc.notification_fanout import notification_event
+from users.models import Notification
+
+
+def receive_notification(user_id, ready, results):
+    """Connect a notification socket of the user, then return the next
+    notification it receives."""
+
+    async def receive():
+        communicator = WebsocketCommunicator(
+            NotificationConsumer.as_asgi(), "/ws/notify/"
+        )
+        communicator.scope["user"] = User(id=user_id)
+        await communicator.connect()
+        await communicator.receive_json_from()
+        ready.set()
+        try:
+            return await communicator.receive_json_from(10)
+        finally:
+            await communicator.disconnect()
+
+    results.put(asyncio.run(receive()))
+
+
+class FakeRedisTestCase(SimpleTestCase):
+    def setUp(self):
+        self.server, self.url = start_fake_redis()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@patch.object(
+    NotificationConsumer,
+    "get_notification_backlog",
+    AsyncMock(return_value=([], False, None)),
+)
+class CrossWorkerDeliveryTest(FakeRedisTestCase):
+    def test_group_send_reaches_another_worker(self):
+        notification = Notification(
+            id=1, user_id=7, message="Hello", message_ro="Salut"
+        )
+
+        for backend in settings.CHANNEL_LAYER_BACKENDS:
+            with self.subTest(backend=backend), override_settings(
+                CHANNEL_LAYERS=redis_channel_layers(self.url, backend)
+            ):
+                context = multiprocessing.get_context("fork")
+                ready, results = context.Event(), context.Queue()
+                worker = context.Process(
+                    target=receive_notification, args=(7, ready, results)
+                )
+                worker.start()
+                self.assertTrue(ready.wait(30))
+
+                async_to_sync(get_channel_layer().group_send)(
+                    "user_7", notification_event(notification)
+                )
+
+                received = results.get(timeout=30)
+                worker.join()
+                self.assertEqual(received["id"], 1)
+                self.assertEqual(received["message"], "Hello")
+
+
+class BenchmarkChannelLayerTest(FakeRedisTestCase):
+    @override_settings(
+        CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+    )
+    def test_refuses_in_memory_layer(self):
+        with self.assertRaisesMessage(CommandError, "CHANNEL_REDIS_URL"):
+            call_command("benchmark_channel_layer")
+
+    @patch.object(GlobalChatConsumer, "send_existing_messages", AsyncMock())
+    def test_reports_delivery_per_worker(self):
+        for backend in settings.CHANNEL_LAYER_BACKENDS:
+            with self.subTest(backend=backend):
+                out = StringIO()
+                call_command(
+                    "benchmark_channel_layer",
+                    workers=2,
+                    sockets=3,
+                    messages=4,
+                    fake_redis=backend,
+                    stdout=out,
+                )
+                output = out.getvalue()
+
+                self.assertIn("Worker 1: delivered 12 of 12 messages", output)
+                self.assertIn("Worker 2: delivered 12 of 12 messages", output)
+                self.assertIn("Total: delivered 24 of 24 messages, latency", output)
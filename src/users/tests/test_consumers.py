@@ -0,0 +1,189 @@
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import User
+from django.test import Client, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from users.consumers import (
+    GlobalChatConsumer,
+    NotificationConsumer,
+    PrivateChatConsumer,
+)
+from users.misc.helper_functions import NOTIFICATION_BACKLOG_LIMIT
+from users.models import Notification
+
+
+class NotificationConsumerTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user1", password="pass")
+        self.notifications = [
+            Notification.objects.create(user=self.user, message=f"Notification {n}")
+            for n in range(3)
+        ]
+
+    def receive_backlog(self, path):
+        async def connect():
+            communicator = WebsocketCommunicator(NotificationConsumer.as_asgi(), path)
+            communicator.scope["user"] = self.user
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+
+            frame = await communicator.receive_json_from()
+            self.assertTrue(await communicator.receive_nothing())
+            await communicator.disconnect()
+            return frame
+
+        return async_to_sync(connect)()
+
+    def test_backlog_is_sent_as_one_frame(self):
+        frame = self.receive_backlog("/ws/notify/")
+
+        self.assertEqual(frame["type"], "backlog")
+        self.assertFalse(frame["has_more"])
+        self.assertCountEqual(
+            [notification["id"] for notification in frame["notifications"]],
+            [notification.id for notification in self.notifications],
+        )
+
+    def test_backlog_after_since_cursor(self):
+        frame = self.receive_backlog(f"/ws/notify/?since={self.notifications[1].id}")
+
+        self.assertEqual(
+            [notification["id"] for notification in frame["notifications"]],
+            [self.notifications[2].id],
+        )
+
+    def test_backlog_resyncs_received_notifications(self):
+        received = self.notifications[:2]
+        Notification.objects.filter(id=received[0].id).update(is_active=False)
+        Notification.objects.filter(id=received[1].id).update(is_read=True)
+
+        frame = self.receive_backlog(f"/ws/notify/?since={received[1].id}")
+
+        self.assertEqual(frame["states"], [[received[1].id, True]])
+
+    def test_backlog_without_cursor_has_no_states(self):
+        self.assertIsNone(self.receive_backlog("/ws/notify/")["states"])
+
+    def fill_backlog(self):
+        """Add notifications until the backlog does not fit one frame."""
+        self.notifications += Notification.objects.bulk_create(
+            Notification(
+                user=self.user, message=f"Notification {n}", timestamp=timezone.now()
+            )
+            for n in range(3, NOTIFICATION_BACKLOG_LIMIT + 3)
+        )
+
+    def test_backlog_reloads_unsynced_notifications(self):
+        self.fill_backlog()
+
+        # The states of the received notifications do not fit one frame
+        frame = self.receive_backlog(f"/ws/notify/?since={self.notifications[-1].id}")
+
+        self.assertTrue(frame["has_more"])
+        self.assertIsNone(frame["states"])
+
+    def test_older_pages_are_sent_on_request(self):
+        self.fill_backlog()
+
+        async def page_through():
+            communicator = WebsocketCommunicator(
+                NotificationConsumer.as_asgi(), "/ws/notify/"
+            )
+            communicator.scope["user"] = self.user
+            await communicator.connect()
+            frames = [await communicator.receive_json_from()]
+
+            while frames[-1]["has_more"]:
+                ids = [
+                    notification["id"] for notification in frames[-1]["notifications"]
+                ]
+                await communicator.send_json_to({"before": min(ids)})
+                frames.append(await communicator.receive_json_from())
+
+            await communicator.disconnect()
+            return frames
+
+        frames = async_to_sync(page_through)()
+        pages = [
+            [notification["id"] for notification in frame["notifications"]]
+            for frame in frames
+        ]
+
+        self.assertEqual([len(page) for page in pages], [NOTIFICATION_BACKLOG_LIMIT, 3])
+        self.assertCountEqual(
+            pages[0] + pages[1],
+            [notification.id for notification in self.notifications],
+        )
+        self.assertNotIn("before", frames[0])
+        self.assertEqual(frames[1]["before"], min(pages[0]))
+
+
+class PrivateChatConsumerTest(TransactionTestCase):
+    def setUp(self):
+        self.sender = User.objects.create_user(username="sender", password="pass")
+        self.recipient = User.objects.create_user(username="recipient", password="pass")
+
+    def test_client_frames_are_not_broadcast(self):
+        async def chat():
+            communicators = []
+            for user, other in (
+                (self.sender, self.recipient),
+                (self.recipient, self.sender),
+            ):
+                communicator = WebsocketCommunicator(
+                    PrivateChatConsumer.as_asgi(), f"/ws/private_chat/{other.id}/"
+                )
+                communicator.scope["user"] = user
+                communicator.scope["url_route"] = {"kwargs": {"recipient_id": other.id}}
+                connected, _ = await communicator.connect()
+                self.assertTrue(connected)
+                communicators.append(communicator)
+
+            sender, recipient = communicators
+            await sender.send_json_to({"message": "Never saved", "message_id": 1})
+
+            self.assertTrue(await recipient.receive_nothing())
+            self.assertTrue(await sender.receive_nothing())
+            for communicator in communicators:
+                await communicator.disconnect()
+
+        async_to_sync(chat)()
+
+
+class GlobalChatConsumerTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="sender", password="pass")
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_saved_messages_reach_the_room(self):
+        async def chat():
+            communicator = WebsocketCommunicator(
+                GlobalChatConsumer.as_asgi(), "/ws/global_chat/"
+            )
+            communicator.scope["user"] = self.user
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+
+            # Frames sent by the client are not broadcast
+            await communicator.send_json_to({"message": "Never saved"})
+            self.assertTrue(await communicator.receive_nothing())
+
+            response = await sync_to_async(self.client.post)(
+                reverse("users:create_global_chat_message"),
+                {"content": "Hello"},
+                secure=True,
+            )
+            self.assertEqual(response.status_code, 201)
+
+            frame = await communicator.receive_json_from()
+            await communicator.disconnect()
+            return frame
+
+        frame = async_to_sync(chat)()
+
+        self.assertEqual(frame["message"], "Hello")
+        self.assertEqual(frame["sender_id"], self.user.id)
+        self.assertIsNotNone(frame["id"])
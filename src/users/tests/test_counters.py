@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+import tempfile
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection, connections
+from django.db.utils import load_backend
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from users.misc.counters import (
+    get_counters,
+    is_rate_limited,
+    mark_offline,
+    mark_online,
+    refresh_online,
+)
+from users.models import SharedCounter
+from users.misc.helper_functions import is_user_online
+
+# Long enough for a test never to cross into the next window.
+WINDOW = 10**6
+
+
+def run_in_workers(count, function, *args):
+    """Run a function in count separate processes at once and return their
+    results."""
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    start = context.Barrier(count)
+
+    def run():
+        start.wait()
+        results.put(function(*args))
+
+    processes = [context.Process(target=run, daemon=True) for _ in range(count)]
+    for process in processes:
+        process.start()
+    outcome = [results.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join()
+    return outcome
+
+
+def run_in_worker(function, *args):
+    """Run a function in a separate process and return its result."""
+    return run_in_workers(1, function, *args)[0]
+
+
+def count_up(key, times):
+    for _ in range(times):
+        is_rate_limited(key, times, WINDOW)
+
+
+class CountersTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_user_stays_online_until_last_connection_closes(self):
+        mark_online(1)
+        mark_online(1)
+
+        self.assertFalse(mark_offline(1))
+        self.assertTrue(is_user_online(1))
+
+        self.assertTrue(mark_offline(1))
+        self.assertFalse(is_user_online(1))
+
+    def test_closing_unknown_connection(self):
+        self.assertTrue(mark_offline(2))
+        self.assertFalse(is_user_online(2))
+
+    def test_closing_a_connection_twice(self):
+        mark_online(5)
+        self.assertTrue(mark_offline(5))
+        self.assertTrue(mark_offline(5))
+
+        mark_online(5)
+        self.assertTrue(is_user_online(5))
+
+    def test_offline_user_does_not_remove_a_new_connection(self):
+        counters = get_counters()
+        mark_online(4)
+
+        # Another worker counts a connection between the decrement and the
+        # discard of the closed one
+        self.assertEqual(counters.decrement("online:4"), 0)
+        mark_online(4)
+        counters.discard("online:4")
+
+        self.assertTrue(is_user_online(4))
+        self.assertTrue(mark_offline(4))
+        self.assertFalse(is_user_online(4))
+
+    def test_refresh_does_not_bring_user_online(self):
+        refresh_online(3)
+        self.assertFalse(is_user_online(3))
+
+    def test_rate_limit(self):
+        results = [is_rate_limited("key", limit=3, window=WINDOW) for _ in range(4)]
+        self.assertEqual(results, [False, False, False, True])
+        self.assertFalse(is_rate_limited("other", limit=3, window=WINDOW))
+
+
+@override_settings(SHARED_COUNTERS_IN_DATABASE=True)
+class DatabaseCountersTest(CountersTest, TestCase):
+    def test_expired_counter_starts_again(self):
+        self.assertFalse(is_rate_limited("key", limit=1, window=WINDOW))
+        SharedCounter.objects.update(expires=timezone.now() - timedelta(seconds=1))
+
+        self.assertFalse(is_rate_limited("key", limit=1, window=WINDOW))
+        self.assertEqual(SharedCounter.objects.get().value, 1)
+
+
+@skipUnless(connection.vendor == "sqlite", "Shares a SQLite database file")
+@override_settings(SHARED_COUNTERS_IN_DATABASE=True)
+class SharedDatabaseCountersTest(SimpleTestCase):
+    """Counters updated by worker processes sharing a database file."""
+
+    databases = {"default"}
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        # The test database lives in memory, which processes cannot share
+        backend = load_backend(connection.settings_dict["ENGINE"])
+        shared = backend.DatabaseWrapper(
+            {
+                **connection.settings_dict,
+                "NAME": os.path.join(directory.name, "counters.sqlite3"),
+            },
+            "default",
+        )
+        original = connections["default"]
+        connections["default"] = shared
+        self.addCleanup(setattr, connections, "default", original)
+        self.addCleanup(shared.close)
+
+        with shared.schema_editor() as editor:
+            editor.create_model(SharedCounter)
+        # Workers open their own connection to the file
+        shared.close()
+
+    def test_presence_across_workers(self):
+        run_in_worker(mark_online, 1)
+        run_in_worker(mark_online, 1)
+
+        self.assertFalse(run_in_worker(mark_offline, 1))
+        self.assertTrue(is_user_online(1))
+
+        self.assertTrue(run_in_worker(mark_offline, 1))
+        self.assertFalse(is_user_online(1))
+
+    def test_rate_limit_across_workers(self):
+        for _ in range(2):
+            self.assertFalse(run_in_worker(is_rate_limited, "key", 2, WINDOW))
+
+        self.assertTrue(run_in_worker(is_rate_limited, "key", 2, WINDOW))
+
+    def test_concurrent_increments_add_up(self):
+        run_in_workers(2, count_up, "key", 200)
+
+        self.assertEqual(SharedCounter.objects.get().value, 400)
@@ -336,3 +336,78 @@ class ProcessChatNotificationTests(TestCase):
 
         process_chat_notification(self.sender, self.recipient)
         self.assertEqual(Notification.objects.count(), 1)
+
+
+class GetNotificationBacklogTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user1", password="pass")
+        other = User.objects.create_user(username="user2", password="pass")
+        start = timezone.now() - timedelta(days=1)
+
+        self.notifications = [
+            Notification.objects.create(
+                user=self.user,
+                message=f"Notification {number}",
+                timestamp=start + timedelta(minutes=number),
+            )
+            for number in range(5)
+        ]
+        Notification.objects.create(user=self.user, message="Hidden", is_active=False)
+        Notification.objects.create(user=self.user, message="Muted", delivered=False)
+        Notification.objects.create(user=other, message="Other user")
+
+    def test_newest_notifications_first(self):
+        notifications, has_more = get_notification_backlog(self.user)
+
+        self.assertEqual(notifications, self.notifications[::-1])
+        self.assertFalse(has_more)
+
+    def test_capped_backlog(self):
+        notifications, has_more = get_notification_backlog(self.user, limit=3)
+
+        self.assertEqual(notifications, self.notifications[:1:-1])
+        self.assertTrue(has_more)
+
+    def test_since_cursor(self):
+        since = self.notifications[2].id
+        notifications, has_more = get_notification_backlog(self.user, since)
+
+        self.assertEqual(notifications, self.notifications[:2:-1])
+        self.assertFalse(has_more)
+
+    def test_before_cursor_pages_older_notifications(self):
+        before = self.notifications[3].id
+        notifications, has_more = get_notification_backlog(
+            self.user, before=before, limit=2
+        )
+
+        self.assertEqual(notifications, self.notifications[2:0:-1])
+        self.assertTrue(has_more)
+
+        notifications, has_more = get_notification_backlog(
+            self.user, before=notifications[-1].id, limit=2
+        )
+
+        self.assertEqual(notifications, self.notifications[:1])
+        self.assertFalse(has_more)
+
+    def test_states_up_to_since_cursor(self):
+        self.notifications[1].is_read = True
+        self.notifications[1].save()
+        since = self.notifications[2].id
+
+        self.assertEqual(
+            get_notification_states(self.user, since),
+            (
+                [
+                    (self.notifications[2].id, False),
+                    (self.notifications[1].id, True),
+                    (self.notifications[0].id, False),
+                ],
+                False,
+            ),
+        )
+
+        states, has_more = get_notification_states(self.user, since, limit=1)
+        self.assertEqual(len(states), 1)
+        self.assertTrue(has_more)
@@ -0,0 +1,112 @@
+from io import StringIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from users.misc import notification_fanout
+from users.misc.notification_fanout import (
+    claim_next_fanout_job,
+    fan_out_notification,
+    notify_users,
+    run_fanout_job,
+)
+from users.models import Notification, NotificationFanoutJob
+
+REVIEW_NOTIFICATION = {
+    "message": '<a href="/en/users/profile">Player</a> has posted a review!',
+    "notification_type": "review",
+    "profile_url": "/en/users/profile",
+    "profile_name": "Player",
+    "game_url": "/en/game/1",
+    "game_title": "Alpha",
+}
+
+
+class NotifyUsersTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(username=f"user{number}", password="pass")
+            for number in range(4)
+        ]
+
+        muted = self.users[0].userprofile
+        muted.receive_review_notifications = False
+        muted.save()
+
+        patcher = patch("users.misc.notification_fanout.get_channel_layer")
+        self.channel_layer = MagicMock()
+        self.channel_layer.group_send = AsyncMock()
+        patcher.start().return_value = self.channel_layer
+        self.addCleanup(patcher.stop)
+
+    def notify(self):
+        notify_users([user.id for user in self.users], **REVIEW_NOTIFICATION)
+
+    def test_notifications_follow_preferences(self):
+        self.notify()
+
+        notifications = Notification.objects.order_by("user_id")
+        self.assertEqual(
+            [notification.delivered for notification in notifications],
+            [False, True, True, True],
+        )
+
+        notification = notifications[1]
+        self.assertIn("/ro/game/1", notification.message_ro)
+        self.assertIsNotNone(notification.timestamp)
+
+    def test_one_query_per_batch(self):
+        # The recipients' preferences, then one insert
+        with self.assertNumQueries(2):
+            self.notify()
+
+    @patch.object(notification_fanout, "FANOUT_BATCH_SIZE", 3)
+    def test_delivered_notifications_are_published_in_batches(self):
+        with self.assertNumQueries(3):
+            self.notify()
+
+        groups = [
+            call.args[0] for call in self.channel_layer.group_send.await_args_list
+        ]
+        self.assertCountEqual(groups, [f"user_{user.id}" for user in self.users[1:]])
+
+        event = self.channel_layer.group_send.await_args.args[1]
+        self.assertEqual(event["type"], "send_notification")
+        self.assertIsInstance(event["id"], int)
+        self.assertIsInstance(event["timestamp"], str)
+
+
+class FanOutNotificationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="follower", password="pass")
+
+    @override_settings(NOTIFICATION_FANOUT_BACKGROUND=True)
+    def test_queues_a_job_for_the_worker(self):
+        fan_out_notification([self.user.id], **REVIEW_NOTIFICATION)
+        self.assertFalse(Notification.objects.exists())
+
+        job = run_fanout_job(claim_next_fanout_job())
+
+        self.assertEqual(job.status, "done")
+        self.assertIsNone(claim_next_fanout_job())
+        notification = Notification.objects.get(user=self.user)
+        self.assertIn("/ro/game/1", notification.message_ro)
+
+    @override_settings(NOTIFICATION_FANOUT_BACKGROUND=True)
+    def test_worker_command_sends_fanouts(self):
+        fan_out_notification([self.user.id], **REVIEW_NOTIFICATION)
+        out = StringIO()
+
+        call_command("run_recommendation_worker", "--once", stdout=out)
+
+        self.assertIn("Processed 1 job(s).", out.getvalue())
+        self.assertEqual(NotificationFanoutJob.objects.get().status, "done")
+        self.assertTrue(Notification.objects.filter(user=self.user).exists())
+
+    @override_settings(NOTIFICATION_FANOUT_BACKGROUND=False)
+    def test_runs_inline_when_background_disabled(self):
+        fan_out_notification([self.user.id], **REVIEW_NOTIFICATION)
+
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
@@ -1,3 +1,5 @@
+import json
+
 from django.conf import settings
 from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
@@ -61,6 +63,22 @@ class NotificationSignalTest(TestCase):
 
         mock_layer.group_send.assert_awaited_once()
 
+    @patch("users.signals.get_channel_layer")
+    def test_notification_event_is_serializable(self, mock_get_layer):
+        user = User.objects.create_user("notif", password="pass")
+
+        mock_layer = MagicMock()
+        mock_layer.group_send = AsyncMock()
+        mock_get_layer.return_value = mock_layer
+
+        timestamp = timezone.now()
+        Notification.objects.create(user=user, message="Hello", timestamp=timestamp)
+
+        # Channel layers shared between processes only carry plain values
+        args, kwargs = mock_layer.group_send.await_args
+        self.assertEqual(args[1]["timestamp"], timestamp.isoformat())
+        json.dumps(args[1])
+
 
 class UserStatusSignalTest(TestCase):
     @patch("users.signals.get_channel_layer")
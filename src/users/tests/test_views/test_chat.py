@@ -4,6 +4,9 @@ from django.test import Client, override_settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.cache import cache
 from django.core.files.storage import default_storage
+from unittest.mock import AsyncMock
+from asgiref.sync import async_to_sync
+from users.misc.helper_functions import get_chat_block
 
 
 @override_settings(MEDIA_ROOT="/tmp/django_test_media/")
@@ -33,6 +36,12 @@ class CreateMessageViewTest(TestCase):
         self.assertEqual(response.status_code, 405)
         self.assertIn("Invalid request method", response.json()["error"])
 
+    def test_login_required(self):
+        self.client.logout()
+        response = self.client.post(self.url, {"content": "Hi"}, secure=True)
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(ChatMessage.objects.exists())
+
     def test_missing_session_data(self):
         session = self.client.session
         del session["user_id"]
@@ -90,6 +99,40 @@ class CreateMessageViewTest(TestCase):
         self.assertEqual(msg.sender, self.sender)
         self.assertEqual(msg.recipient, self.recipient)
 
+    @patch("users.views.get_channel_layer")
+    def test_message_is_published_to_chat(self, mock_get_channel_layer):
+        channel_layer = mock_get_channel_layer.return_value
+        channel_layer.group_send = AsyncMock()
+
+        response = self.client.post(self.url, {"content": "Hello"}, secure=True)
+        self.assertEqual(response.status_code, 201)
+
+        room_group_name, event = channel_layer.group_send.await_args.args
+        self.assertEqual(
+            room_group_name, f"private_chat_{self.sender.id}_{self.recipient.id}"
+        )
+        self.assertEqual(event["type"], "private_chat_message")
+        self.assertEqual(event["id"], response.json()["id"])
+        self.assertEqual(event["message"], "Hello")
+        self.assertIn("created_at", event)
+        self.assertFalse(event["is_pinned"])
+
+    def test_block_check_takes_one_query(self):
+        self.recipient.userprofile.blocked_users.add(self.sender)
+        self.sender.userprofile.blocked_users.add(self.recipient)
+
+        with self.assertNumQueries(1):
+            blocked_by = async_to_sync(get_chat_block)(self.sender, self.recipient)
+        self.assertEqual(blocked_by, self.recipient)
+
+        self.recipient.userprofile.blocked_users.clear()
+        self.assertEqual(
+            async_to_sync(get_chat_block)(self.sender, self.recipient), self.sender
+        )
+
+        self.sender.userprofile.blocked_users.clear()
+        self.assertIsNone(async_to_sync(get_chat_block)(self.sender, self.recipient))
+
 
 class EditMessageViewTest(TestCase):
     def setUp(self):
@@ -511,6 +554,21 @@ class CreateGlobalChatMessageViewTest(TestCase):
         self.assertEqual(response.json()["status"], "Message created")
         self.assertTrue(GlobalChatMessage.objects.filter(sender=self.user, content="hello").exists())
 
+    @patch("users.views.get_channel_layer")
+    def test_message_is_published_to_global_chat(self, mock_get_channel_layer):
+        channel_layer = mock_get_channel_layer.return_value
+        channel_layer.group_send = AsyncMock()
+
+        response = self.client.post(self.url, {"content": "hello"}, secure=True)
+        self.assertEqual(response.status_code, 201)
+
+        group_name, event = channel_layer.group_send.await_args.args
+        message = GlobalChatMessage.objects.get()
+        self.assertEqual(group_name, "global_chat")
+        self.assertEqual(event["type"], "chat_message")
+        self.assertEqual(event["id"], message.id)
+        self.assertEqual(event["created_at"], message.created_at.isoformat())
+
     def test_missing_content(self):
         response = self.client.post(self.url, {}, secure=True)
         self.assertEqual(response.status_code, 400)
@@ -522,8 +580,7 @@ class CreateGlobalChatMessageViewTest(TestCase):
         self.assertIn("Invalid request method", response.json()["error"])
 
     def test_rate_limit(self):
-        cache_key = f"global_message_count_{self.user.username}"
-        cache.delete(cache_key)  # reset cache before test
+        cache.clear()  # reset the rate limit counters before test
 
         for _ in range(8):
             self.client.post(self.url, {"content": "spam"}, secure=True)
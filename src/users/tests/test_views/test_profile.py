@@ -2,6 +2,8 @@ from .base import *
 from PIL import Image
 import tempfile
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory
+from users.views import ProfileUpdateView
 
 
 
@@ -60,6 +62,32 @@ class ProfileUpdateTest(TestCase):
         review = Review.objects.get(user=self.user)
         self.assertEqual(review.reviewers, new_name)
 
+    def test_updates_all_reviews_with_one_update(self):
+        game = Game.objects.create(guid="12385", title="Test Game", average_score=0)
+        for score in (1, 3, 5):
+            Review.objects.create(
+                game=game,
+                user=self.user,
+                reviewers="OldName",
+                review_deck="Deck",
+                review_description="Description",
+                score=score,
+            )
+        request = RequestFactory().post(self.url)
+        request.user = self.user
+        view = ProfileUpdateView()
+        view.setup(request)
+
+        # The reviewed games, whose cached review pages are dropped, and the update
+        with self.assertNumQueries(2):
+            view.update_user_reviews("NewName")
+
+        self.assertEqual(
+            set(Review.objects.values_list("reviewers", flat=True)), {"NewName"}
+        )
+        game.refresh_from_db()
+        self.assertEqual((game.total_reviews, game.average_score), (3, 3.0))
+
     def test_success_message_shown(self):
         self.client.login(username="testuser", password="StrongPass123!")
         response = self.client.post(self.url, {"profile_name": "SomeName"}, secure=True, follow=True)
@@ -1,6 +1,5 @@
 """Defines views."""
 
-import time
 import json
 import ast
 from datetime import timedelta
@@ -29,7 +28,7 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 from django.conf import settings
-from django.contrib.auth.views import LoginView
+from django.contrib.auth.views import LoginView, redirect_to_login
 
 from django.template.loader import render_to_string
 from django.contrib.sites.shortcuts import get_current_site
@@ -58,6 +57,7 @@ from django.contrib.auth.tokens import default_token_generator
 
 from playstyle_compass.models import UserPreferences, Review, Game, ListReview, GameList
 
+from playstyle_compass.helper_functions.review_pages import invalidate_review_pages
 from playstyle_compass.helper_functions.views_helpers import (
     paginate_matching_games,
     get_friend_list,
@@ -85,10 +85,13 @@ from .misc.helper_functions import (
     get_quiz_questions,
     save_quiz_responses,
     process_chat_notification,
+    save_chat_file,
+    get_chat_block,
     create_notification,
     is_user_online,
     format_last_online,
 )
+from .misc.counters import is_rate_limited
 
 from .models import (
     UserProfile,
@@ -142,12 +145,19 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         return super().dispatch(request, *args, **kwargs)
 
     def update_user_reviews(self, new_profile_name):
-        """Update the profile name in user reviews after a profile name change."""
+        """Update the profile name in user reviews after a profile name change.
+
+        Only the reviewer label changes, so every review is updated in a single
+        query without loading them or touching the game scores. The cached
+        review pages of the reviewed games are dropped.
+        """
         user_reviews = Review.objects.filter(user=self.request.user)
+        game_ids = set(user_reviews.values_list("game_id", flat=True))
+
+        user_reviews.update(reviewers=new_profile_name)
 
-        for review in user_reviews:
-            review.reviewers = new_profile_name
-            review.save()
+        for game_id in game_ids:
+            invalidate_review_pages(game_id)
 
     def form_valid(self, form):
         """Save the form data and update the user profile and associated reviews."""
@@ -1098,7 +1108,12 @@ def toggle_show_stat(request):
     show_value = not show_value
 
     setattr(user_preferences, attribute_name, show_value)
-    user_preferences.save()
+
+    # Unknown stats are not fields, so nothing is written for them
+    field_names = {field.name for field in UserPreferences._meta.concrete_fields}
+    user_preferences.save(
+        update_fields=[attribute_name] if attribute_name in field_names else []
+    )
 
     return JsonResponse({"show": show_value})
 
@@ -1311,7 +1326,7 @@ def delete_notification(request, notification_id=None):
 def check_authentication(request):
     """Check if an user is authenticated."""
     if request.user.is_authenticated:
-        return JsonResponse({"authenticated": True})
+        return JsonResponse({"authenticated": True, "user_id": request.user.id})
     else:
         return JsonResponse({"authenticated": False})
 
@@ -1462,32 +1477,41 @@ def chat(request, recipient_id: int):
     return render(request, "messaging/chat.html", context)
 
 
-@login_required
-def create_message(request):
+async def create_message(request):
     """View to create/send a chat message to a user."""
+    # The Google OAuth2 backend cannot load users asynchronously, so the user
+    # is not checked with login_required's request.auser()
+    if not await sync_to_async(lambda: request.user.is_authenticated)():
+        return redirect_to_login(request.get_full_path())
+
     if request.method != "POST":
         return JsonResponse({"error": "Invalid request method"}, status=405)
 
     content = request.POST.get("content")
     file_url = None
     file_size = None
-    user_id = request.session.get("user_id")
-    recipient_id = request.session.get("recipient_id")
+    user_id = await request.session.aget("user_id")
+    recipient_id = await request.session.aget("recipient_id")
 
     if not user_id or not recipient_id:
         return JsonResponse({"error": "Forbidden"}, status=403)
 
-    sender = get_object_or_404(User, id=user_id)
-    recipient = get_object_or_404(User, id=recipient_id)
+    users = await User.objects.select_related("userprofile").ain_bulk(
+        [user_id, recipient_id]
+    )
+    if user_id not in users or recipient_id not in users:
+        raise Http404("No User matches the given query.")
 
-    if sender in recipient.userprofile.blocked_users.all():
-        profile_name = recipient.userprofile.profile_name
+    sender, recipient = users[user_id], users[recipient_id]
+    profile_name = recipient.userprofile.profile_name
+
+    blocked_by = await get_chat_block(sender, recipient)
+    if blocked_by == recipient:
         return JsonResponse(
             {"error": f"{profile_name} is no longer available."}, status=403
         )
 
-    if recipient in sender.userprofile.blocked_users.all():
-        profile_name = recipient.userprofile.profile_name
+    if blocked_by == sender:
         return JsonResponse(
             {"error": f"{profile_name} is in your block list."}, status=403
         )
@@ -1504,32 +1528,19 @@ def create_message(request):
                 {"error": "File size exceeds the limit (Max: 25 MB)."}, status=400
             )
 
-        file_name = default_storage.save(
-            f"chat_files/{file.name}", ContentFile(file.read())
-        )
-        file_url = default_storage.url(file_name)
-
     # Rate limiting check -> max 20 messages in 20 seconds
-    cache_key = f"message_count_{user_id}"
-    current_time = time.time()
-
-    message_info = cache.get(cache_key, {"count": 0, "timestamps": []})
-    message_info["timestamps"] = [
-        ts for ts in message_info["timestamps"] if current_time - ts < 20
-    ]
-
-    if len(message_info["timestamps"]) >= 20:
+    if await sync_to_async(is_rate_limited)(
+        f"message_count_{user_id}", limit=20, window=20
+    ):
         return JsonResponse(
             {"error": "You are sending messages too quickly. Please slow down."},
             status=429,
         )
 
-    message_info["timestamps"].append(current_time)
-    message_info["count"] = len(message_info["timestamps"])
-
-    cache.set(cache_key, message_info, timeout=20)
+    if "file" in request.FILES:
+        file_url = await sync_to_async(save_chat_file)(request.FILES["file"])
 
-    message = ChatMessage.objects.create(
+    message = await ChatMessage.objects.acreate(
         sender=sender,
         recipient=recipient,
         content=content,
@@ -1540,8 +1551,8 @@ def create_message(request):
     room_group_name = (
         f"private_chat_{min(sender.id, recipient.id)}_{max(sender.id, recipient.id)}"
     )
-    is_pinned = sender in message.pinned_by.all()
 
+    # A new message is not pinned by anyone yet
     message_data = {
         "type": "private_chat_message",
         "message": content,
@@ -1549,15 +1560,19 @@ def create_message(request):
         "recipient_id": recipient.id,
         "file": file_url if file_url else None,
         "file_size": file_size if file_size else None,
+        "created_at": message.created_at.isoformat(),
         "profile_picture_url": sender.userprofile.profile_picture.url,
-        "is_pinned": is_pinned,
+        "is_pinned": False,
         "edited": message.edited,
         "id": message.id,
     }
-    channel_layer = get_channel_layer()
-    channel_layer.group_send(room_group_name, message_data)
 
-    process_chat_notification(sender, recipient)
+    # The message reaches the chat while the notification is written
+    channel_layer = get_channel_layer()
+    await asyncio.gather(
+        channel_layer.group_send(room_group_name, message_data),
+        sync_to_async(process_chat_notification)(sender, recipient),
+    )
 
     response_data = {
         "status": "Message created",
@@ -1565,7 +1580,7 @@ def create_message(request):
         "file": file_url if file_url else None,
         "file_size": file_size if file_size else None,
         "edited": message.edited,
-        "is_pinned": is_pinned,
+        "is_pinned": False,
     }
 
     return JsonResponse(response_data, status=201)
@@ -1951,15 +1966,8 @@ def create_global_chat_message(request):
 
     user = request.user
 
-    cache_key = f"global_message_count_{user.username}"
-    current_time = time.time()
-
-    message_info = cache.get(cache_key, {"count": 0, "timestamps": []})
-    message_info["timestamps"] = [
-        ts for ts in message_info["timestamps"] if current_time - ts < 15
-    ]
-
-    if len(message_info["timestamps"]) >= 8:
+    # Rate limiting check -> max 8 messages in 15 seconds
+    if is_rate_limited(f"global_message_count_{user.username}", limit=8, window=15):
         return JsonResponse(
             {
                 "error": "You are sending messages too quickly. Please slow down.",
@@ -1968,10 +1976,6 @@ def create_global_chat_message(request):
             status=429,
         )
 
-    message_info["timestamps"].append(current_time)
-    message_info["count"] = len(message_info["timestamps"])
-    cache.set(cache_key, message_info, timeout=15)
-
     global_chat_message = GlobalChatMessage.objects.create(
         sender=user,
         content=content,
@@ -1979,14 +1983,16 @@ def create_global_chat_message(request):
     )
 
     channel_layer = get_channel_layer()
-    channel_layer.group_send(
+    async_to_sync(channel_layer.group_send)(
         "global_chat",
         {
             "type": "chat_message",
+            "id": global_chat_message.id,
             "message": content,
             "sender_id": user.id,
             "sender_name": user.userprofile.profile_name,
             "profile_picture_url": user.userprofile.profile_picture.url,
+            "created_at": global_chat_message.created_at.isoformat(),
         },
     )
 
@@ -2,7 +2,15 @@ fetch(authCheckUrl)
   .then((response) => response.json())
   .then((data) => {
     if (data.authenticated) {
-      const notifications = [];
+      // The notifications received in this tab, and the id of the newest one,
+      // so reconnecting on the next page only receives the newer ones. The
+      // messages are stored in the language of the page.
+      const language = window.location.pathname.split("/")[1];
+      const storageKey = `notifications_${data.user_id}_${language}`;
+      const stored = JSON.parse(sessionStorage.getItem(storageKey) || "null");
+      const notifications = stored ? stored.notifications : [];
+      let since = stored ? stored.since : null;
+
       const notificationsElement = document.getElementById("notifications");
       const markReadUrl = notificationsElement.dataset.markRead;
       const markInactiveUrl = notificationsElement.dataset.markInactive;
@@ -10,22 +18,71 @@ fetch(authCheckUrl)
       document.cookie = "django_timezone=" + timezone;
 
       const protocol = window.location.protocol === "https:" ? "wss" : "ws";
+      const query = since ? `?since=${since}` : "";
       const notifySocket = new WebSocket(
-        `${protocol}://${window.location.host}/ws/notify/`
+        `${protocol}://${window.location.host}/ws/notify/${query}`
       );
 
       notifySocket.onmessage = function (e) {
         if (notifySocket.readyState === WebSocket.OPEN) {
           const data = JSON.parse(e.data);
 
-          if (data.delivered) {
+          if (data.type === "backlog") {
+            addBacklog(data);
+          } else if (data.delivered) {
             addNotification(data);
           }
         }
       };
 
+      const saveNotifications = () => {
+        sessionStorage.setItem(
+          storageKey,
+          JSON.stringify({ notifications: notifications, since: since })
+        );
+      };
+
+      const addBacklog = function (data) {
+        // Pages requested with a 'before' cursor only add older notifications
+        if (!("before" in data)) {
+          if (data.has_more) {
+            // Older notifications were left out, so the stored ones are
+            // outdated and all of them are loaded again, a page at a time
+            notifications.length = 0;
+          } else if (data.states) {
+            // Keep the stored notifications that are still active, as read or
+            // deleted in other tabs since they were stored
+            const states = new Map(data.states);
+            const active = notifications.filter((notification) =>
+              states.has(notification.id)
+            );
+            active.forEach((notification) => {
+              notification.is_read = states.get(notification.id);
+            });
+            notifications.splice(0, notifications.length, ...active);
+          }
+        }
+
+        data.notifications.forEach((notification) => {
+          if (!notifications.some((stored) => stored.id === notification.id)) {
+            notifications.push(notification);
+          }
+          since = Math.max(since || 0, notification.id);
+        });
+
+        if (data.has_more) {
+          // Ask for the page older than the oldest notification received
+          const ids = data.notifications.map((notification) => notification.id);
+          notifySocket.send(
+            JSON.stringify({ before: ids.length ? Math.min(...ids) : null })
+          );
+        }
+        updateNotifications();
+      };
+
       const addNotification = function (data) {
         notifications.push(data);
+        since = Math.max(since || 0, data.id);
         updateNotifications();
       };
 
@@ -170,6 +227,8 @@ fetch(authCheckUrl)
       };
 
       const updateNotifications = () => {
+        saveNotifications();
+
         const ulElement = document.getElementById("notify");
         ulElement.innerHTML = "";
 
@@ -76,6 +76,15 @@ const showMessage = (container, message) => {
     }, 3000);
   };
 
+const markReaction = (container, reaction) => {
+  if (reaction === undefined) {
+    return;
+  }
+
+  container.find(".thumbs-up").toggleClass("reacted", reaction === "like");
+  container.find(".thumbs-down").toggleClass("reacted", reaction === "dislike");
+};
+
 document.querySelectorAll(".author-name").forEach((link) => {
   link.addEventListener("click", function (event) {
     event.preventDefault();
@@ -120,6 +129,7 @@ document.addEventListener("DOMContentLoaded", function () {
         // Update like and dislike counts
         thisContainer.find(".like-count").text(data.likes);
         thisContainer.find(".dislike-count").text(data.dislikes);
+        markReaction(thisContainer, data.reaction);
       },
       error: function (error) {
         console.error(`Error incrementing ${actionType}:`, error);
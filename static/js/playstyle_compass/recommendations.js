@@ -68,4 +68,27 @@ document.addEventListener("DOMContentLoaded", () => {
 
     sortSelect.value = sort;
   });
+
+  const pendingContainer = document.getElementById("recommendations-pending");
+  if (pendingContainer) {
+    const statusUrl = pendingContainer.dataset.statusUrl;
+
+    const pollStatus = () => {
+      fetch(statusUrl)
+        .then((response) => response.json())
+        .then((data) => {
+          if (data.status === "ready") {
+            window.location.reload();
+          } else if (data.status === "failed" || data.status === "timeout") {
+            document.getElementById("recommendations-pending-message").style.display = "none";
+            document.getElementById(`recommendations-${data.status}-message`).style.display = "block";
+          } else {
+            setTimeout(pollStatus, 2000);
+          }
+        })
+        .catch(() => setTimeout(pollStatus, 5000));
+    };
+
+    setTimeout(pollStatus, 2000);
+  }
 });
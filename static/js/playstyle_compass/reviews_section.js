@@ -27,16 +27,20 @@ $(document).ready(function () {
         );
     };
 
-    const fetchReviews = (reviewsList) => {
+    const fetchReviews = (reviewsList, cursor = null) => {
       let game_id = container.data("game-id");
       let reviewsURL = container.data("reviews-url");
+      let params = { game_id: game_id };
+      if (cursor) {
+        params.cursor = cursor;
+      }
       $.ajax({
         url: reviewsURL,
         method: "GET",
-        data: { game_id: game_id },
+        data: params,
         success: function (data) {
-          let { reviews } = data;
-          renderReviews(reviewsList, reviews);
+          let { reviews, next_cursor } = data;
+          renderReviews(reviewsList, reviews, next_cursor, cursor !== null);
           container
             .find(".show-hide-button")
             .text(
@@ -52,9 +56,14 @@ $(document).ready(function () {
       });
     };
 
-    const renderReviews = (reviewsList, reviews) => {
-      reviewsList.empty();
-      if (reviews.length === 0) {
+    const renderReviews = (reviewsList, reviews, nextCursor, append) => {
+      if (append) {
+        reviewsList.find(".load-more-reviews").remove();
+      } else {
+        reviewsList.empty();
+      }
+
+      if (reviews.length === 0 && !append) {
         reviewsList.html(
           "<p>" +
             translate("There are currently no reviews for this game.") +
@@ -82,8 +91,21 @@ $(document).ready(function () {
         });
       }
 
-      const authorNameLinks = document.querySelectorAll(".author-name");
+      if (nextCursor) {
+        $(
+          `<button class="load-more-reviews">${translate(
+            "Show more reviews"
+          )}</button>`
+        )
+          .data("cursor", nextCursor)
+          .appendTo(reviewsList);
+      }
+
+      const authorNameLinks = reviewsList[0].querySelectorAll(
+        ".author-name:not([data-bound])"
+      );
       authorNameLinks.forEach(function (link) {
+        link.dataset.bound = "true";
         link.addEventListener("click", function (event) {
           event.preventDefault();
           const profileUrl = "/users/view_profile/" + this.textContent;
@@ -127,6 +149,17 @@ $(document).ready(function () {
       }, 3000);
     };
 
+    const markReaction = (container, reaction) => {
+      if (reaction === undefined) {
+        return;
+      }
+
+      container.find(".thumbs-up").toggleClass("reacted", reaction === "like");
+      container
+        .find(".thumbs-down")
+        .toggleClass("reacted", reaction === "dislike");
+    };
+
     container
       .on("mouseenter", ".author-container", function () {
         let friendRequestText = $(this).find(".friend-request-text");
@@ -202,6 +235,7 @@ $(document).ready(function () {
 
           likeCountElement.text(data.likes);
           dislikeCountElement.text(data.dislikes);
+          markReaction(this_container, data.reaction);
         },
         error: function (error) {
           console.error(`Error incrementing ${actionType}:`, error);
@@ -218,6 +252,11 @@ $(document).ready(function () {
     });
 
     container.on("click", ".show-hide-button", toggleReviewVisibility);
+    container.on("click", ".load-more-reviews", function () {
+      let reviewsList = container.find(".reviews-list");
+      $(this).prop("disabled", true);
+      fetchReviews(reviewsList, $(this).data("cursor"));
+    });
     container.on("click", ".read-button-review", function () {
       let $description = $(this).parent().find(".review-description");
       let $fullDescription = $(this).parent().find(".review-description-full");
@@ -18,11 +18,15 @@ const reviewTemplate = (
     <div class="review" data-review-id="${review.id}">
         <div class="review-header">
             <div class="like-dislike">
-                <i class="fa-solid fa-thumbs-up thumbs-up" title="${translate(
+                <i class="fa-solid fa-thumbs-up thumbs-up${
+                  review.liked ? " reacted" : ""
+                }" title="${translate(
                   "I like this"
                 )}"></i><span class="like-count">${review.likes}</span>
                 <span class="like-dislike-divider">|</span>
-                <i class="fa-solid fa-thumbs-down thumbs-down" title="${translate(
+                <i class="fa-solid fa-thumbs-down thumbs-down${
+                  review.disliked ? " reacted" : ""
+                }" title="${translate(
                   "I dislike this"
                 )}"></i><span class="dislike-count">${review.dislikes}</span>
                   <span class="like-dislike-divider">|</span>
@@ -14,7 +14,10 @@ searchInput.addEventListener("input", function () {
   }
 
   const searchType = currentSearchType;
-  const autocompleteUrl = `/autocomplete/${searchType}/?query=${query}`;
+  // Suggestions ignore case, so lowercase queries let the browser reuse them.
+  const autocompleteUrl = `/autocomplete/${searchType}/?query=${encodeURIComponent(
+    query.toLowerCase()
+  )}`;
 
   fetch(autocompleteUrl)
     .then((response) => response.json())
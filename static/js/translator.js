@@ -9,6 +9,7 @@ const translate = (key) => {
             'Unselect All': 'Deselectează Tot',
             'Show Reviews': 'Afișează Recenzii',
             'Hide Reviews': 'Ascunde Recenzii',
+            'Show more reviews': 'Afișează mai multe recenzii',
             'No reviews for this game yet.': 'Încă nu există recenzii pentru acest joc.',
             '[Read more...]': '[Citește mai mult...]',
             '[Read less...]': '[Citește mai puțin...]',
@@ -189,19 +189,8 @@ function submit(event) {
   const fileIndicator = document.getElementById("file-indicator");
   const hasFile = fileInput.files.length > 0;
 
-  // Prepare data to send
-  const messageData = {
-    content: textarea.value.trim(),
-    file: null,
-    file_size: null,
-    message_id: null,
-  };
-
   if (hasFile) {
-    const file = fileInput.files[0];
-    messageData.file = file;
-    messageData.file_size = file.size;
-    formData.append("file", file);
+    formData.append("file", fileInput.files[0]);
   }
 
   fetch(endpointUrl, {
@@ -223,17 +212,10 @@ function submit(event) {
         this.errors = {};
         sendButton.disabled = !textarea.value.trim();
 
+        // The server publishes the message to the chat socket
         if (hasFile) {
           fileIndicator.style.display = "none";
         }
-
-        messageData.message_id = body.id;
-        messageData.file = body.file;
-        messageData.file_size = body.file_size;
-        messageData.edited = body.edited;
-        messageData.is_pinned = body.is_pinned;
-
-        sendMessage(messageData);
       } else {
         this.state = "error";
         this.errors = { message: body.error || "Unknown error" };
@@ -256,24 +238,6 @@ function submit(event) {
     });
 }
 
-function sendMessage({ content, file, file_size, message_id, edited, is_pinned }) {
-  const message = {
-    message: content,
-    file: file,
-    file_size: file_size,
-    message_id: message_id,
-    edited: edited,
-    is_pinned: is_pinned,
-  };
-
-  if (socket && socket.readyState === WebSocket.OPEN) {
-    socket.send(JSON.stringify(message));
-  } else {
-    console.error("WebSocket connection is not open.");
-  }
-}
-
-
 function editMessage(messageId) {
   const messageElement = document.querySelector(
     `div[data-message-id='${messageId}']`
@@ -114,11 +114,6 @@ fetch(authCheckUrl)
         .catch(error => console.error('Error loading messages:', error));
     }
 
-      function sendMessage(messageContent) {
-        const messageData = { message: messageContent };
-        socket.send(JSON.stringify(messageData));
-      }
-
       function createMessage(messageContent) {
         const form = document.getElementById("global-chat-form");
         const endpointUrl = form.dataset.url;
@@ -211,7 +206,6 @@ fetch(authCheckUrl)
 
         if (messageContent) {
           createMessage(messageContent);
-          sendMessage(messageContent);
         }
       });
 
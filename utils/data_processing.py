@@ -69,6 +69,13 @@ from sql_queries import (
     create_deals_table,
     insert_deals_sql,
     remove_duplicate_deals,
+    recommendation_jobs_table_exists_sql,
+    enqueue_catalog_refresh_sql,
+    game_attribute_tables,
+    game_attribute_tables_exist_sql,
+    insert_attribute_values_sql,
+    insert_attribute_links_sql,
+    delete_orphan_attribute_links_sql,
 )
 
 
@@ -283,9 +290,34 @@ def create_games_data_db(game_ids, rawg_casual=False, rawg_popular=False):
         cursor.execute(remove_duplicate_stores)
         cursor.execute(remove_duplicates_reviews)
         cursor.execute(remove_empty)
+        sync_game_attribute_tables(cursor)
+        enqueue_recommendation_refresh(cursor)
         db_connection.commit()
 
 
+def sync_game_attribute_tables(cursor):
+    """Links the games to the values of their attribute columns, once the site's tables exist."""
+    cursor.execute(game_attribute_tables_exist_sql)
+    if not cursor.fetchone():
+        return
+
+    for column, table, join_table, key in game_attribute_tables:
+        cursor.execute(insert_attribute_values_sql.format(column=column, table=table))
+        cursor.execute(
+            insert_attribute_links_sql.format(
+                column=column, table=table, join_table=join_table, key=key
+            )
+        )
+        cursor.execute(delete_orphan_attribute_links_sql.format(join_table=join_table))
+
+
+def enqueue_recommendation_refresh(cursor):
+    """Queues a catalog refresh for the recommendation worker, once the site's tables exist."""
+    cursor.execute(recommendation_jobs_table_exists_sql)
+    if cursor.fetchone():
+        cursor.execute(enqueue_catalog_refresh_sql)
+
+
 def parse_franchise_data(franchise_id):
     """Parse franchise data."""
     try:
@@ -351,6 +383,7 @@ def create_franchises_data(franchises_ids):
             db_connection.commit()
 
         cursor.execute(remove_duplicate_franchises)
+        enqueue_recommendation_refresh(cursor)
 
         db_connection.commit()
 
@@ -453,6 +486,7 @@ def create_characters_data(characters_ids):
             db_connection.commit()
 
         cursor.execute(remove_duplicate_characters)
+        enqueue_recommendation_refresh(cursor)
 
         db_connection.commit()
 
@@ -606,6 +640,7 @@ def create_game_modes_data(guids, mode_strings, num_games=10, offset=0):
             db_connection.commit()
 
         cursor.execute(remove_duplicate_game_modes)
+        sync_game_attribute_tables(cursor)
 
         db_connection.commit()
 
@@ -728,6 +763,7 @@ def create_quiz_data(guids, num_games=1, offset=0):
             cursor.execute(remove_duplicates_reviews)
             db_connection.commit()
 
+        sync_game_attribute_tables(cursor)
         db_connection.commit()
 
 
@@ -4,6 +4,22 @@ import os
 
 DB_PATH = "playstyle_db.sqlite3"
 
+# The JSON files are found next to this script, wherever it runs from
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The review counters start from the reactions the reviews really have
+COUNT_REACTIONS = """
+UPDATE Reviews SET
+    likes = (
+        SELECT COUNT(*) FROM ReviewReactions
+        WHERE review_id = Reviews.id AND reaction = 'like'
+    ),
+    dislikes = (
+        SELECT COUNT(*) FROM ReviewReactions
+        WHERE review_id = Reviews.id AND reaction = 'dislike'
+    )
+"""
+
 TABLES = [
     {
         "name": "Games",
@@ -110,69 +126,108 @@ TABLES = [
             game_id TEXT,
             likes INTEGER default 0,
             dislikes INTEGER default 0,
-            liked_by TEXT default '',
-            disliked_by TEXT default '',
             date_added TEXT default ''
         )
         """,
         "unique_check": ("user_id", "game_id", "date_added")
+    },
+    {
+        "name": "ReviewReactions",
+        "json": "db_data/review_reactions_data.json",
+        "schema": """
+        CREATE TABLE IF NOT EXISTS ReviewReactions (
+            id INTEGER PRIMARY KEY,
+            reaction TEXT,
+            review_id INTEGER,
+            user_id INTEGER,
+            UNIQUE (review_id, user_id)
+        )
+        """,
+        "unique_check": ("review_id", "user_id"),
+        # Reactions of users missing from a migrated database are left out
+        "user_check": "user_id",
+        "after": COUNT_REACTIONS
     }
 ]
 
-conn = sqlite3.connect(DB_PATH)
-c = conn.cursor()
+def get_user_ids(c):
+    """Return the ids of the users, or None before the database is migrated."""
+    c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='auth_user'")
+    if not c.fetchone():
+        return None
+
+    return {user_id for (user_id,) in c.execute("SELECT id FROM auth_user")}
 
-total_inserted = 0
 
-for t in TABLES:
-    print("Processing", t["name"])
+def populate(db_path=DB_PATH):
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
 
-    if not os.path.exists(t["json"]):
-        print("  File not found", t["json"])
-        continue
+    user_ids = get_user_ids(c)
+    total_inserted = 0
 
-    c.execute(t["schema"])
+    for t in TABLES:
+        print("Processing", t["name"])
 
-    with open(t["json"], "r", encoding="utf-8") as f:
-        rows = json.load(f)
+        json_path = os.path.join(BASE_DIR, t["json"])
+        if not os.path.exists(json_path):
+            print("  File not found", t["json"])
+            continue
 
-    inserted = 0
+        c.execute(t["schema"])
 
-    for row in rows:
-        uc = t["unique_check"]
+        with open(json_path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
 
-        if isinstance(uc, tuple):
-            where = " AND ".join(f"{k}=?" for k in uc)
-            params = [row.get(k) for k in uc]
-        else:
-            where = f"{uc}=?"
-            params = [row.get(uc)]
+        inserted = 0
 
-        c.execute(
-            f"SELECT 1 FROM {t['name']} WHERE {where}",
-            params
-        )
+        for row in rows:
+            uc = t["unique_check"]
 
-        if c.fetchone():
-            continue
+            if "user_check" in t and user_ids is not None:
+                if row.get(t["user_check"]) not in user_ids:
+                    continue
 
-        keys = row.keys()
-        values = [row.get(k) if row.get(k) is not None else "" for k in keys]
-        placeholders = ", ".join("?" for _ in keys)
-        columns = ", ".join(keys)
+            if isinstance(uc, tuple):
+                where = " AND ".join(f"{k}=?" for k in uc)
+                params = [row.get(k) for k in uc]
+            else:
+                where = f"{uc}=?"
+                params = [row.get(uc)]
 
-        c.execute(
-            f"INSERT INTO {t['name']} ({columns}) VALUES ({placeholders})",
-            values
-        )
+            c.execute(
+                f"SELECT 1 FROM {t['name']} WHERE {where}",
+                params
+            )
+
+            if c.fetchone():
+                continue
+
+            keys = row.keys()
+            values = [row.get(k) if row.get(k) is not None else "" for k in keys]
+            placeholders = ", ".join("?" for _ in keys)
+            columns = ", ".join(keys)
+
+            c.execute(
+                f"INSERT INTO {t['name']} ({columns}) VALUES ({placeholders})",
+                values
+            )
+
+            inserted += 1
+
+        if "after" in t:
+            c.execute(t["after"])
+
+        print("  Inserted", inserted, t["name"])
+        total_inserted += inserted
 
-        inserted += 1
+    conn.commit()
+    conn.close()
 
-    print("  Inserted", inserted, t["name"])
-    total_inserted += inserted
+    print("Done")
+    print("Total rows inserted", total_inserted)
+    return total_inserted
 
-conn.commit()
-conn.close()
 
-print("Done")
-print("Total rows inserted", total_inserted)
+if __name__ == "__main__":
+    populate()
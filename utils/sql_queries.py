@@ -27,8 +27,10 @@ CREATE TABLE IF NOT EXISTS Games (
     linux_req_rec TEXT default '',
     average_score REAL DEFAULT 0,
     total_reviews DEFAULT 0,
+    score_total INTEGER DEFAULT 0,
     translated_description_ro TEXT,
     translated_overview_ro TEXT,
+    resolved_links TEXT,
     is_casual INTEGER DEFAULT 0,
     is_popular INTEGER DEFAULT 0,
     playtime TEXT
@@ -56,8 +58,6 @@ CREATE TABLE IF NOT EXISTS Reviews (
     game_id TEXT,
     likes INTEGER default 0,
     dislikes INTEGER default 0,
-    liked_by TEXT default '',
-    disliked_by TEXT default '',
     date_added TEXT default ''
 );
 """
@@ -71,7 +71,8 @@ CREATE TABLE IF NOT EXISTS Franchises (
     games TEXT,
     image TEXT,
     images TEXT,
-    games_count INTEGER DEFAULT 0
+    games_count INTEGER DEFAULT 0,
+    resolved_links TEXT
 );
 """
 
@@ -89,7 +90,8 @@ CREATE TABLE IF NOT EXISTS Characters (
     franchises TEXT,
     image TEXT,
     images TEXT,
-    character_id INTEGER DEFAULT 0
+    character_id INTEGER DEFAULT 0,
+    resolved_links TEXT
 );
 """
 
@@ -259,3 +261,59 @@ WHERE title IS NULL
   AND game_images IS NULL
   AND similar_games is NULL;
 """
+
+
+recommendation_jobs_table_exists_sql = """
+SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'RecommendationJobs';
+"""
+
+enqueue_catalog_refresh_sql = """
+INSERT INTO RecommendationJobs (user_id, status, error, created_at)
+SELECT NULL, 'pending', '', datetime('now')
+WHERE NOT EXISTS (
+    SELECT 1 FROM RecommendationJobs
+    WHERE user_id IS NULL AND status = 'pending'
+);
+"""
+
+
+# Comma separated Games columns with their attribute table, join table and key.
+game_attribute_tables = (
+    ("genres", "Genres", "GameGenres", "genre_id"),
+    ("themes", "Themes", "GameThemes", "theme_id"),
+    ("platforms", "Platforms", "GamePlatforms", "platform_id"),
+    ("concepts", "Concepts", "GameConcepts", "concept_id"),
+    ("developers", "Developers", "GameDevelopers", "developer_id"),
+    ("franchises", "FranchiseNames", "GameFranchiseNames", "franchisename_id"),
+)
+
+game_attribute_tables_exist_sql = """
+SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'GameFranchiseNames';
+"""
+
+split_game_attribute_sql = """
+WITH RECURSIVE split(game_id, value, rest) AS (
+    SELECT id, '', {column} || ',' FROM Games
+    UNION ALL
+    SELECT
+        game_id,
+        TRIM(SUBSTR(rest, 1, INSTR(rest, ',') - 1)),
+        SUBSTR(rest, INSTR(rest, ',') + 1)
+    FROM split
+    WHERE rest != ''
+)
+"""
+
+insert_attribute_values_sql = split_game_attribute_sql + """INSERT OR IGNORE INTO {table} (name)
+SELECT DISTINCT value FROM split WHERE value != '';
+"""
+
+insert_attribute_links_sql = split_game_attribute_sql + """INSERT OR IGNORE INTO {join_table} (game_id, {key})
+SELECT DISTINCT split.game_id, {table}.id
+FROM split
+JOIN {table} ON {table}.name = split.value;
+"""
+
+delete_orphan_attribute_links_sql = """
+DELETE FROM {join_table} WHERE game_id NOT IN (SELECT id FROM Games);
+"""